@@ -2,7 +2,7 @@
 """Find candidate deprecation/migration-notice lines in a newsletter markdown.
 
 Usage:
-  python3 .github/skills/deprecation-consolidation/scripts/find_deprecations.py output/YYYY-MM_month_newsletter.md
+  python3 .github/skills/deprecation-consolidation/scripts/find_deprecations.py output/YYYY-MM_month_newsletter.md [--profile]
 
 Prints matching lines with line numbers to help consolidate into a single
 Enterprise & Security bullet.
@@ -14,6 +14,8 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "tools"))
+import profiling  # noqa: E402
 
 PATTERNS = [
     r"deprecat",  # deprecate, deprecated, deprecation
@@ -26,8 +28,16 @@ PATTERNS = [
     r"end[- ]of[- ]life|\beol\b|retir",  # retiring, retire
 ]
 
+COMBINED = re.compile("|".join(PATTERNS), re.IGNORECASE)
+
+
+def find_candidates(lines: list[str]) -> list[tuple[int, str]]:
+    """Return (line_number, line) for every line matching a deprecation pattern."""
+    return [(idx, line.rstrip()) for idx, line in enumerate(lines, start=1) if COMBINED.search(line)]
+
 
 def main() -> int:
+    profiling.init("find_deprecations")
     if len(sys.argv) != 2:
         print("Usage: find_deprecations.py <newsletter_file>")
         return 2
@@ -37,15 +47,12 @@ def main() -> int:
         print(f"Error: file not found: {file_path}")
         return 2
 
-    text = file_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-
-    combined = re.compile("|".join(PATTERNS), re.IGNORECASE)
+    with profiling.stage("parse"):
+        text = file_path.read_text(encoding="utf-8")
+        lines = text.splitlines()
 
-    matches = []
-    for idx, line in enumerate(lines, start=1):
-        if combined.search(line):
-            matches.append((idx, line.rstrip()))
+    with profiling.stage("extract"):
+        matches = find_candidates(lines)
 
     if not matches:
         print("No deprecation/migration candidates found.")
@@ -3,171 +3,163 @@
 Check link health for canonical URLs in kb/SOURCES.yaml.
 
 Usage:
-    python3 check_link_health.py [--dry-run] [--sample N]
+    python3 check_link_health.py [--dry-run] [--sample N] [--due] [--budget SECONDS] [--write-back] [--profile]
 
 Options:
     --dry-run      Show what would be checked without fetching
     --sample N     Only check N randomly selected sources
+    --due          Only check URLs that are due (tools/kb_schedule.py: cadence,
+                   stability and last result), most overdue first
+    --budget S     Stop starting new checks after S seconds; the rest stay due
+    --write-back   Advance last_checked in kb/SOURCES.yaml for sources whose
+                   URLs have all been confirmed healthy
+    --profile      Write a stage timing trace (see tools/profiling.py)
+
+Live results are recorded in .cache/kb_schedule/link_health.json, so short
+frequent --due runs cover the whole kb over time.
 """
 
 import sys
 import os
-import re
-import socket
-import ipaddress
-import random
 from datetime import datetime
-from urllib.parse import urlparse
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML required. Install with: pip3 install pyyaml")
-    sys.exit(1)
-
-ALLOWED_SCHEMES = {"https"}
-
-# Hostnames that resolve to loopback/private and should never be fetched
-BLOCKED_HOSTNAME_PATTERNS = re.compile(
-    r"^(localhost|.*\.local|.*\.internal)$", re.IGNORECASE
-)
+# Shared compiled SOURCES.yaml index lives in tools/ at the repo root.
+# Heavy modules (PyYAML, socket, random, http_pool) are imported only on the
+# code paths that use them, so --dry-run and usage errors start fast.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "tools"))
+import profiling  # noqa: E402
+from kb_index import KBIndexError, load_sources_index  # noqa: E402
+from kb_schedule import Budget, Schedule, write_back_last_checked  # noqa: E402
 
 
 def load_sources(path="kb/SOURCES.yaml"):
-    """Load and parse SOURCES.yaml."""
+    """Load the compiled SOURCES.yaml index (parsed once per file revision)."""
     if not os.path.exists(path):
         print(f"Error: {path} not found")
         sys.exit(1)
-    with open(path, "r") as f:
-        return yaml.safe_load(f)
+    try:
+        return load_sources_index(path)
+    except KBIndexError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
-def is_private_ip(hostname):
-    """Check if a hostname resolves to a private/loopback/link-local address."""
-    try:
-        addr = ipaddress.ip_address(hostname)
-        return addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
-    except ValueError:
-        pass  # Not a bare IP; try DNS resolution
-    try:
-        infos = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
-        for _family, _type, _proto, _canon, sockaddr in infos:
-            addr = ipaddress.ip_address(sockaddr[0])
-            if addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved:
-                return True
-    except (socket.gaierror, OSError):
-        pass  # DNS failure handled elsewhere
-    return False
-
-
-def validate_url(url):
-    """Validate URL scheme, hostname, and block private/loopback targets."""
-    parsed = urlparse(url)
-    if parsed.scheme not in ALLOWED_SCHEMES:
-        return False, f"blocked scheme '{parsed.scheme}' (allowed: {ALLOWED_SCHEMES})"
-    if not parsed.hostname:
-        return False, "missing hostname"
-    if BLOCKED_HOSTNAME_PATTERNS.match(parsed.hostname):
-        return False, f"blocked hostname '{parsed.hostname}' (localhost/internal)"
-    if is_private_ip(parsed.hostname):
-        return False, f"blocked private/loopback IP for '{parsed.hostname}'"
-    return True, ""
-
-
-def get_urls_to_check(data):
-    """Extract all URLs that should be health-checked."""
-    urls = []
-    for source in data.get("sources", []):
-        for url in source.get("canonical_urls", []):
-            urls.append({
-                "id": source.get("id"),
-                "name": source.get("name"),
-                "url": url,
-                "type": "canonical",
-            })
-        ref_url = source.get("latest_known", {}).get("reference_url", "")
-        if ref_url:
-            urls.append({
-                "id": source.get("id"),
-                "name": source.get("name"),
-                "url": ref_url,
-                "type": "reference",
-            })
-    return urls
-
-
-def check_url(url, timeout=10):
-    """Check URL health. Tries HEAD first, falls back to lightweight GET."""
-    import urllib.request
-
-    headers = {"User-Agent": "newsletter-kb-maintenance/1.0"}
-
-    # Try HEAD first (cheapest)
-    try:
-        req = urllib.request.Request(url, method="HEAD", headers=headers)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.getcode(), resp.url, None
-    except Exception:
-        pass  # Fall through to GET
+def get_urls_to_check(index):
+    """Return all URLs that should be health-checked (precomputed at index build)."""
+    return [dict(entry) for entry in index.urls_to_check]
+
+
+def check_url(pool, url):
+    """Check URL health: HEAD first, then a lightweight Range GET.
+
+    Runs under the shared pool's fetch policy (SSRF validation, jittered
+    retries, hedged requests, per-host circuit breaker). Returns (status,
+    final_url, error, skipped); skipped is True when the host's circuit
+    breaker is open. A blocked URL comes back as a "Blocked: ..." error.
+    """
+    result = pool.exists(url)
+    if result["skipped"]:
+        return None, None, result["error"], True
+    if result["status_code"]:
+        return result["status_code"], result["final_url"], None, False
+    return None, None, result["error"], False
+
+
+def option_value(flag, cast):
+    """Value following flag in sys.argv, or None when the flag is absent."""
+    if flag not in sys.argv:
+        return None
+    idx = sys.argv.index(flag)
+    if idx + 1 < len(sys.argv):
+        try:
+            return cast(sys.argv[idx + 1])
+        except ValueError:
+            pass
+    print(f"Error: {flag} requires a numeric argument")
+    sys.exit(1)
 
-    # HEAD failed (some servers reject it); try lightweight GET with Range
-    try:
-        get_headers = {**headers, "Range": "bytes=0-0"}
-        req = urllib.request.Request(url, method="GET", headers=get_headers)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.getcode(), resp.url, None
-    except Exception as e:
-        return None, None, str(e)
+
+def link_outcome(status, error):
+    """Schedule outcome for one checked URL."""
+    if error and error.startswith("Blocked: "):
+        return "blocked"
+    if error:
+        return "error"
+    return "ok" if 200 <= status < 400 else "broken"
 
 
 def main():
+    profiling.init("check_link_health")
     dry_run = "--dry-run" in sys.argv
-    sample_n = None
-    if "--sample" in sys.argv:
-        idx = sys.argv.index("--sample")
-        if idx + 1 < len(sys.argv):
-            try:
-                sample_n = int(sys.argv[idx + 1])
-            except ValueError:
-                print(f"Error: --sample requires a numeric argument")
-                sys.exit(1)
-
-    data = load_sources()
-    urls = get_urls_to_check(data)
+    due_only = "--due" in sys.argv
+    write_back = "--write-back" in sys.argv
+    sample_n = option_value("--sample", int)
+    budget = Budget(option_value("--budget", float))
+
+    with profiling.stage("config_load"):
+        index = load_sources()
+        urls = get_urls_to_check(index)
+    schedule = Schedule("link_health")
+    if due_only:
+        total_urls = len(schedule.plan(urls, due_only=False))
+        urls = schedule.plan(urls)
 
     if sample_n and sample_n < len(urls):
+        import random
+
         urls = random.sample(urls, sample_n)
 
     print("# Link Health Report")
     print(f"Generated: {datetime.now().isoformat()}")
-    print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}")
-    print(f"URLs to check: {len(urls)}")
+    print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}{' (due only)' if due_only else ''}")
+    print(f"URLs to check: {len(urls)}" + (f" of {total_urls} (rest not due)" if due_only else ""))
     print()
 
     healthy = 0
     broken = 0
     errors = 0
     blocked = 0
+    skipped = 0
+    deferred = 0
+
+    pool = None
+    if not dry_run:
+        from http_pool import HttpPool
+
+        pool = HttpPool(timeout=10, user_agent="newsletter-kb-maintenance/1.0", hedge_percentile=0.9)
 
     for entry in urls:
+        if budget.exhausted():
+            deferred += 1
+            continue
         print(f"## {entry['name']} ({entry['type']})")
         print(f"  URL: {entry['url']}")
-
-        # Validate URL scheme before fetching
-        url_ok, url_err = validate_url(entry["url"])
-        if not url_ok:
-            print(f"  Status: BLOCKED - {url_err}")
-            blocked += 1
-            print()
-            continue
+        if due_only:
+            print(f"  Due: {datetime.fromtimestamp(entry['due_at']).isoformat(timespec='minutes')} "
+                  f"(every {entry['interval_s'] / 86400:.1f}d)")
 
         if dry_run:
-            print("  Status: SKIPPED (dry run)")
+            # Live runs validate inside the pool, right before connecting.
+            from http_pool import validate_url
+
+            url_ok, url_err = validate_url(entry["url"])
+            if url_ok:
+                print("  Status: SKIPPED (dry run)")
+            else:
+                print(f"  Status: BLOCKED - {url_err}")
+                blocked += 1
             print()
             continue
 
-        status, final_url, error = check_url(entry["url"])
-        if error:
+        with profiling.stage("fetch"):
+            status, final_url, error, circuit_open = check_url(pool, entry["url"])
+        if circuit_open:
+            print(f"  Status: SKIPPED - {error}")
+            skipped += 1
+        elif link_outcome(status, error) == "blocked":
+            print(f"  Status: BLOCKED - {error.removeprefix('Blocked: ')}")
+            blocked += 1
+        elif error:
             print(f"  Status: ERROR - {error}")
             errors += 1
         else:
@@ -178,15 +170,28 @@ def main():
                 healthy += 1
             else:
                 broken += 1
+        if not circuit_open:
+            schedule.record(entry, link_outcome(status, error))
         print()
 
+    if pool is not None:
+        pool.close()
+        schedule.save()
+
     print("## Summary")
     print(f"  Healthy: {healthy}")
     print(f"  Broken: {broken}")
     print(f"  Errors: {errors}")
     print(f"  Blocked: {blocked}")
+    print(f"  Skipped (circuit open): {skipped}")
+    if deferred:
+        print(f"  Deferred (budget): {deferred}")
     print(f"  Total: {len(urls)}")
 
+    if write_back and not dry_run:
+        updated = write_back_last_checked(schedule.confirmed_dates(get_urls_to_check(index)))
+        print(f"  last_checked updated: {len(updated)} source(s)")
+
 
 if __name__ == "__main__":
     main()
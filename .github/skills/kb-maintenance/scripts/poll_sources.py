@@ -3,27 +3,37 @@
 Poll RSS/Atom feeds from kb/SOURCES.yaml and report new entries.
 
 Usage:
-    python3 poll_sources.py [--dry-run]
+    python3 poll_sources.py [--dry-run] [--no-store] [--due] [--budget SECONDS] [--write-back] [--profile]
 
 Options:
     --dry-run    Show what would be polled without actually fetching
+    --no-store   Do not ingest fetched entries into the item store (kb/items.sqlite)
+    --due        Only poll feeds that are due (tools/kb_schedule.py: cadence,
+                 stability and whether the last poll found new entries),
+                 most overdue first
+    --budget S   Stop starting new polls after S seconds; the rest stay due
+    --write-back Advance last_checked in kb/SOURCES.yaml for sources whose
+                 feeds have all been polled successfully
+    --profile    Write a stage timing trace (see tools/profiling.py)
+
+Live results are recorded in .cache/kb_schedule/poll.json. "New" entries are
+those newer than the previous successful poll of the feed, or than the
+source's last_checked when the feed has not been polled successfully yet.
 """
 
 import sys
 import os
 import re
-import socket
-import ipaddress
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML required. Install with: pip3 install pyyaml")
-    sys.exit(1)
+# Shared compiled SOURCES.yaml index lives in tools/ at the repo root.
+# Heavy modules (PyYAML, socket, XML, urllib.request) are imported only on the
+# code paths that use them, so --dry-run and usage errors start fast.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "tools"))
+import profiling  # noqa: E402
+from kb_index import KBIndexError, load_sources_index  # noqa: E402
+from kb_schedule import Budget, Schedule, item_key, write_back_last_checked  # noqa: E402
 
 ALLOWED_SCHEMES = {"https"}
 
@@ -33,16 +43,22 @@ BLOCKED_HOSTNAME_PATTERNS = re.compile(
 
 
 def load_sources(path="kb/SOURCES.yaml"):
-    """Load and parse SOURCES.yaml."""
+    """Load the compiled SOURCES.yaml index (parsed once per file revision)."""
     if not os.path.exists(path):
         print(f"Error: {path} not found")
         sys.exit(1)
-    with open(path, "r") as f:
-        return yaml.safe_load(f)
+    try:
+        return load_sources_index(path)
+    except KBIndexError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
 def is_private_ip(hostname):
     """Check if a hostname resolves to a private/loopback/link-local address."""
+    import ipaddress
+    import socket
+
     try:
         addr = ipaddress.ip_address(hostname)
         return addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
@@ -73,27 +89,17 @@ def validate_url(url):
     return True, ""
 
 
-def get_pollable_sources(data):
-    """Filter to sources that have poll-able feeds."""
-    pollable = []
-    for source in data.get("sources", []):
-        feeds = source.get("update_feeds", [])
-        for feed in feeds:
-            if feed.get("type", "none") != "none" and feed.get("url"):
-                pollable.append({
-                    "id": source.get("id"),
-                    "name": source.get("name"),
-                    "feed_type": feed["type"],
-                    "feed_url": feed["url"],
-                    "last_checked": source.get("last_checked", ""),
-                })
-    return pollable
+def get_pollable_sources(index):
+    """Return sources that have poll-able feeds (precomputed at index build)."""
+    return [dict(entry) for entry in index.pollable]
 
 
 def parse_date_flexible(date_str):
     """Try to parse a date string from RSS/Atom into a datetime. Returns None on failure."""
     if not date_str:
         return None
+    from email.utils import parsedate_to_datetime
+
     # RFC 2822 (RSS pubDate)
     try:
         return parsedate_to_datetime(date_str)
@@ -110,6 +116,8 @@ def parse_date_flexible(date_str):
 
 def parse_rss_entries(content, last_checked):
     """Parse RSS/Atom XML and return entries, filtering by last_checked when possible."""
+    import xml.etree.ElementTree as ET
+
     cutoff = None
     if last_checked:
         cutoff = parse_date_flexible(str(last_checked))
@@ -129,10 +137,12 @@ def parse_rss_entries(content, last_checked):
             title_el = item.find("title")
             link_el = item.find("link")
             date_el = item.find("pubDate")
+            guid_el = item.find("guid")
             entry = {
                 "title": title_el.text if title_el is not None else "(no title)",
                 "link": link_el.text if link_el is not None else "",
                 "date": date_el.text if date_el is not None else "",
+                "guid": guid_el.text if guid_el is not None and guid_el.text else "",
             }
             all_entries.append(entry)
             entry_dt = parse_date_flexible(entry["date"])
@@ -145,10 +155,12 @@ def parse_rss_entries(content, last_checked):
             title_el = atom_entry.find("atom:title", ns)
             link_el = atom_entry.find("atom:link", ns)
             date_el = atom_entry.find("atom:updated", ns)
+            id_el = atom_entry.find("atom:id", ns)
             entry = {
                 "title": title_el.text if title_el is not None else "(no title)",
                 "link": link_el.get("href", "") if link_el is not None else "",
                 "date": date_el.text if date_el is not None else "",
+                "guid": id_el.text if id_el is not None and id_el.text else "",
             }
             all_entries.append(entry)
             entry_dt = parse_date_flexible(entry["date"])
@@ -161,31 +173,72 @@ def parse_rss_entries(content, last_checked):
     return all_entries, filtered_entries
 
 
+def option_value(flag, cast):
+    """Value following flag in sys.argv, or None when the flag is absent."""
+    if flag not in sys.argv:
+        return None
+    idx = sys.argv.index(flag)
+    if idx + 1 < len(sys.argv):
+        try:
+            return cast(sys.argv[idx + 1])
+        except ValueError:
+            pass
+    print(f"Error: {flag} requires a numeric argument")
+    sys.exit(1)
+
+
 def main():
+    profiling.init("poll_sources")
     dry_run = "--dry-run" in sys.argv
-
-    data = load_sources()
-    sources = get_pollable_sources(data)
+    due_only = "--due" in sys.argv
+    write_back = "--write-back" in sys.argv
+    budget = Budget(option_value("--budget", float))
+    store = None
+    if not dry_run and "--no-store" not in sys.argv:
+        from item_store import ItemStore
+        store = ItemStore()
+
+    with profiling.stage("config_load"):
+        index = load_sources()
+        sources = get_pollable_sources(index)
+    schedule = Schedule("poll")
+    total_sources = len(sources)
+    if due_only:
+        sources = schedule.plan(sources)
 
     print("# Feed Poll Report")
     print(f"Generated: {datetime.now().isoformat()}")
-    print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}")
-    print(f"Pollable sources: {len(sources)}")
+    print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}{' (due only)' if due_only else ''}")
+    print(f"Pollable sources: {len(sources)}" + (f" of {total_sources} (rest not due)" if due_only else ""))
     print()
 
     total_all = 0
     total_new = 0
+    deferred = 0
 
     for src in sources:
+        if budget.exhausted():
+            deferred += 1
+            continue
+        # Last successful poll; failed polls move checked_at but must not hide entries.
+        polled_at = schedule.state.get(item_key(src), {}).get("confirmed_at")
+        if polled_at is not None:
+            src["last_checked"] = datetime.fromtimestamp(polled_at, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         print(f"## {src['name']} ({src['id']})")
         print(f"  Feed type: {src['feed_type']}")
         print(f"  Feed URL: {src['feed_url']}")
         print(f"  Last checked: {src['last_checked']}")
+        if due_only:
+            print(f"  Due: {datetime.fromtimestamp(src['due_at']).isoformat(timespec='minutes')} "
+                  f"(every {src['interval_s'] / 86400:.1f}d)")
 
         # Validate URL scheme and hostname
-        url_ok, url_err = validate_url(src["feed_url"])
+        with profiling.stage("dns"):
+            url_ok, url_err = validate_url(src["feed_url"])
         if not url_ok:
             print(f"  Status: BLOCKED - {url_err}")
+            if not dry_run:
+                schedule.record(src, "blocked")
             print()
             continue
 
@@ -198,34 +251,53 @@ def main():
                     src["feed_url"],
                     headers={"User-Agent": "newsletter-kb-maintenance/1.0"}
                 )
-                with urllib.request.urlopen(req, timeout=15) as resp:
+                with profiling.stage("fetch"), urllib.request.urlopen(req, timeout=15) as resp:
                     status = resp.getcode()
                     content_type = resp.headers.get("Content-Type", "unknown")
                     body = resp.read().decode("utf-8", errors="replace")
-                    print(f"  Status: {status}")
-                    print(f"  Content-Type: {content_type}")
+                print(f"  Status: {status}")
+                print(f"  Content-Type: {content_type}")
 
-                    # Parse feed entries for RSS/Atom types
-                    if src["feed_type"] in ("rss", "atom"):
+                # Parse feed entries for RSS/Atom types
+                if src["feed_type"] in ("rss", "atom"):
+                    with profiling.stage("parse"):
                         all_entries, new_entries = parse_rss_entries(body, src["last_checked"])
-                        print(f"  Total entries in feed: {len(all_entries)}")
-                        print(f"  New since last_checked: {len(new_entries)}")
-                        for e in new_entries[:5]:  # show first 5 new
-                            print(f"    - {e['title'][:80]}")
-                        if len(new_entries) > 5:
-                            print(f"    ... and {len(new_entries) - 5} more")
-                        total_all += len(all_entries)
-                        total_new += len(new_entries)
-                    elif src["feed_type"] == "api":
+                    print(f"  Total entries in feed: {len(all_entries)}")
+                    print(f"  New since last_checked: {len(new_entries)}")
+                    for e in new_entries[:5]:  # show first 5 new
+                        print(f"    - {e['title'][:80]}")
+                    if len(new_entries) > 5:
+                        print(f"    ... and {len(new_entries) - 5} more")
+                    if store is not None:
+                        with profiling.stage("write"):
+                            stored = store.ingest(src["id"], all_entries, parse_date_flexible)
+                        print(f"  Stored: {stored['inserted']} new, {stored['updated']} updated")
+                    total_all += len(all_entries)
+                    total_new += len(new_entries)
+                    schedule.record(src, "new" if new_entries else "unchanged")
+                else:
+                    if src["feed_type"] == "api":
                         print(f"  Response length: {len(body)} chars (JSON parsing not implemented)")
+                    schedule.record(src, "ok")
             except Exception as e:
                 print(f"  Status: ERROR - {e}")
+                schedule.record(src, "error")
         print()
 
-    print(f"Done. {len(sources)} sources {'would be' if dry_run else 'were'} polled.")
+    if store is not None:
+        store.close()
+    if not dry_run:
+        schedule.save()
+
+    print(f"Done. {len(sources) - deferred} sources {'would be' if dry_run else 'were'} polled.")
     if not dry_run:
         print(f"Total entries in feeds: {total_all}")
         print(f"New entries (since last_checked): {total_new}")
+    if deferred:
+        print(f"Deferred (budget): {deferred}")
+    if write_back and not dry_run:
+        updated = write_back_last_checked(schedule.confirmed_dates(get_pollable_sources(index)))
+        print(f"last_checked updated: {len(updated)} source(s)")
 
 
 if __name__ == "__main__":
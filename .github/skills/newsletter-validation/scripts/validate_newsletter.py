@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Validate newsletter markdown files against the quality standards.
+
+All rules (required sections, changelog URLs, playlists, labels, style and
+forbidden patterns) are compiled once at import. Each file is read and
+lower-cased once, then every rule runs over the in-memory text, skipping to the
+next line after a hit (grep -c semantics). Many files are validated in one
+process, or a process pool for large batches, instead of one grep per rule per
+file.
+
+Usage:
+  python3 .github/skills/newsletter-validation/scripts/validate_newsletter.py <newsletter_file> [...]
+      [--jobs N] [--summary]
+
+Output:
+  The PASS/FAIL/WARN report per file (identical to validate_newsletter.sh).
+  With --summary, one "PASSED|FAILED <file> (...)" line per file instead.
+  Exit 0 = every file passes, Exit 1 = any file fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+from pathlib import Path
+from typing import Iterator
+
+# [[:space:]] minus the newline (rules are line-based) and [[:punct:]], for re.
+SPACE = r" \t\r\f\v"
+PUNCT = r"!-/:-@\[-`{-~"
+
+# (rule, pattern, case_insensitive). Patterns keep the grep -E semantics of the
+# shell checks this replaces; a line counts once per rule, as with grep -c.
+LINE_RULES = [
+    ("intro", r"personally curated|archive of past", True),
+    ("copilot_heading", r"^#{1,3} .*[Cc]opilot", True),
+    ("at_scale", r"Copilot at Scale|Stay current with the latest changes:|Stay up to date on the latest releases", True),
+    ("events", r"Events|Webinars", True),
+    ("closing", r"reach out|feel free|here to help", True),
+    ("archive_link", r"CustomerNewsletter|archive.*newsletter", True),
+    ("migration_section", rf"^#{{1,3}}[{SPACE}]+Migration Notices[{SPACE}]*$", False),
+    ("emdash", "\u2014", False),
+    ("doublebracket", r"\[\[", False),
+    ("consumer", rf"Copilot Free|Copilot Individual|Copilot Pro\+|Copilot Pro($|[{SPACE}{PUNCT}])", True),
+    ("dylan", r"Dylan", True),
+    ("placeholder", r"TODO|PLACEHOLDER|\[TBD\]|\[INSERT\]", True),
+    ("deprecation_signals", r"deprecat|sunset|closing down|revok|minimum version enforcement|migration notice", True),
+    ("deprecation_bundle", r"Deprecations and Migration Notices|Deprecation Notices", True),
+    ("raw_urls", r"https?://[^ )\n]+", False),
+    ("md_links", r"\]\(https?://", False),
+    ("superlatives", r"any agent|any model|any surface|every agent|every model", True),
+    ("announcement_on_changelog", r"\[Announcement\]\(https://github.blog/changelog/", False),
+    ("role_labels", r"\[CPO |CEO |VP ", True),
+    ("ga", r"\(GA\)|\(`GA`\)", False),
+    ("preview", r"\(PREVIEW\)|\(`PREVIEW`\)", False),
+    ("lowercase_labels", r"\(ga\)|\(preview\)|\(Ga\)|\(Preview\)", False),
+    ("events_table", r"^\|.*Event.*Categories", False),
+    ("time_row", r"^\|.*[0-9]{1,2}:[0-9]{2}.*\|.*\|", False),
+    ("time_row_exempt", r"Time \(CT\)|keynote|session", True),
+]
+
+CHANGELOG_URLS = [
+    "github.blog/changelog/label/copilot",
+    "code.visualstudio.com/updates",
+    "learn.microsoft.com/en-us/visualstudio/releases",
+    "plugins.jetbrains.com/plugin/17718",
+    "CopilotForXcode",
+    "marketplace.eclipse.org/content/github-copilot",
+]
+
+PLAYLIST_IDS = [
+    "PLCiDM8_DsPQ1WJ5Ss3e0Lsw8EaijUL_6D",
+    "PLCiDM8_DsPQ3wk4atKpN-yOW1FtyxN48W",
+    "PLCiDM8_DsPQ1nWhqxi-UQF_O-gYWo5jpG",
+]
+
+# Case-insensitive rules run case-sensitively over the lower-cased text, which
+# keeps re's fast literal scanning (so their patterns must survive .lower()).
+RULES = {
+    name: (re.compile(pattern.lower() if ci else pattern, re.MULTILINE), ci)
+    for name, pattern, ci in LINE_RULES
+}
+# Fixed strings only need presence, which str containment answers fastest.
+FRAGMENTS = {
+    **{f"changelog_{i}": frag for i, frag in enumerate(CHANGELOG_URLS)},
+    **{f"playlist_{i}": pid for i, pid in enumerate(PLAYLIST_IDS)},
+}
+
+# Above this many files, a process pool beats scanning serially.
+POOL_MIN_FILES = 8
+
+
+def matching_lines(pattern: re.Pattern[str], text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of each line containing a match, like grep."""
+    pos = 0
+    while (match := pattern.search(text, pos)) is not None:
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.end())
+        if end == -1:
+            yield start, len(text)
+            return
+        yield start, end
+        pos = end + 1
+
+
+def count_lines(text: str) -> dict[str, int]:
+    """Return the number of lines each rule matches (grep -c semantics)."""
+    lowered = text.lower()
+    counts = {
+        name: sum(1 for _ in matching_lines(pattern, lowered if ci else text))
+        for name, (pattern, ci) in RULES.items()
+    }
+    counts.update({name: int(frag in text) for name, frag in FRAGMENTS.items()})
+    exempt = RULES["time_row_exempt"][0]
+    counts["time_in_virtual"] = sum(
+        1 for start, end in matching_lines(RULES["time_row"][0], text) if not exempt.search(text[start:end].lower())
+    )
+    return counts
+
+
+def validate_text(file_label: str, text: str) -> tuple[list[str], int, int]:
+    """Return (report lines, errors, warnings) for one newsletter's text."""
+    c = count_lines(text)
+    out = [f"Validating: {file_label}", ""]
+    errors = 0
+    warnings = 0
+
+    def check(ok: bool, pass_msg: str, miss_msg: str, severity: str = "FAIL") -> None:
+        nonlocal errors, warnings
+        if ok:
+            out.append(f"  PASS: {pass_msg}")
+        elif severity == "FAIL":
+            out.append(f"  FAIL: {miss_msg}")
+            errors += 1
+        else:
+            out.append(f"  WARN: {miss_msg}")
+            warnings += 1
+
+    out.append("Required Sections:")
+    check(c["intro"] > 0, "Introduction", "Introduction missing")
+    check(c["copilot_heading"] > 0, "Copilot section", "Copilot section missing")
+    # Copilot at Scale is now typically a links-only footer paragraph (no dedicated section heading).
+    check(c["at_scale"] > 0, "Copilot at Scale (footer links)",
+          "Copilot at Scale footer not detected (ensure changelog links footer exists)", "WARN")
+    check(c["events"] > 0, "Events section", "Events section missing")
+    check(c["closing"] > 0, "Closing", "Closing missing")
+    out.append("")
+
+    out.append("Required Content:")
+    total = len(CHANGELOG_URLS)
+    hits = sum(1 for i in range(total) if c[f"changelog_{i}"])
+    check(hits >= 4, f"Changelog links ({hits}/{total} known URLs found)",
+          f"Changelog links (only {hits}/{total} known URLs, need >=4)")
+    total = len(PLAYLIST_IDS)
+    hits = sum(1 for i in range(total) if c[f"playlist_{i}"])
+    check(hits >= 2, f"YouTube playlists ({hits}/{total} found)",
+          f"YouTube playlists ({hits}/{total} found, want >=2)", "WARN")
+    check(c["archive_link"] > 0, "Archive link", "Archive link missing")
+    out.append("")
+
+    out.append("Forbidden Patterns:")
+    # Migration Notices should be consolidated into Enterprise & Security, not a standalone section.
+    n = c["migration_section"]
+    check(n == 0, "No standalone Migration Notices section", f"Standalone Migration Notices section found ({n})")
+    n = c["emdash"]
+    check(n == 0, "No em dashes", f"Em dashes found ({n} occurrences)")
+    n = c["doublebracket"]
+    check(n == 0, "No double-bracket links", f"Double-bracket links found ({n})")
+    n = c["consumer"]
+    check(n == 0, "No consumer plan mentions", f"Consumer plan mentions found ({n})")
+    # Dylan's Corner (removed per D11)
+    n = c["dylan"]
+    check(n == 0, "No Dylan references", f"Dylan references found ({n})")
+    n = c["placeholder"]
+    check(n == 0, "No placeholder text", f"Placeholder text found ({n})", "WARN")
+    # Deprecations should be consolidated into a single Enterprise & Security bullet.
+    if c["deprecation_signals"] > 0 and c["deprecation_bundle"] == 0:
+        check(False, "", "Deprecation/migration signals found but no consolidated "
+              "'Deprecations and Migration Notices' bullet detected", "WARN")
+    # Lines with URLs minus lines with markdown links estimates bare URLs.
+    n = c["raw_urls"] - c["md_links"]
+    check(n <= 0, "No raw URLs outside markdown links",
+          f"Possible raw URLs ({n} lines with URLs not in markdown links)", "WARN")
+    n = c["superlatives"]
+    check(n == 0, "No superlative platform claims",
+          f"Superlative platform claims found ({n}); use 'more' or specific counts", "WARN")
+    n = c["announcement_on_changelog"]
+    check(n == 0, "No [Announcement] labels on changelog URLs",
+          f"Found {n} [Announcement] labels on changelog URLs (should be [Changelog])", "WARN")
+    n = c["role_labels"]
+    check(n == 0, "No internal role titles in link labels",
+          f"Internal role titles in link labels ({n}); use [GitHub Blog] instead", "WARN")
+    out.append("")
+
+    out.append("Format Checks:")
+    n = text.count("\n")
+    check(n >= 100, f"File length ({n} lines)", f"File too short ({n} lines, need >=100)")
+    ga, preview = c["ga"], c["preview"]
+    check(ga >= 1 or preview >= 1, f"GA/PREVIEW labels present (GA={ga}, PREVIEW={preview})",
+          "No (GA) or (PREVIEW) labels found", "WARN")
+    n = c["lowercase_labels"]
+    check(n == 0, "No lowercase ga/preview labels",
+          f"Lowercase ga/preview labels found ({n}); should be uppercase", "WARN")
+    # Virtual events table should not contain times (date-only rule)
+    if c["events_table"] > 0:
+        n = c["time_in_virtual"]
+        check(n == 0, "Virtual events use date-only format",
+              f"Virtual events table may contain times ({n} rows)", "WARN")
+    out.append("")
+
+    out.append("========================")
+    if errors == 0:
+        out.append(f"PASSED ({warnings} warnings)")
+    else:
+        out.append(f"FAILED: {errors} error(s), {warnings} warning(s)")
+    return out, errors, warnings
+
+
+def validate_file(file_label: str) -> tuple[str, int, int, int]:
+    """Return (report, exit code, errors, warnings) for one file path."""
+    path = Path(file_label)
+    if not file_label or not path.is_file():
+        report = f"Usage: validate_newsletter.sh <newsletter_file>\nError: File not found: {file_label}"
+        return report, 1, 1, 0
+    text = path.read_bytes().decode("utf-8", errors="replace")
+    lines, errors, warnings = validate_text(file_label, text)
+    return "\n".join(lines), 1 if errors else 0, errors, warnings
+
+
+def validate_many(files: list[str], jobs: int) -> list[tuple[str, int, int, int]]:
+    """Validate files in input order, fanning out to a process pool for large batches."""
+    if jobs <= 1 or len(files) < POOL_MIN_FILES:
+        return [validate_file(f) for f in files]
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_file, files, chunksize=max(1, len(files) // (workers * 4))))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate newsletter markdown files")
+    parser.add_argument("files", nargs="*", help="Newsletter markdown file(s)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for large batches (default: CPU count)")
+    parser.add_argument("--summary", action="store_true", help="Print one status line per file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    files = args.files or [""]
+    results = validate_many(files, args.jobs)
+    failed = 0
+    for i, (file_label, (report, code, errors, warnings)) in enumerate(zip(files, results)):
+        failed += code != 0
+        if args.summary:
+            status = "FAILED" if code else "PASSED"
+            print(f"{status} {file_label} ({errors} error(s), {warnings} warning(s))")
+            continue
+        if i:
+            print()
+        print(report)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
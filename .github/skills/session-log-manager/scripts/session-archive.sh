@@ -226,4 +226,7 @@ fi
 echo ""
 if $DRY_RUN; then
     echo "*Dry run — no files were copied.*"
+elif (( archived_count > 0 )); then
+    # Sidecar indexes make new archives searchable via session-manager.py search
+    python3 "$(dirname "${BASH_SOURCE[0]}")/session-manager.py" index --archive-dir "$OUTPUT_DIR"
 fi
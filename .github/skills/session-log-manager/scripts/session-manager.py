@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Session archive manager: parallel rotation, sidecar indexes, indexed search.
+
+Rotation compresses archived .jsonl sessions across all cores into seekable
+gzip files: a concatenation of independent gzip members ("frames") of about
+--frame-kb raw bytes each. The result is still an ordinary .jsonl.gz, so
+zcat/zgrep keep working. Each archive gets a sidecar <file>.idx.json with
+session id, time range, tool-call counts and the byte offset, length, line
+range and time range of every frame. Search reads only the sidecars, then
+decompresses only the frames of matching sessions.
+
+Usage:
+    python3 session-manager.py rotate [--archive-dir DIR] [--days 7] [--workers N] [--dry-run]
+    python3 session-manager.py index  [--archive-dir DIR] [--workers N] [--force]
+    python3 session-manager.py search PATTERN [--since ISO] [--until ISO] [--tool NAME] [--session ID] [--max N]
+    python3 session-manager.py stats  [--archive-dir DIR]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+FRAME_KB_DEFAULT = 1024
+INDEX_SUFFIX = ".idx.json"
+INDEX_VERSION = 1
+
+TIMESTAMP_KEYS = ("timestamp", "ts", "time", "createdAt", "creationDate", "created_at")
+TOOL_KEYS = ("toolName", "tool_name", "toolId")
+SESSION_KEYS = ("sessionId", "session_id")
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+
+def default_archive_dir():
+    try:
+        root = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        root = os.getcwd()
+    return Path(root) / "runs" / "sessions"
+
+
+def human(num_bytes):
+    for unit, size in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if num_bytes >= size:
+            return f"{num_bytes / size:.1f} {unit}"
+    return f"{num_bytes} B"
+
+
+def parse_timestamp(value):
+    """ISO-8601 string or epoch seconds/milliseconds -> ISO-8601 UTC string, else None."""
+    if isinstance(value, (int, float)) and value > 0:
+        seconds = value / 1000 if value > 1e12 else value
+        try:
+            return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except (OverflowError, OSError, ValueError):
+            return None
+    if isinstance(value, str) and len(value) >= 10 and value[4] == "-":
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return None
+
+
+def scan_record(obj, found, depth=0):
+    """Collect the first timestamp/session id and every tool name in a JSON record."""
+    if depth > 4:
+        return
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in TIMESTAMP_KEYS and "ts" not in found:
+                ts = parse_timestamp(value)
+                if ts:
+                    found["ts"] = ts
+            elif key in TOOL_KEYS and isinstance(value, str) and value:
+                found.setdefault("tools", []).append(value)
+            elif key in SESSION_KEYS and isinstance(value, str) and "session" not in found:
+                found["session"] = value
+            elif isinstance(value, (dict, list)):
+                scan_record(value, found, depth + 1)
+    elif isinstance(obj, list):
+        for item in obj[:50]:
+            scan_record(item, found, depth + 1)
+
+
+def session_id_for(path, content_id=None):
+    match = UUID_RE.search(path.name)
+    if match:
+        return match.group(0).lower()
+    return content_id or path.name.split(".")[0]
+
+
+def iter_lines(path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as fh:
+        for line in fh:
+            yield line
+
+
+def build_index(path, frame_bytes, out_path=None):
+    """Scan a session file and return its sidecar index.
+
+    When out_path is given, also write a seekable multi-member gzip there
+    (frame offsets refer to it). Otherwise frames describe the existing file:
+    a single frame spanning it.
+    """
+    tools = Counter()
+    frames = []
+    first_ts = last_ts = None
+    session = None
+    lines = raw_bytes = 0
+    frame = {"first_line": 1, "lines": 0, "first_ts": None, "last_ts": None}
+    buffer = []
+    buffered = 0
+    out = open(out_path, "wb") if out_path else None
+
+    def flush():
+        nonlocal buffer, buffered, frame
+        if not frame["lines"]:
+            return
+        if out is not None:
+            offset = out.tell()
+            member = gzip.compress(b"".join(buffer), compresslevel=6, mtime=0)
+            out.write(member)
+            frame.update(offset=offset, length=len(member))
+        frames.append(frame)
+        frame = {"first_line": frame["first_line"] + frame["lines"], "lines": 0, "first_ts": None, "last_ts": None}
+        buffer, buffered = [], 0
+
+    try:
+        for line in iter_lines(path):
+            lines += 1
+            raw_bytes += len(line)
+            found = {}
+            try:
+                scan_record(json.loads(line), found)
+            except ValueError:
+                pass
+            ts = found.get("ts")
+            if ts:
+                first_ts = first_ts or ts
+                last_ts = ts
+                frame["first_ts"] = frame["first_ts"] or ts
+                frame["last_ts"] = ts
+            tools.update(found.get("tools", []))
+            session = session or found.get("session")
+            frame["lines"] += 1
+            if out is not None:
+                buffer.append(line)
+                buffered += len(line)
+                if buffered >= frame_bytes:
+                    flush()
+        if out is not None:
+            flush()
+        elif frame["lines"]:
+            frame.update(offset=0, length=path.stat().st_size)
+            frames.append(frame)
+    finally:
+        if out is not None:
+            out.close()
+
+    return {
+        "version": INDEX_VERSION,
+        "file": (out_path or path).name,
+        "session_id": session_id_for(path, session),
+        "framed": out is not None,
+        "compressed": out is not None or path.suffix == ".gz",
+        "lines": lines,
+        "raw_bytes": raw_bytes,
+        "stored_bytes": (out_path or path).stat().st_size,
+        "first_ts": first_ts,
+        "last_ts": last_ts,
+        "tool_calls": dict(tools.most_common()),
+        "frames": frames,
+    }
+
+
+def write_index(archive_path, index):
+    sidecar = archive_path.with_name(archive_path.name + INDEX_SUFFIX)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    tmp.write_text(json.dumps(index, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, sidecar)
+    return sidecar
+
+
+def rotate_one(task):
+    """Worker: compress one .jsonl into a framed .jsonl.gz plus sidecar, then drop the original."""
+    path, frame_bytes = Path(task[0]), task[1]
+    dest = path.with_name(path.name + ".gz")
+    tmp = dest.with_name(dest.name + ".tmp")
+    stat = path.stat()
+    try:
+        index = build_index(path, frame_bytes, out_path=tmp)
+    except OSError as exc:
+        tmp.unlink(missing_ok=True)
+        return {"path": str(path), "error": str(exc)}
+    os.replace(tmp, dest)
+    os.utime(dest, (stat.st_atime, stat.st_mtime))
+    index["file"] = dest.name
+    write_index(dest, index)
+    path.unlink()
+    path.with_name(path.name + INDEX_SUFFIX).unlink(missing_ok=True)
+    return {"path": str(path), "raw": stat.st_size, "stored": dest.stat().st_size, "error": ""}
+
+
+def index_one(task):
+    path = Path(task[0])
+    try:
+        write_index(path, build_index(path, task[1]))
+    except (OSError, EOFError, zlib.error) as exc:
+        return {"path": str(path), "error": str(exc)}
+    return {"path": str(path), "error": ""}
+
+
+def load_indexes(archive_dir):
+    """Sidecar indexes whose data file still exists (stale sidecars of rotated files are skipped)."""
+    indexes = []
+    for sidecar in sorted(archive_dir.rglob("*" + INDEX_SUFFIX)):
+        data_path = sidecar.with_name(sidecar.name[: -len(INDEX_SUFFIX)])
+        if not data_path.exists():
+            continue
+        try:
+            index = json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        index["_path"] = data_path
+        indexes.append(index)
+    return indexes
+
+
+def overlaps(first, last, since, until):
+    if since and last and last < since:
+        return False
+    if until and first and first > until:
+        return False
+    return True
+
+
+def read_frame(path, frame, compressed):
+    with open(path, "rb") as fh:
+        fh.seek(frame["offset"])
+        data = fh.read(frame["length"])
+    return gzip.decompress(data) if compressed else data
+
+
+def cmd_rotate(args):
+    archive_dir = args.archive_dir
+    print("# Session Rotation")
+    print()
+    print(f"Archive: {archive_dir}")
+    print(f"Threshold: {args.days} days")
+    print()
+    if not archive_dir.is_dir():
+        print(f"No archive directory found at: {archive_dir}")
+        print("Run session-archive.sh first to create the archive.")
+        return 0
+
+    cutoff = time.time() - args.days * 86400
+    candidates, recent = [], 0
+    for path in sorted(archive_dir.rglob("*.jsonl")):
+        if path.stat().st_mtime <= cutoff:
+            candidates.append(path)
+        else:
+            recent += 1
+    already = sum(1 for _ in archive_dir.rglob("*.jsonl.gz"))
+
+    if args.dry_run:
+        for path in candidates:
+            age = int((time.time() - path.stat().st_mtime) // 86400)
+            print(f"  [DRY RUN] Would compress: {path} ({age}d old, {path.stat().st_size // 1024} KB)")
+        results = []
+    else:
+        frame_bytes = args.frame_kb * 1024
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(rotate_one, [(str(p), frame_bytes) for p in candidates]))
+        for result in results:
+            if result["error"]:
+                print(f"  ERROR: {result['path']}: {result['error']}")
+
+    done = [r for r in results if not r["error"]]
+    saved = sum(r["raw"] - r["stored"] for r in done)
+    print()
+    print("## Rotation Report")
+    print()
+    print("| Metric | Value |")
+    print("|---|---|")
+    print(f"| Files compressed | {len(candidates) if args.dry_run else len(done)} |")
+    print(f"| Files skipped (recent) | {recent} |")
+    print(f"| Files already compressed | {already} |")
+    if saved > 0:
+        print(f"| Space saved | {saved / 1048576:.1f} MB |")
+    print()
+    if args.dry_run:
+        print("*Dry run - no files were modified.*")
+    return 1 if len(done) < len(results) else 0
+
+
+def cmd_index(args):
+    if not args.archive_dir.is_dir():
+        print(f"No archive directory found at: {args.archive_dir}")
+        return 0
+    todo = []
+    for path in sorted(args.archive_dir.rglob("*.jsonl.gz")) + sorted(args.archive_dir.rglob("*.jsonl")):
+        sidecar = path.with_name(path.name + INDEX_SUFFIX)
+        if args.force or not sidecar.exists() or sidecar.stat().st_mtime < path.stat().st_mtime:
+            todo.append((str(path), args.frame_kb * 1024))
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(index_one, todo))
+    failed = [r for r in results if r["error"]]
+    for result in failed:
+        print(f"  ERROR: {result['path']}: {result['error']}")
+    print(f"Indexed {len(results) - len(failed)} file(s), {len(failed)} failed")
+    return 1 if failed else 0
+
+
+def cmd_search(args):
+    pattern = re.compile(args.pattern.encode("utf-8"), re.IGNORECASE if args.ignore_case else 0)
+    since = parse_timestamp(args.since) if args.since else None
+    until = parse_timestamp(args.until) if args.until else None
+    if (args.since and not since) or (args.until and not until):
+        print("ERROR: --since/--until must be ISO-8601 (e.g. 2026-02-01 or 2026-02-01T12:00:00Z)", file=sys.stderr)
+        return 1
+    if until and len(args.until) == 10:
+        until = args.until + "T23:59:59Z"
+
+    hits = sessions = frames_read = 0
+    for index in load_indexes(args.archive_dir):
+        if args.session and not index["session_id"].startswith(args.session.lower()):
+            continue
+        if args.tool and args.tool not in index["tool_calls"]:
+            continue
+        if not overlaps(index["first_ts"], index["last_ts"], since, until):
+            continue
+        sessions += 1
+        # Unframed archives (session-archive.sh output) are one frame spanning the file.
+        frames = [f for f in index["frames"] if overlaps(f["first_ts"], f["last_ts"], since, until)]
+        for frame in frames:
+            try:
+                data = read_frame(index["_path"], frame, index["compressed"])
+            except FileNotFoundError:
+                break  # rotated away since the sidecars were loaded
+            frames_read += 1
+            for offset, line in enumerate(data.splitlines()):
+                if not pattern.search(line):
+                    continue
+                hits += 1
+                text = line.decode("utf-8", errors="replace")
+                match = pattern.search(line)
+                start = max(0, match.start() - 80)
+                print(f"{index['_path']}:{frame['first_line'] + offset}: {text[start:start + 200]}")
+                if hits >= args.max:
+                    print(f"-- stopped at --max {args.max}")
+                    return 0
+    print(f"-- {hits} match(es) in {sessions} session(s), {frames_read} frame(s) decompressed", file=sys.stderr)
+    return 0 if hits else 1
+
+
+def cmd_stats(args):
+    indexes = load_indexes(args.archive_dir)
+    raw = sum(i["raw_bytes"] for i in indexes)
+    stored = sum(i["stored_bytes"] for i in indexes)
+    tools = Counter()
+    for index in indexes:
+        tools.update(index["tool_calls"])
+    spans = [i["first_ts"] for i in indexes if i["first_ts"]] + [i["last_ts"] for i in indexes if i["last_ts"]]
+    unindexed = sum(
+        1 for p in list(args.archive_dir.rglob("*.jsonl.gz")) + list(args.archive_dir.rglob("*.jsonl"))
+        if not p.with_name(p.name + INDEX_SUFFIX).exists()
+    ) if args.archive_dir.is_dir() else 0
+    print("# Session Archive Stats")
+    print()
+    print("| Metric | Value |")
+    print("|---|---|")
+    print(f"| Indexed sessions | {len(indexes)} |")
+    print(f"| Unindexed files | {unindexed} |")
+    print(f"| Raw size | {human(raw)} |")
+    print(f"| Stored size | {human(stored)} |")
+    if spans:
+        print(f"| Time range | {min(spans)} .. {max(spans)} |")
+    if tools:
+        print()
+        print("Top tools: " + ", ".join(f"{name} ({count})" for name, count in tools.most_common(10)))
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Session archive manager (rotate, index, search)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--archive-dir", type=Path, default=None, help="Archive directory (default: runs/sessions/)")
+    common.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    common.add_argument("--frame-kb", type=int, default=FRAME_KB_DEFAULT, help="Raw bytes per seekable gzip frame")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rotate = sub.add_parser("rotate", parents=[common], help="Compress sessions older than N days (parallel)")
+    rotate.add_argument("--days", type=int, default=7)
+    rotate.add_argument("--dry-run", action="store_true")
+
+    index = sub.add_parser("index", parents=[common], help="Build missing/stale sidecar indexes")
+    index.add_argument("--force", action="store_true", help="Rebuild every sidecar")
+
+    search = sub.add_parser("search", parents=[common], help="Regex search via sidecar indexes")
+    search.add_argument("pattern")
+    search.add_argument("--since", help="Only sessions/frames active at or after this time")
+    search.add_argument("--until", help="Only sessions/frames active at or before this time")
+    search.add_argument("--tool", help="Only sessions that called this tool")
+    search.add_argument("--session", help="Session id (prefix)")
+    search.add_argument("--max", type=int, default=200, help="Stop after N matches")
+    search.add_argument("-i", "--ignore-case", action="store_true")
+
+    sub.add_parser("stats", parents=[common], help="Summarize indexed sessions")
+    args = parser.parse_args(argv)
+    if args.archive_dir is None:
+        args.archive_dir = default_archive_dir()
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    handlers = {"rotate": cmd_rotate, "index": cmd_index, "search": cmd_search, "stats": cmd_stats}
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
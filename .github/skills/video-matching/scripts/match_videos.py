@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Deterministic pre-matcher for Phase 4.6 video matching.
+
+Caches the VS Code and GitHub YouTube feeds, builds a TF-IDF inverted index
+over video titles and descriptions, scores every bullet in an assembled
+newsletter against it, and prints the top-k candidates per bullet with a
+confidence label. The agent then confirms a short list instead of comparing
+every bullet with every video.
+
+Usage:
+  python3 .github/skills/video-matching/scripts/match_videos.py output/YYYY-MM_month_newsletter.md
+      [--top-k 3] [--start YYYY-MM-DD --end YYYY-MM-DD] [--offline] [--json]
+      [--feed-file PATH ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "tools"))
+import paths  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[4]
+CACHE_DIR = paths.CACHE_DIR / "video_feeds"
+FEED_TTL_SECONDS = 6 * 3600
+
+CHANNELS = {
+    "vscode": "https://www.youtube.com/feeds/videos.xml?channel_id=UCs5Y5_7XK8HLDX0SLNwkd3w",
+    "github": "https://www.youtube.com/feeds/videos.xml?channel_id=UC7c3Kb6jYCRj4JOHHZTxKsQ",
+}
+
+NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "media": "http://search.yahoo.com/mrss/",
+}
+
+# From references/video-sources.md "Exclusion Patterns".
+EXCLUDE_TITLE_PATTERNS = re.compile(
+    r"how to request a vs code feature|learn visual studio code in 15 minutes|agents league battle",
+    re.IGNORECASE,
+)
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "how", "in", "into",
+    "is", "it", "its", "new", "now", "of", "on", "or", "that", "the", "this", "to", "with",
+    "you", "your", "we", "our", "all", "more", "now", "ga", "preview", "github", "copilot",
+    "vs", "code", "video", "https", "http", "www", "com",
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+URL_RE = re.compile(r"https?://[^\s)>\]\"'<]+")
+BULLET_RE = re.compile(r"^\s*[-*]\s+\*\*(.+?)\*\*(.*)$")
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*$")
+CHAPTER_RE = re.compile(r"(?m)^\s*(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\b")
+STATUS_RE = re.compile(r"\(`[A-Z ]+`\)")
+
+TITLE_WEIGHT = 3
+MEDIUM_THRESHOLD = 0.35
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def normalize_link(url: str) -> str:
+    return url.strip().split("#", 1)[0].split("?", 1)[0].rstrip("/").lower()
+
+
+def fetch_feed(channel: str, url: str, offline: bool) -> bytes | None:
+    """Return feed XML, refreshing the local cache when older than FEED_TTL_SECONDS."""
+    cache_path = CACHE_DIR / f"{channel}.xml"
+    fresh = cache_path.exists() and time.time() - cache_path.stat().st_mtime < FEED_TTL_SECONDS
+    if offline or fresh:
+        return cache_path.read_bytes() if cache_path.exists() else None
+
+    import urllib.request
+
+    req = urllib.request.Request(url, headers={"User-Agent": "newsletter-video-matching/1.0"})
+    try:
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            body = resp.read()
+    except Exception as e:  # noqa: BLE001
+        print(f"Warning: {channel} feed fetch failed ({e}); using cache if present", file=sys.stderr)
+        return cache_path.read_bytes() if cache_path.exists() else None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(body)
+    return body
+
+
+def estimate_duration(url: str, title: str, description: str) -> str:
+    """Duration heuristics from references/video-sources.md."""
+    if "/shorts/" in url:
+        return "1m"
+    if "vs code live" in title.lower():
+        return "60m"
+    if "open source friday" in title.lower():
+        return "45m"
+    if "podcast" in title.lower() or "podcast" in description.lower():
+        return "25m"
+    chapters = CHAPTER_RE.findall(description)
+    if chapters:
+        hours, minutes, seconds = chapters[-1]
+        total = int(hours or 0) * 60 + int(minutes) + (1 if int(seconds) else 0)
+        return f"{max(total, 1)}m"
+    return "5m"
+
+
+def parse_feed(xml_bytes: bytes, channel: str) -> list[dict[str, Any]]:
+    videos = []
+    try:
+        root = ET.fromstring(xml_bytes)
+    except ET.ParseError as e:
+        print(f"Warning: {channel} feed is not valid XML ({e})", file=sys.stderr)
+        return videos
+    for entry in root.findall("atom:entry", NS):
+        title = entry.findtext("atom:title", default="", namespaces=NS)
+        link_el = entry.find("atom:link", NS)
+        url = link_el.get("href", "") if link_el is not None else ""
+        published = entry.findtext("atom:published", default="", namespaces=NS)
+        description = entry.findtext("media:group/media:description", default="", namespaces=NS)
+        if not url or EXCLUDE_TITLE_PATTERNS.search(title):
+            continue
+        videos.append({
+            "channel": channel,
+            "title": title,
+            "url": url,
+            "published": published[:10],
+            "description": description,
+            "duration": estimate_duration(url, title, description),
+            "links": {normalize_link(u) for u in URL_RE.findall(description)},
+        })
+    return videos
+
+
+class VideoIndex:
+    """TF-IDF inverted index over video titles (weighted) and descriptions."""
+
+    def __init__(self, videos: list[dict[str, Any]]) -> None:
+        self.videos = videos
+        self.postings: dict[str, list[tuple[int, float]]] = {}
+        self.by_link: dict[str, list[int]] = {}
+
+        term_counts = []
+        doc_freq: Counter[str] = Counter()
+        for video in videos:
+            counts = Counter(tokenize(video["description"]))
+            for token in tokenize(video["title"]):
+                counts[token] += TITLE_WEIGHT
+            term_counts.append(counts)
+            doc_freq.update(counts.keys())
+
+        n_docs = max(len(videos), 1)
+        self.idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in doc_freq.items()}
+        for doc_id, counts in enumerate(term_counts):
+            weights = {t: (1 + math.log(c)) * self.idf[t] for t, c in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self.postings.setdefault(term, []).append((doc_id, weight / norm))
+            for link in videos[doc_id]["links"]:
+                self.by_link.setdefault(link, []).append(doc_id)
+
+    def query(self, text: str, links: set[str], top_k: int) -> list[tuple[int, float, bool]]:
+        counts = Counter(tokenize(text))
+        weights = {t: (1 + math.log(c)) * self.idf[t] for t, c in counts.items() if t in self.idf}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+        scores: dict[int, float] = {}
+        for term, weight in weights.items():
+            for doc_id, doc_weight in self.postings[term]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + (weight / norm) * doc_weight
+
+        link_hits = {doc_id for link in links for doc_id in self.by_link.get(link, [])}
+        for doc_id in link_hits:
+            scores.setdefault(doc_id, 0.0)
+
+        ranked = sorted(scores.items(), key=lambda kv: (kv[0] not in link_hits, -kv[1]))
+        return [(doc_id, score, doc_id in link_hits) for doc_id, score in ranked[:top_k]]
+
+
+def parse_bullets(text: str) -> list[dict[str, Any]]:
+    """Extract top-level bold-titled bullets with their section and links."""
+    bullets = []
+    section = ""
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        heading = HEADING_RE.match(line)
+        if heading:
+            section = heading.group(1)
+            continue
+        match = BULLET_RE.match(line)
+        if not match:
+            continue
+        title = STATUS_RE.sub("", match.group(1)).strip()
+        bullets.append({
+            "line": line_no,
+            "section": section,
+            "title": title,
+            "text": f"{title} {title} {match.group(2)}",
+            "links": {normalize_link(u) for u in URL_RE.findall(line)},
+            "has_video": "[Video (" in line,
+        })
+    return bullets
+
+
+def confidence(bullet_title: str, video_title: str, score: float, link_hit: bool) -> str:
+    if link_hit or (bullet_title and bullet_title.lower() in video_title.lower()):
+        return "HIGH"
+    if score >= MEDIUM_THRESHOLD:
+        return "MEDIUM"
+    return "LOW"
+
+
+def within_window(published: str, start: date | None, end: date | None) -> bool:
+    if not published or (start is None and end is None):
+        return True
+    try:
+        day = datetime.strptime(published, "%Y-%m-%d").date()
+    except ValueError:
+        return True
+    slack = timedelta(days=14)
+    if start and day < start - slack:
+        return False
+    if end and day > end + slack:
+        return False
+    return True
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-match newsletter bullets to YouTube videos")
+    parser.add_argument("newsletter", type=Path)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--start", help="DATE_RANGE start (YYYY-MM-DD), 14-day slack applied")
+    parser.add_argument("--end", help="DATE_RANGE end (YYYY-MM-DD), 14-day slack applied")
+    parser.add_argument("--offline", action="store_true", help="Use cached feeds only")
+    parser.add_argument("--feed-file", action="append", type=Path, default=[],
+                        help="Read a local Atom feed instead of fetching (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.newsletter.is_file():
+        print(f"Error: file not found: {args.newsletter}")
+        return 2
+    try:
+        start = datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else None
+        end = datetime.strptime(args.end, "%Y-%m-%d").date() if args.end else None
+    except ValueError:
+        print("Error: --start/--end must be YYYY-MM-DD")
+        return 2
+
+    videos: list[dict[str, Any]] = []
+    if args.feed_file:
+        for path in args.feed_file:
+            videos.extend(parse_feed(path.read_bytes(), path.stem))
+    else:
+        for channel, url in CHANNELS.items():
+            body = fetch_feed(channel, url, args.offline)
+            if body:
+                videos.extend(parse_feed(body, channel))
+    videos = [v for v in videos if within_window(v["published"], start, end)]
+
+    bullets = parse_bullets(args.newsletter.read_text(encoding="utf-8"))
+    index = VideoIndex(videos)
+
+    results = []
+    for bullet in bullets:
+        candidates = []
+        for doc_id, score, link_hit in index.query(bullet["text"], bullet["links"], args.top_k):
+            video = videos[doc_id]
+            candidates.append({
+                "title": video["title"],
+                "url": video["url"],
+                "channel": video["channel"],
+                "published": video["published"],
+                "duration": video["duration"],
+                "score": round(score, 4),
+                "link_match": link_hit,
+                "confidence": confidence(bullet["title"], video["title"], score, link_hit),
+            })
+        if candidates:
+            results.append({
+                "line": bullet["line"],
+                "section": bullet["section"],
+                "bullet": bullet["title"],
+                "has_video": bullet["has_video"],
+                "candidates": candidates,
+            })
+
+    if args.json:
+        print(json.dumps({"videos": len(videos), "bullets": len(bullets), "matches": results}, indent=2))
+        return 0
+
+    print(f"# Video Candidates: {args.newsletter}")
+    print(f"Videos indexed: {len(videos)} | Bullets: {len(bullets)} | Bullets with candidates: {len(results)}")
+    print()
+    for item in results:
+        suffix = " (already has video)" if item["has_video"] else ""
+        print(f"## L{item['line']}: {item['bullet']}{suffix}")
+        for c in item["candidates"]:
+            print(f"  - {c['confidence']:<6} {c['score']:.3f}  [Video ({c['duration']})]({c['url']})  {c['title']}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
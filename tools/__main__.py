@@ -0,0 +1,145 @@
+"""Single entry point for the pipeline tools: python3 -m tools <command> [args].
+
+Dispatches to a tool's main() in-process, so one interpreter start (and one
+import of shared modules such as kb_index) serves any number of commands.
+Shell pipelines that call several tools back to back can pass them as a
+batch, one command line per line:
+
+  python3 -m tools list
+  python3 -m tools kb-index build
+  printf 'kb-index build\\nurl-index update\\n' | python3 -m tools --batch -
+  python3 -m tools --batch commands.txt --keep-going
+
+Batch mode stops at the first failing command (exit code of that command)
+unless --keep-going is given, in which case every command runs and the exit
+code is the number of failed commands (capped at 125).
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import shlex
+import sys
+from pathlib import Path
+from types import ModuleType
+
+TOOLS_DIR = Path(__file__).resolve().parent
+ROOT = TOOLS_DIR.parent
+SKILLS = ".github/skills"
+
+COMMANDS: dict[str, tuple[str, str]] = {
+    "archive": ("tools/workspace_store.py", "Content-addressed workspace archive"),
+    "bench": ("tools/bench_tools.py", "Tooling performance benchmarks"),
+    "benchmark-contracts": ("tools/benchmark_contracts.py", "Compiled benchmark-mode contracts (check / matrix)"),
+    "briefing-inputs": ("tools/prefilter_briefings.py", "Phase 5b per-briefing item short lists"),
+    "check-links": ("tools/check_newsletter_links.py", "Verify outbound links in newsletters"),
+    "discussion-edits": ("tools/extract_discussion_edits.py", "Extract discussion edit history"),
+    "edit-analytics": ("tools/edit_analytics.py", "Polishing corpus edit analytics"),
+    "edit-corpus": ("tools/edit_corpus.py", "Polishing corpus reader / converter"),
+    "event-sources": ("tools/extract_event_sources.py", "Phase 2 event-source candidates"),
+    "find-deprecations": (f"{SKILLS}/deprecation-consolidation/scripts/find_deprecations.py", "Deprecation candidate lines"),
+    "items": ("tools/item_store.py", "Feed item store"),
+    "kb-index": ("tools/kb_index.py", "Compiled kb/ YAML indexes"),
+    "kb-schedule": ("tools/kb_schedule.py", "Due kb link-health checks / feed polls"),
+    "link-health": (f"{SKILLS}/kb-maintenance/scripts/check_link_health.py", "kb link health check"),
+    "match-videos": (f"{SKILLS}/video-matching/scripts/match_videos.py", "Match videos to newsletter items"),
+    "poll": (f"{SKILLS}/kb-maintenance/scripts/poll_sources.py", "Poll kb RSS/Atom feeds"),
+    "retrieve": ("tools/retrieve_content.py", "Phase 1B source text retrieval"),
+    "run-phase": ("tools/run_copilot_phase.py", "Run one Copilot CLI phase"),
+    "search": ("tools/search_index.py", "Full-text search and context packs"),
+    "session": (f"{SKILLS}/session-log-manager/scripts/session-manager.py", "Session archive rotate/index/search"),
+    "skill-score": ("tools/skill_scorer.py", "Single-pass skill heuristic score / intelligence sync"),
+    "trace-report": ("tools/trace_report.py", "Cycle profiling trace report"),
+    "url-index": ("tools/url_index.py", "Historical URL index"),
+    "url-manifest": ("tools/generate_url_manifest.py", "Phase 1A URL manifest"),
+    "validate-newsletter": (f"{SKILLS}/newsletter-validation/scripts/validate_newsletter.py", "Validate newsletter markdown (batch)"),
+    "validate-skill": ("tools/validate_skill.py", "Validate a skill directory"),
+    "watch": ("tools/watch_pipeline.py", "Re-validate phase artifacts as they change"),
+}
+
+
+def load_tool(command: str) -> tuple[Path, ModuleType]:
+    """Import a command's script once; later calls reuse the cached module."""
+    path = ROOT / COMMANDS[command][0]
+    name = path.stem.replace("-", "_")
+    module = sys.modules.get(name)
+    if module is not None and Path(getattr(module, "__file__", "")).resolve() == path:
+        return path, module
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    if path.stem.isidentifier():
+        return path, importlib.import_module(name)
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return path, module
+
+
+def run(command: str, args: list[str]) -> int:
+    """Run one tool's main() as if invoked as `python3 <script> args`."""
+    if command not in COMMANDS:
+        print(f"Unknown command: {command} (see: python3 -m tools list)", file=sys.stderr)
+        return 2
+    path, module = load_tool(command)
+    saved_argv = sys.argv
+    sys.argv = [str(path), *args]
+    try:
+        code = module.main()
+    except SystemExit as exc:
+        code = exc.code
+    finally:
+        sys.argv = saved_argv
+        profiling = sys.modules.get("profiling")
+        if profiling is not None and profiling.enabled():
+            profiling.write_trace()  # one trace per command; resets state for the next tool
+    sys.stdout.flush()
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_batch(source: str, keep_going: bool) -> int:
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    failed = 0
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        command, *args = shlex.split(line)
+        code = run(command, args)
+        if code == 0:
+            continue
+        print(f"[batch] FAIL (exit {code}): {line.strip()}", file=sys.stderr)
+        if not keep_going:
+            return code
+        failed += 1
+    return min(failed, 125)
+
+
+def print_commands() -> None:
+    print("Usage: python3 -m tools <command> [args] | --batch FILE|- [--keep-going]")
+    print()
+    for name, (path, summary) in sorted(COMMANDS.items()):
+        print(f"  {name:<20} {summary} ({path})")
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in {"-h", "--help", "list"}:
+        print_commands()
+        return 0 if argv else 2
+    if argv[0] == "--batch":
+        if len(argv) < 2:
+            print("Error: --batch requires a file (or - for stdin)", file=sys.stderr)
+            return 2
+        return run_batch(argv[1], keep_going="--keep-going" in argv[2:])
+    return run(argv[0], argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,13 @@
 # ══════════════════════════════════════════════════════════════
 # Archive Workspace Intermediates
 # ══════════════════════════════════════════════════════════════
-# Moves workspace intermediate files to workspace/archived/ with cycle prefix.
+# Archives this cycle's workspace intermediates into the content-addressed
+# store (tools/workspace_store.py) and removes them from workspace/: one gzip
+# object per unique content under workspace/archived/objects/, plus a run entry
+# in workspace/archived/manifests/<CYCLE_PREFIX>.json (the same YYYY-MM key
+# prepare_newsletter_cycle.sh --no-reuse uses). Re-archiving identical content
+# adds no objects. Restore with:
+#   python3 tools/workspace_store.py restore --cycle CYCLE_PREFIX [--run RUN]
 #
 # Usage: bash tools/archive_workspace.sh [CYCLE_PREFIX]
 #   CYCLE_PREFIX: e.g., "2026-02" (auto-detected from workspace files if omitted)
@@ -17,8 +23,9 @@ if [ -z "$PREFIX" ]; then
   # Look for the most recent newsletter_phase* file and extract the date
   latest=$(ls -t workspace/newsletter_phase* 2>/dev/null | head -1 || true)
   if [ -n "$latest" ]; then
-    # Extract YYYY-MM from filename patterns like newsletter_phase1a_..._2026-02-10.md
-    PREFIX=$(echo "$latest" | grep -Eo '[0-9]{4}-[0-9]{2}' | head -1)
+    # Extract YYYY-MM of the cycle END date (the last date in names like
+    # newsletter_phase1a_..._2026-01-15_to_2026-02-10.md), as prepare_newsletter_cycle.sh keys it
+    PREFIX=$(echo "$latest" | grep -Eo '[0-9]{4}-[0-9]{2}' | tail -1)
     # Trim to YYYY-MM
     PREFIX="${PREFIX:0:7}"
   fi
@@ -35,10 +42,7 @@ mkdir -p "$ARCHIVE_DIR"
 echo "Archiving workspace files for cycle: $PREFIX"
 echo ""
 
-MOVED=0
-SKIPPED=0
-
-# Archive pipeline intermediate files (newsletter_phase*)
+PHASE_FILES=()
 for f in workspace/newsletter_phase*.md; do
   [ ! -f "$f" ] && continue
   base=$(basename "$f")
@@ -46,35 +50,28 @@ for f in workspace/newsletter_phase*.md; do
     echo "  KEEP (different cycle): $base"
     continue
   fi
-  dest="$ARCHIVE_DIR/${PREFIX}_${base}"
-  if [ -f "$dest" ]; then
-    echo "  SKIP (exists): $base -> $dest"
-    SKIPPED=$((SKIPPED + 1))
-  else
-    mv "$f" "$dest"
-    echo "  MOVED: $base -> $dest"
-    MOVED=$((MOVED + 1))
-  fi
+  PHASE_FILES+=("$f")
 done
 
-# Archive editorial artifacts (editorial_corrections, editorial_review, v2_handoff)
+EDITORIAL_FILES=()
 for f in workspace/${PREFIX}*.md; do
   [ ! -f "$f" ] && continue
-  base=$(basename "$f")
-  dest="$ARCHIVE_DIR/${base}"
-  if [ -f "$dest" ]; then
-    echo "  SKIP (exists): $base -> $dest"
-    SKIPPED=$((SKIPPED + 1))
-  else
-    mv "$f" "$dest"
-    echo "  MOVED: $base -> $dest"
-    MOVED=$((MOVED + 1))
-  fi
+  EDITORIAL_FILES+=("$f")
 done
 
+FILES=(${PHASE_FILES[@]+"${PHASE_FILES[@]}"} ${EDITORIAL_FILES[@]+"${EDITORIAL_FILES[@]}"})
+RUN="archive_$(date -u +%Y%m%dT%H%M%SZ)"
+
+if [ "${#FILES[@]}" -gt 0 ]; then
+  for f in "${FILES[@]}"; do
+    echo "  ARCHIVED: $(basename "$f")"
+  done
+  python3 tools/workspace_store.py put --cycle "$PREFIX" --run "$RUN" --remove "${FILES[@]}" | sed 's/^/  /'
+fi
+
 echo ""
-echo "Archive complete: $MOVED moved, $SKIPPED skipped"
-echo "Destination: $ARCHIVE_DIR/"
+echo "Archive complete: ${#FILES[@]} archived (run $RUN)"
+echo "Manifest: $ARCHIVE_DIR/manifests/${PREFIX}.json"
 
 # Verify
 remaining=$(ls workspace/*.md 2>/dev/null | wc -l | tr -d ' ')
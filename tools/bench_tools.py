@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""Performance benchmarks for the deterministic pipeline tooling.
+
+Times the hot paths of the Python tools (and the newsletter validator) on
+synthetic and fixture-based inputs at several sizes, records peak Python
+heap via tracemalloc, and compares medians against committed baselines.
+The startup.* cases time interpreter start plus module import per tool, and
+ten per-process calls against one `python3 -m tools --batch` run.
+
+Usage:
+  python3 tools/bench_tools.py [--quick] [--filter SUBSTR] [--repeat N]
+  python3 tools/bench_tools.py --update-baseline
+  python3 tools/bench_tools.py --threshold 1.5 --json
+
+Exit codes: 0 ok, 1 regression beyond threshold, 2 usage error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import importlib.util
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = ROOT / "tests" / "fixtures" / "perf" / "baselines.json"
+
+# Medians below this are dominated by timer noise; never flag them.
+NOISE_FLOOR_S = 0.005
+DEFAULT_THRESHOLD = 1.5
+
+SIZES = {"small": 1, "medium": 10, "large": 50}
+
+
+def load_module(name: str, rel_path: str) -> ModuleType:
+    """Import a tool script by path (skill scripts are not on sys.path)."""
+    spec = importlib.util.spec_from_file_location(name, ROOT / rel_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ── Synthetic inputs ──
+
+def make_html(scale: int) -> str:
+    rng = random.Random(scale)
+    filler = "<div class='card'><p>" + "lorem ipsum dolor sit amet " * 20 + "</p></div>\n"
+    parts = []
+    for i in range(200 * scale):
+        parts.append(filler)
+        if i % 3 == 0:
+            parts.append(f"<a href='/resources/events/event-{rng.randint(1, 5000)}'>Event</a>\n")
+        if i % 4 == 0:
+            parts.append(
+                f"<a href='https://developer.microsoft.com/en-us/reactor/events/{rng.randint(20000, 29999)}/'>R</a>\n"
+            )
+    return "".join(parts)
+
+
+def make_rss(entries: int) -> str:
+    items = []
+    base = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    for i in range(entries):
+        when = (base - dt.timedelta(hours=i)).strftime("%a, %d %b %Y %H:%M:%S +0000")
+        items.append(
+            f"<item><title>Changelog entry {i}</title>"
+            f"<link>https://github.blog/changelog/entry-{i}</link><pubDate>{when}</pubDate></item>"
+        )
+    return "<?xml version='1.0'?><rss version='2.0'><channel>" + "".join(items) + "</channel></rss>"
+
+
+def make_atom(entries: int) -> str:
+    items = []
+    base = dt.datetime(2026, 1, 1)
+    for i in range(entries):
+        when = (base - dt.timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        items.append(
+            f"<entry><title>Release {i}</title><link href='https://example.com/r/{i}'/>"
+            f"<updated>{when}</updated></entry>"
+        )
+    return "<?xml version='1.0'?><feed xmlns='http://www.w3.org/2005/Atom'>" + "".join(items) + "</feed>"
+
+
+def make_revisions(lines: int, revisions: int) -> list[str]:
+    rng = random.Random(lines)
+    body = [f"- Bullet {i}: " + "copilot agent update " * 6 for i in range(lines)]
+    history = ["\n".join(body)]
+    for _ in range(revisions - 1):
+        for _ in range(max(1, lines // 50)):
+            pos = rng.randrange(len(body))
+            body[pos] = body[pos] + " (edited)"
+        body.insert(rng.randrange(len(body)), "- Inserted line " + "x" * 40)
+        history.append("\n".join(body))
+    return history
+
+
+def corpus_texts() -> list[str]:
+    texts = []
+    for pattern in ("archive/*/*.md", "output/*.md"):
+        texts.extend(p.read_text(encoding="utf-8") for p in sorted(ROOT.glob(pattern)))
+    return texts
+
+
+def make_corpus_dir(copies: int) -> Path:
+    """Write a many-newsletter corpus shaped like archive/ + output/."""
+    texts = corpus_texts()
+    tmp = Path(tempfile.mkdtemp(prefix="bench_corpus_"))
+    (tmp / "output").mkdir()
+    for i in range(copies):
+        for j, text in enumerate(texts):
+            year = 2000 + i // 12
+            month = i % 12 + 1
+            (tmp / "output" / f"{year}-{month:02d}_{j}_newsletter.md").write_text(
+                text.replace("changelog/", f"changelog/{i}-"), encoding="utf-8"
+            )
+    return tmp
+
+
+# ── Cases ──
+
+Case = tuple[str, str, Callable[[], Callable[[], Any]], Callable[[], None] | None]
+
+
+def build_cases(sizes: list[str]) -> list[Case]:
+    ees = load_module("extract_event_sources", "tools/extract_event_sources.py")
+    poll = load_module("poll_sources", ".github/skills/kb-maintenance/scripts/poll_sources.py")
+    edits = load_module("edit_corpus", "tools/edit_corpus.py")
+    deps = load_module(
+        "find_deprecations", ".github/skills/deprecation-consolidation/scripts/find_deprecations.py"
+    )
+    cases: list[Case] = []
+
+    for size in sizes:
+        scale = SIZES[size]
+
+        def html_case(scale: int = scale) -> Callable[[], Any]:
+            html = make_html(scale)
+            return lambda: (
+                ees.extract_github_resources_deeplinks(html),
+                ees.extract_reactor_event_deeplinks(html),
+            )
+
+        cases.append(("extract_event_sources.deeplinks", size, html_case, None))
+
+        def rss_case(scale: int = scale) -> Callable[[], Any]:
+            xml = make_rss(20 * scale)
+            return lambda: poll.parse_rss_entries(xml, "2025-12-15")
+
+        cases.append(("poll_sources.parse_rss_entries.rss", size, rss_case, None))
+
+        def atom_case(scale: int = scale) -> Callable[[], Any]:
+            xml = make_atom(20 * scale)
+            return lambda: poll.parse_rss_entries(xml, "2025-12-15")
+
+        cases.append(("poll_sources.parse_rss_entries.atom", size, atom_case, None))
+
+        def diff_case(scale: int = scale) -> Callable[[], Any]:
+            history = make_revisions(40 * scale, 10 + scale)
+
+            def run() -> None:
+                for i in range(1, len(history)):
+                    diff = edits.compute_diff(history[i - 1], history[i], "a", "b")
+                    edits.classify_diff(diff)
+
+            return run
+
+        cases.append(("edit_corpus.diff_classify", size, diff_case, None))
+
+        def deprecation_case(scale: int = scale) -> Callable[[], Any]:
+            lines = [line for text in corpus_texts() for line in text.splitlines()] * scale
+            return lambda: deps.find_candidates(lines)
+
+        cases.append(("find_deprecations.find_candidates", size, deprecation_case, None))
+
+    # Subprocess cases: the validator over a many-newsletter corpus, once per
+    # file through the shell entry point and once as a single batch.
+    corpus_holder: dict[str, Path] = {}
+    validator_dir = ROOT / ".github/skills/newsletter-validation/scripts"
+
+    def validator_case() -> Callable[[], Any]:
+        corpus = make_corpus_dir(2)
+        corpus_holder["dir"] = corpus
+        files = sorted((corpus / "output").glob("*.md"))
+        script = validator_dir / "validate_newsletter.sh"
+
+        def run() -> None:
+            for path in files:
+                subprocess.run(["bash", str(script), str(path)], capture_output=True, check=False)
+
+        return run
+
+    def validator_batch_case() -> Callable[[], Any]:
+        corpus = make_corpus_dir(2)
+        corpus_holder["dir"] = corpus
+        files = [str(path) for path in sorted((corpus / "output").glob("*.md"))]
+        script = validator_dir / "validate_newsletter.py"
+        return lambda: subprocess.run(
+            [sys.executable, str(script), "--summary", *files], capture_output=True, check=False
+        )
+
+    def validator_cleanup() -> None:
+        if "dir" in corpus_holder:
+            shutil.rmtree(corpus_holder.pop("dir"), ignore_errors=True)
+
+    cases.append(("validate_newsletter.sh.corpus", "corpus", validator_case, validator_cleanup))
+    cases.append(("validate_newsletter.py.batch", "corpus", validator_batch_case, validator_cleanup))
+    cases.extend(build_startup_cases())
+    return cases
+
+
+STARTUP_MODULES = {
+    "kb_index": "tools",
+    "extract_event_sources": "tools",
+    "url_index": "tools",
+    "item_store": "tools",
+    "extract_discussion_edits": "tools",
+    "poll_sources": ".github/skills/kb-maintenance/scripts",
+    "check_link_health": ".github/skills/kb-maintenance/scripts",
+}
+STARTUP_CALLS = 10
+
+
+def _no_cleanup() -> None:
+    """Marks a case as subprocess-based (no tracemalloc pass)."""
+
+
+def build_startup_cases() -> list[Case]:
+    """Interpreter start + import cost per tool, and per-process vs batched dispatch."""
+    cases: list[Case] = []
+    tools_dir = str(ROOT / "tools")
+    for module, rel_dir in STARTUP_MODULES.items():
+        code = f"import sys; sys.path[:0] = [{str(ROOT / rel_dir)!r}, {tools_dir!r}]; import {module}"
+
+        def import_case(code: str = code) -> Callable[[], Any]:
+            return lambda: subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+
+        cases.append((f"startup.import.{module}", "startup", import_case, _no_cleanup))
+
+    newsletter = str(ROOT / "output" / "2026-02_february_newsletter.md")
+    script = str(ROOT / ".github/skills/deprecation-consolidation/scripts/find_deprecations.py")
+
+    def per_process_case() -> Callable[[], Any]:
+        def run() -> None:
+            for _ in range(STARTUP_CALLS):
+                subprocess.run([sys.executable, script, newsletter], capture_output=True, check=True)
+
+        return run
+
+    def batch_case() -> Callable[[], Any]:
+        commands = f"find-deprecations {newsletter}\n" * STARTUP_CALLS
+        return lambda: subprocess.run(
+            [sys.executable, "-m", "tools", "--batch", "-"],
+            input=commands, text=True, cwd=ROOT, capture_output=True, check=True,
+        )
+
+    cases.append((f"startup.find_deprecations.x{STARTUP_CALLS}.per_process", "startup", per_process_case, _no_cleanup))
+    cases.append((f"startup.find_deprecations.x{STARTUP_CALLS}.batch", "startup", batch_case, _no_cleanup))
+    return cases
+
+
+def measure(factory: Callable[[], Callable[[], Any]], repeat: int, subprocess_case: bool) -> dict[str, Any]:
+    fn = factory()
+    fn()  # warm-up (imports, regex compilation, page cache)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    peak_kib = None
+    if not subprocess_case:
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib = round(peak / 1024, 1)
+
+    return {
+        "median_s": round(statistics.median(timings), 6),
+        "min_s": round(min(timings), 6),
+        "peak_kib": peak_kib,
+        "repeat": repeat,
+    }
+
+
+def load_baselines(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark deterministic tooling")
+    parser.add_argument("--quick", action="store_true", help="Only the small size (plus corpus)")
+    parser.add_argument("--filter", default="", help="Run cases whose name contains this substring")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Flag medians slower than baseline * threshold")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.repeat < 1 or args.threshold <= 1.0:
+        print("Error: --repeat must be >= 1 and --threshold > 1.0")
+        return 2
+
+    sizes = ["small"] if args.quick else list(SIZES)
+    baselines = load_baselines(args.baseline)
+    results: dict[str, Any] = {}
+    regressions = []
+
+    for name, size, factory, cleanup in build_cases(sizes):
+        key = f"{name}[{size}]"
+        if args.filter and args.filter not in key:
+            continue
+        try:
+            result = measure(factory, args.repeat, subprocess_case=cleanup is not None)
+        finally:
+            if cleanup:
+                cleanup()
+        base = baselines.get(key)
+        if base:
+            ratio = result["median_s"] / base["median_s"] if base["median_s"] else 1.0
+            result["baseline_median_s"] = base["median_s"]
+            result["ratio"] = round(ratio, 3)
+            if ratio > args.threshold and result["median_s"] > NOISE_FLOOR_S:
+                regressions.append(key)
+                result["status"] = "REGRESSION"
+            else:
+                result["status"] = "OK"
+        else:
+            result["status"] = "NEW"
+        results[key] = result
+        if not args.json:
+            ratio_txt = f"x{result['ratio']:.2f}" if "ratio" in result else "  -  "
+            peak_txt = f"{result['peak_kib']:>10.1f} KiB" if result["peak_kib"] is not None else "         n/a"
+            print(f"{result['status']:<10} {key:<52} {result['median_s'] * 1000:>10.2f} ms {peak_txt}  {ratio_txt}")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        merged = {**baselines, **{k: {kk: v[kk] for kk in ("median_s", "peak_kib")} for k, v in results.items()}}
+        payload = {
+            "generated_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": dict(sorted(merged.items())),
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        if not args.json:
+            written = args.baseline.resolve()
+            print(f"Wrote baseline: {written.relative_to(ROOT) if written.is_relative_to(ROOT) else args.baseline}")
+
+    if args.json:
+        print(json.dumps({"threshold": args.threshold, "results": results, "regressions": regressions}, indent=2))
+    else:
+        print()
+        print(f"Cases: {len(results)} | Regressions (> x{args.threshold}): {len(regressions)}")
+        for key in regressions:
+            print(f"  REGRESSION: {key}")
+
+    return 1 if regressions and not args.update_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""Compile benchmark-mode contracts and evaluate them in one pass per newsletter.
+
+A benchmark mode (config/benchmark_modes/*.json) is compiled once into a
+matcher: required/forbidden headings become set lookups, every
+required_h1_regex becomes one combined regex (one lookahead group per
+pattern), and the required_url_substrings of all modes in the batch share a
+single Aho-Corasick automaton. Each newsletter is parsed once (headings,
+links, words, domains, one automaton scan) and every compiled mode is then
+checked against those facts, so N modes x M newsletters costs M scans
+instead of N x M x (entries) re-scans.
+
+validate_pipeline_strict.sh uses `check` for --benchmark-mode; `matrix` runs
+every mode against every archived cycle as a regression suite.
+
+Usage:
+  python3 tools/benchmark_contracts.py check NEWSLETTER MODE START END
+  python3 tools/benchmark_contracts.py matrix [PATH ...] [--mode MODE ...]
+      [--baseline FILE] [--update-baseline] [--json]
+
+  MODE is a mode name in config/benchmark_modes/ or a JSON path. PATH is a
+  newsletter or a directory searched recursively; default is archive/ plus
+  output/*_newsletter.md. The matrix ignores date_range (newsletters are
+  not tied to a cycle there).
+
+Output:
+  check: PASS:/WARN:/FAIL: lines (the format validate_pipeline_strict.sh
+  parses); exit 2 if any contract entry fails.
+  matrix: one row per newsletter with each mode's pass/fail count, then the
+  failing entries. With --baseline, exit 1 if any cell's failing-entry count
+  differs from the recorded one; --update-baseline rewrites the file instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+from text_match import SubstringMatcher
+
+ROOT = Path(__file__).resolve().parent.parent
+MODES_DIR = ROOT / "config" / "benchmark_modes"
+
+HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+LINK = re.compile(r"\[[^\]]+\]\([^)\s]+\)")
+LINK_URL = re.compile(r"\[[^\]]+\]\((https?://[^)\s]+)\)")
+WORD = re.compile(r"\b\w[\w'-]*\b")
+# Group references (\1, (?P=name), (?(1)...)) that would bind to another pattern once combined.
+UNEMBEDDABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def normalize_domain(url: str) -> str:
+    host = (urlparse(url).netloc or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def resolve_mode(mode: str) -> Path:
+    for candidate in (Path(mode), MODES_DIR / f"{mode}.json", MODES_DIR / mode):
+        if candidate.is_file():
+            return candidate
+    raise SystemExit(f"Benchmark mode not found: {mode}")
+
+
+class NewsletterFacts:
+    """Everything a contract reads from one newsletter, parsed once."""
+
+    def __init__(self, path: Path, text: str | None = None) -> None:
+        self.path = path
+        self.text = path.read_text(encoding="utf-8", errors="ignore") if text is None else text
+        self.h1: list[str] = []
+        h2: list[str] = []
+        for line in self.text.splitlines():
+            match = HEADING.match(line) if line.startswith("#") else None
+            if not match:
+                continue
+            level = len(match.group(1))
+            if level == 1:
+                self.h1.append(match.group(2).strip())
+            elif level == 2:
+                h2.append(match.group(2).strip())
+        self.h1_set = set(self.h1)
+        self.h2_set = set(h2)
+        self.links_total = len(LINK.findall(self.text))
+        self.words_total = len(WORD.findall(self.text))
+        self.domains = {d for d in map(normalize_domain, LINK_URL.findall(self.text)) if d}
+        self.substrings: set[str] = set()
+
+    def scan(self, matcher: SubstringMatcher) -> None:
+        self.substrings = matcher.find(self.text)
+
+
+class CompiledContract:
+    """One benchmark mode's section_contract, precompiled for repeated evaluation."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        config = json.loads(path.read_text(encoding="utf-8"))
+        self.name = config.get("name") or path.stem
+        self.date_range = config.get("date_range") if isinstance(config.get("date_range"), dict) else None
+        contract = config.get("section_contract", {})
+        self.required_h1 = list(contract.get("required_h1", []))
+        self.required_h2 = list(contract.get("required_h2", []))
+        self.forbidden_h1 = list(contract.get("forbidden_h1", []))
+        self.h1_patterns = list(contract.get("required_h1_regex", []))
+        self.h1_regex = self._combine(self.h1_patterns)
+        self.require_any = list(contract.get("require_any", []))
+        self.min_links = int(contract.get("min_links", 0) or 0)
+        self.min_words = int(contract.get("min_words", 0) or 0)
+        self.min_h1_count = int(contract.get("min_h1_count", 0) or 0)
+        domain_contract = contract.get("domain_contract", {})
+        if not isinstance(domain_contract, dict):
+            domain_contract = {}
+        self.min_unique_domains = int(domain_contract.get("min_unique_domains", 0) or 0)
+        domains = domain_contract.get("required_domains", [])
+        self.required_domains = []
+        for domain in domains if isinstance(domains, list) else []:
+            if isinstance(domain, str) and domain.strip():
+                d = domain.strip().lower()
+                self.required_domains.append(d[4:] if d.startswith("www.") else d)
+        substrings = contract.get("required_url_substrings", [])
+        self.url_substrings = [
+            s.strip() for s in (substrings if isinstance(substrings, list) else []) if isinstance(s, str) and s.strip()
+        ]
+
+    @staticmethod
+    def _combine(patterns: list[str]) -> re.Pattern[str] | list[re.Pattern[str]]:
+        """One regex with an optional lookahead group per pattern, so a single
+        finditer over a heading reports every pattern that matches anywhere in
+        it. Patterns that cannot be embedded fall back to one compiled regex
+        each: inline flags fail to compile, while backreferences and group
+        conditionals would compile but resolve against the wrong pattern's
+        groups, so they are detected up front."""
+        if not patterns:
+            return []
+        if any(UNEMBEDDABLE.search(p) for p in patterns):
+            return [re.compile(p) for p in patterns]
+        try:
+            return re.compile("".join(f"(?:(?=(?P<r{i}>{p})))?" for i, p in enumerate(patterns)))
+        except re.error:
+            return [re.compile(p) for p in patterns]
+
+    def _h1_regex_hits(self, headings: list[str]) -> set[int]:
+        hits: set[int] = set()
+        if isinstance(self.h1_regex, list):
+            return {i for i, regex in enumerate(self.h1_regex) if any(regex.search(h) for h in headings)}
+        wanted = len(self.h1_patterns)
+        for heading in headings:
+            for match in self.h1_regex.finditer(heading):
+                hits.update(int(name[1:]) for name, value in match.groupdict().items() if value is not None)
+            if len(hits) == wanted:
+                break
+        return hits
+
+    def evaluate(self, facts: NewsletterFacts, start: str | None = None, end: str | None = None
+                 ) -> tuple[list[str], list[str], list[str]]:
+        """(fails, warns, passes) with the messages strict validation reports.
+        The date_range check runs only when start/end are given."""
+        fails: list[str] = []
+        warns: list[str] = []
+        passes: list[str] = []
+
+        if self.date_range and start is not None:
+            if self.date_range.get("start") != start or self.date_range.get("end") != end:
+                fails.append(
+                    f"benchmark config date_range mismatch ({self.date_range.get('start')}..{self.date_range.get('end')}) "
+                    f"!= ({start}..{end})"
+                )
+
+        for heading in self.required_h1:
+            if heading in facts.h1_set:
+                passes.append(f"Benchmark section H1 present: {heading}")
+            else:
+                fails.append(f"Benchmark section H1 missing: {heading}")
+
+        for heading in self.required_h2:
+            if heading in facts.h2_set:
+                passes.append(f"Benchmark section H2 present: {heading}")
+            else:
+                fails.append(f"Benchmark section H2 missing: {heading}")
+
+        hits = self._h1_regex_hits(facts.h1)
+        for i, pattern in enumerate(self.h1_patterns):
+            if i in hits:
+                passes.append(f"Benchmark H1 regex satisfied: {pattern}")
+            else:
+                fails.append(f"Benchmark H1 regex unsatisfied: {pattern}")
+
+        for heading in self.forbidden_h1:
+            if heading in facts.h1_set:
+                fails.append(f"Benchmark forbidden H1 present: {heading}")
+            else:
+                passes.append(f"Benchmark forbidden H1 absent: {heading}")
+
+        for group in self.require_any:
+            group_id = group.get("id", "unnamed")
+            satisfied = any(
+                (option.get("h1") is None or option["h1"] in facts.h1_set)
+                and (option.get("h2") is None or option["h2"] in facts.h2_set)
+                for option in group.get("options", [])
+            )
+            if satisfied:
+                passes.append(f"Benchmark any-of contract satisfied: {group_id}")
+            else:
+                fails.append(f"Benchmark any-of contract failed: {group_id}")
+
+        for label, actual, minimum in (("min_links", facts.links_total, self.min_links),
+                                       ("min_words", facts.words_total, self.min_words),
+                                       ("min_h1_count", len(facts.h1), self.min_h1_count)):
+            if minimum <= 0:
+                continue
+            if actual >= minimum:
+                passes.append(f"Benchmark {label} satisfied ({actual} >= {minimum})")
+            else:
+                fails.append(f"Benchmark {label} failed ({actual} < {minimum})")
+
+        if self.min_unique_domains > 0:
+            if len(facts.domains) >= self.min_unique_domains:
+                passes.append(f"Benchmark domain diversity satisfied ({len(facts.domains)} >= {self.min_unique_domains})")
+            else:
+                fails.append(f"Benchmark domain diversity failed ({len(facts.domains)} < {self.min_unique_domains})")
+
+        for domain in self.required_domains:
+            if domain in facts.domains:
+                passes.append(f"Benchmark required domain present: {domain}")
+            else:
+                fails.append(f"Benchmark required domain missing: {domain}")
+
+        for needle in self.url_substrings:
+            if needle in facts.substrings:
+                passes.append(f"Benchmark required URL substring present: {needle}")
+            else:
+                fails.append(f"Benchmark required URL substring missing: {needle}")
+
+        return fails, warns, passes
+
+
+def evaluate_batch(contracts: list[CompiledContract], newsletters: list[Path]
+                   ) -> dict[str, dict[str, list[str]]]:
+    """newsletter -> mode name -> failing entries, parsing each newsletter once."""
+    matcher = SubstringMatcher(s for c in contracts for s in c.url_substrings)
+    results: dict[str, dict[str, list[str]]] = {}
+    for path in newsletters:
+        facts = NewsletterFacts(path)
+        facts.scan(matcher)
+        results[display(path)] = {c.name: c.evaluate(facts)[0] for c in contracts}
+    return results
+
+
+def display(path: Path) -> str:
+    resolved = path.resolve()
+    return str(resolved.relative_to(ROOT)) if resolved.is_relative_to(ROOT) else str(path)
+
+
+def newsletter_paths(specs: list[str]) -> list[Path]:
+    if not specs:
+        paths = sorted((ROOT / "archive").rglob("*.md")) + sorted((ROOT / "output").glob("*_newsletter.md"))
+        if not paths:
+            raise SystemExit("No newsletters found in archive/ or output/")
+        return paths
+    paths = []
+    for spec in specs:
+        path = Path(spec)
+        if path.is_dir():
+            paths += sorted(path.rglob("*.md"))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            raise SystemExit(f"Not found: {spec}")
+    return paths
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compiled benchmark-mode contracts")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="One newsletter against one mode (strict validation format)")
+    check.add_argument("newsletter")
+    check.add_argument("mode", help="Mode name or JSON path")
+    check.add_argument("start", help="Cycle start date (YYYY-MM-DD)")
+    check.add_argument("end", help="Cycle end date (YYYY-MM-DD)")
+    matrix = sub.add_parser("matrix", help="Every mode against every newsletter")
+    matrix.add_argument("paths", nargs="*", help="Newsletters or directories (default: archive/ and output/)")
+    matrix.add_argument("--mode", action="append", default=[], help="Limit to these modes (repeatable)")
+    matrix.add_argument("--baseline", help="JSON file of expected failing-entry counts to compare against")
+    matrix.add_argument("--update-baseline", action="store_true", help="Write the current counts to --baseline")
+    matrix.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    return parser.parse_args()
+
+
+def run_check(args: argparse.Namespace) -> int:
+    contract = CompiledContract(resolve_mode(args.mode))
+    facts = NewsletterFacts(Path(args.newsletter))
+    facts.scan(SubstringMatcher(contract.url_substrings))
+    fails, warns, passes = contract.evaluate(facts, args.start, args.end)
+    for item in fails:
+        print(f"FAIL: {item}")
+    for item in warns:
+        print(f"WARN: {item}")
+    for item in passes:
+        print(f"PASS: {item}")
+    return 2 if fails else 0
+
+
+def run_matrix(args: argparse.Namespace) -> int:
+    mode_paths = [resolve_mode(m) for m in args.mode] or sorted(MODES_DIR.glob("*.json"))
+    if not mode_paths:
+        raise SystemExit(f"No benchmark modes found in {MODES_DIR}")
+    contracts = [CompiledContract(p) for p in mode_paths]
+    results = evaluate_batch(contracts, newsletter_paths(args.paths))
+    counts = {nl: {mode: len(fails) for mode, fails in modes.items()} for nl, modes in results.items()}
+
+    if args.update_baseline:
+        if not args.baseline:
+            raise SystemExit("--update-baseline requires --baseline FILE")
+        Path(args.baseline).write_text(json.dumps(counts, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Wrote {len(counts)} newsletter rows to {args.baseline}")
+        return 0
+
+    drift: list[str] = []
+    if args.baseline:
+        expected = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        for nl, modes in counts.items():
+            for mode, count in modes.items():
+                want = expected.get(nl, {}).get(mode)
+                if want is not None and want != count:
+                    drift.append(f"{nl} [{mode}]: expected {want} failing entries, got {count}")
+
+    if args.json:
+        print(json.dumps({"results": results, "drift": drift}, indent=2))
+        return 1 if drift else 0
+
+    names = [c.name for c in contracts]
+    print("# Benchmark Contract Matrix")
+    print(f"Modes: {len(names)}  Newsletters: {len(results)}")
+    print()
+    print("| Newsletter | " + " | ".join(names) + " |")
+    print("|---|" + "---|" * len(names))
+    for nl, modes in results.items():
+        cells = ["PASS" if not modes[n] else f"FAIL ({len(modes[n])})" for n in names]
+        print(f"| {nl} | " + " | ".join(cells) + " |")
+    for nl, modes in results.items():
+        for mode, fails in modes.items():
+            if fails:
+                print()
+                print(f"## {nl} [{mode}]")
+                for item in fails:
+                    print(f"- {item}")
+    if drift:
+        print()
+        print(f"## Drift from {args.baseline} ({len(drift)})")
+        for item in drift:
+            print(f"- {item}")
+    return 1 if drift else 0
+
+
+def main() -> int:
+    args = parse_args()
+    if args.command == "check":
+        return run_check(args)
+    return run_matrix(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Verify every outbound link in assembled newsletters before publishing.
+
+Extracts Markdown links (inline, <autolinks> and reference definitions;
+fenced code is skipped) from the given newsletters or directories, then
+checks each distinct URL once, concurrently, over the shared keep-alive pool:
+SSRF validation, per-host concurrency limits, HEAD first and a one-byte Range
+GET fallback. Results are cached under .cache/link_checks/ for
+--cache-ttl-hours, so re-checking a draft only fetches new or stale links.
+
+Usage:
+  python3 tools/check_newsletter_links.py [PATH ...] [--workers 16] [--max-per-host 4]
+      [--timeout 10] [--cache-ttl-hours 24] [--no-cache] [--json]
+
+  PATH is a newsletter .md file or a directory searched recursively (e.g.
+  archive/); default is the newest output/*_newsletter.md.
+
+Output:
+  Broken, blocked, skipped (host circuit breaker open) and redirected links
+  with file:line locations, then a summary. Exit 1 if any link is broken,
+  blocked or skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import paths
+import profiling
+
+if TYPE_CHECKING:
+    from http_pool import HttpPool
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = ROOT / "output"
+CACHE_DIR = paths.CACHE_DIR / "link_checks"
+
+DEFAULT_CACHE_TTL_HOURS = 24
+
+# [text](url "title") and ![alt](url); one level of balanced parentheses in the URL.
+INLINE_LINK = re.compile(r"\]\(\s*(<[^>\s]+>|(?:[^()\s]|\([^()\s]*\))+)(?:\s+(?:\"[^\"]*\"|'[^']*'))?\s*\)")
+AUTOLINK = re.compile(r"<(https?://[^>\s]+)>")
+REFERENCE_DEF = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s+.*)?$")
+FENCE = re.compile(r"^ {0,3}(```|~~~)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check outbound links in newsletter markdown")
+    parser.add_argument("paths", nargs="*", help="Newsletter files or directories (default: newest output newsletter)")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent link checks")
+    parser.add_argument("--max-per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--timeout", type=float, default=10, help="Per-request timeout in seconds")
+    parser.add_argument("--cache-ttl-hours", type=float, default=DEFAULT_CACHE_TTL_HOURS,
+                        help="Reuse cached results younger than this")
+    parser.add_argument("--no-cache", action="store_true", help="Check every link live and do not write the cache")
+    parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    return parser.parse_args()
+
+
+def newsletter_files(paths: list[str]) -> list[Path]:
+    if not paths:
+        candidates = sorted(OUTPUT_DIR.glob("*_newsletter.md"), key=lambda p: p.stat().st_mtime)
+        if not candidates:
+            raise SystemExit(f"No newsletters found in {OUTPUT_DIR}")
+        return [candidates[-1]]
+    files: list[Path] = []
+    for spec in paths:
+        path = Path(spec)
+        if path.is_dir():
+            files += sorted(path.rglob("*.md"))
+        elif path.is_file():
+            files.append(path)
+        else:
+            raise SystemExit(f"Not found: {spec}")
+    return files
+
+
+def extract_links(text: str) -> list[tuple[int, str]]:
+    """(line number, URL) for every http(s) Markdown link outside fenced code."""
+    links: list[tuple[int, str]] = []
+    in_fence = False
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence or "http" not in line:
+            continue
+        ref = REFERENCE_DEF.match(line)
+        if ref:
+            found = [ref.group(1)]
+        else:
+            found = [m.group(1).strip("<>") for m in INLINE_LINK.finditer(line)]
+            found += AUTOLINK.findall(INLINE_LINK.sub("", line))
+        links += [(lineno, url) for url in found if url.startswith(("https://", "http://"))]
+    return links
+
+
+def collect_links(files: list[Path]) -> dict[str, list[str]]:
+    """URL -> sorted "file:line" locations, across all files."""
+    locations: dict[str, list[str]] = {}
+    for path in files:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        shown = os.path.relpath(path, ROOT) if path.resolve().is_relative_to(ROOT) else str(path)
+        for lineno, url in extract_links(text):
+            locations.setdefault(url, []).append(f"{shown}:{lineno}")
+    return locations
+
+
+class LinkCache:
+    """URL -> last definitive check result, one small JSON file per URL."""
+
+    def __init__(self, root: Path = CACHE_DIR, ttl_s: float = DEFAULT_CACHE_TTL_HOURS * 3600) -> None:
+        self.root = root
+        self.ttl_s = ttl_s
+
+    def _path(self, url: str) -> Path:
+        return self.root / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        try:
+            cached = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if cached.get("url") != url or time.time() - cached.get("checked_at", 0) >= self.ttl_s:
+            return None
+        return cached["result"]
+
+    def put(self, url: str, result: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {"url": url, "checked_at": time.time(), "result": result}
+        self._path(url).write_text(json.dumps(payload) + "\n", encoding="utf-8")
+
+
+def check_link(pool: HttpPool, cache: LinkCache | None, url: str) -> dict[str, Any]:
+    """Classify one URL as ok, redirect, broken, blocked or skipped (TTL-cached)."""
+    cached = cache.get(url) if cache else None
+    if cached is not None:
+        return {**cached, "cache": "hit"}
+    with profiling.stage("fetch"):
+        fetch = pool.exists(url)
+    if fetch["skipped"]:
+        state = "skipped"
+    elif fetch["error"].startswith("Blocked"):
+        state = "blocked"
+    elif not fetch["fetch_ok"]:
+        state = "broken"
+    elif fetch["final_url"] and fetch["final_url"] != url:
+        state = "redirect"
+    else:
+        state = "ok"
+    result = {"state": state, "status_code": fetch["status_code"], "final_url": fetch["final_url"], "error": fetch["error"]}
+    # Connection-level failures (no HTTP status) are often transient: re-check them next run.
+    if cache and state != "blocked" and fetch["status_code"]:
+        cache.put(url, result)
+    return {**result, "cache": "miss"}
+
+
+def check_links(urls: list[str], args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from http_pool import HttpPool
+
+    cache = None if args.no_cache else LinkCache(ttl_s=args.cache_ttl_hours * 3600)
+    with HttpPool(timeout=args.timeout, max_per_host=args.max_per_host, hedge_percentile=0.9) as pool, \
+            ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        results = list(executor.map(lambda u: check_link(pool, cache, u), urls))
+    return dict(zip(urls, results))
+
+
+def print_report(locations: dict[str, list[str]], results: dict[str, dict[str, Any]], files: list[Path]) -> None:
+    counts = {state: 0 for state in ("ok", "redirect", "broken", "blocked", "skipped")}
+    for result in results.values():
+        counts[result["state"]] += 1
+
+    print("# Newsletter Link Check")
+    print(f"Files: {len(files)}  Links: {sum(len(v) for v in locations.values())}  Unique URLs: {len(results)}")
+    sections = (("broken", "Broken"), ("blocked", "Blocked"), ("skipped", "Skipped (host circuit open)"),
+                ("redirect", "Redirects"))
+    for state, title in sections:
+        urls = sorted(u for u, r in results.items() if r["state"] == state)
+        if not urls:
+            continue
+        print()
+        print(f"## {title} ({len(urls)})")
+        for url in urls:
+            result = results[url]
+            if state == "redirect":
+                detail = f"-> {result['final_url']}"
+            else:
+                detail = result["error"] or f"HTTP {result['status_code']}"
+            print(f"- {url} ({detail})")
+            for where in locations[url]:
+                print(f"    {where}")
+
+    cached = sum(1 for r in results.values() if r["cache"] == "hit")
+    print()
+    print("## Summary")
+    print(f"  OK: {counts['ok']}")
+    print(f"  Redirects: {counts['redirect']}")
+    print(f"  Broken: {counts['broken']}")
+    print(f"  Blocked: {counts['blocked']}")
+    print(f"  Skipped: {counts['skipped']}")
+    print(f"  Cached: {cached}/{len(results)}")
+
+
+def main() -> int:
+    profiling.init("check_newsletter_links")
+    args = parse_args()
+    with profiling.stage("config_load"):
+        files = newsletter_files(args.paths)
+    with profiling.stage("extract"):
+        locations = collect_links(files)
+    urls = sorted(locations)
+    results = check_links(urls, args) if urls else {}
+
+    with profiling.stage("write"):
+        if args.json:
+            payload = [{"url": url, "locations": locations[url], **results[url]} for url in urls]
+            print(json.dumps(payload, indent=2))
+        else:
+            print_report(locations, results, files)
+    return 1 if any(r["state"] in {"broken", "blocked", "skipped"} for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Columnar edit analytics over the whole polishing corpus.
+
+Loads every consecutive revision pair through EditCorpus (tools/edit_corpus.py)
+once and flattens the edits into typed arrays (stdlib `array`, no NumPy): one
+row per diff (discussion, change type, additions, deletions, editor, time
+since the previous edit, time to publish, session phase) and one row per
+hunk (discussion, diff, line position, relative position, section id,
+additions, deletions). The distributions behind
+reference/polishing-intelligence.md are then reductions over those columns:
+
+  - change-type distribution and rewrite / addition / expansion rates
+  - change types by session phase (early / middle / late third of edits)
+  - churn (added + deleted lines) and hunk counts by section
+  - edit-to-publish latency and gap between edits (percentiles, hours)
+  - where in the document edits land (relative-position deciles)
+  - edits per editor
+
+Usage:
+  python3 tools/edit_analytics.py [--root benchmark/polishing] [--output FILE.json|FILE.md]
+      [--edits-csv FILE] [--top-sections 15]
+
+Output:
+  Markdown report on stdout (or FILE; JSON when FILE ends in .json).
+  --edits-csv also writes the per-hunk table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import difflib
+import json
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable
+
+from edit_corpus import DEFAULT_CORPUS, EditCorpus
+
+CHANGE_TYPES = ("rewrite", "addition", "expansion", "removal", "mixed", "compression", "none")
+PHASES = ("early", "middle", "late")
+HEADING = re.compile(r"^#{1,6}\s*(\S.*?)\s*#*\s*$")
+NO_SECTION = "(preamble)"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Vectorized polishing-corpus edit analytics")
+    parser.add_argument("--root", default=str(DEFAULT_CORPUS), help="Corpus directory (default: benchmark/polishing)")
+    parser.add_argument("--output", help="Write the report here (.json for JSON, otherwise Markdown)")
+    parser.add_argument("--edits-csv", help="Also write the per-hunk table as CSV")
+    parser.add_argument("--top-sections", type=int, default=15, help="Sections listed in the churn table")
+    return parser.parse_args()
+
+
+def _epoch(timestamp: str) -> float:
+    try:
+        return dt.datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return float("nan")
+
+
+def section_ids(lines: list[str], intern: dict[str, int]) -> array:
+    """Section id for every line: the nearest heading at or above it."""
+    ids = array("I", [0]) * len(lines)
+    current = intern.setdefault(NO_SECTION, len(intern))
+    for i, line in enumerate(lines):
+        if line.startswith("#"):
+            match = HEADING.match(line)
+            if match:
+                current = intern.setdefault(match.group(1).strip("*_` ").lower()[:80], len(intern))
+        ids[i] = current
+    return ids
+
+
+class EditTable:
+    """Per-diff and per-hunk columns for every edit in the corpus."""
+
+    def __init__(self) -> None:
+        self.sections: dict[str, int] = {}
+        self.editors: dict[str, int] = {}
+        self.discussions: list[int] = []
+        # One row per diff.
+        self.d_disc = array("I")
+        self.d_from = array("I")
+        self.d_type = array("B")
+        self.d_add = array("I")
+        self.d_del = array("I")
+        self.d_editor = array("I")
+        self.d_gap_s = array("d")
+        self.d_to_publish_s = array("d")
+        self.d_phase = array("B")
+        # One row per hunk.
+        self.h_disc = array("I")
+        self.h_from = array("I")
+        self.h_pos = array("I")
+        self.h_relpos = array("d")
+        self.h_section = array("I")
+        self.h_add = array("I")
+        self.h_del = array("I")
+
+    @classmethod
+    def load(cls, corpus: EditCorpus) -> "EditTable":
+        table = cls()
+        for disc in corpus.discussions():
+            table.add_discussion(corpus, disc)
+        return table
+
+    def add_discussion(self, corpus: EditCorpus, disc: dict[str, Any]) -> None:
+        number = disc["number"]
+        snapshots = disc["snapshots"]
+        self.discussions.append(number)
+        if len(snapshots) < 2:
+            return
+        times = [_epoch(s["timestamp"]) for s in snapshots]
+        published = times[-1]
+        n_diffs = len(snapshots) - 1
+        diffs = {d["from_revision"]: d for d in disc["diffs"]}
+
+        old_lines = corpus.revision(number, 0).splitlines()
+        for i in range(n_diffs):
+            new_lines = corpus.revision(number, i + 1).splitlines()
+            meta = diffs.get(i, {})
+            editor = snapshots[i + 1].get("editor", "unknown")
+            self.d_disc.append(number)
+            self.d_from.append(i)
+            change_type = meta.get("change_type", "none")
+            self.d_type.append(CHANGE_TYPES.index(change_type) if change_type in CHANGE_TYPES else len(CHANGE_TYPES) - 1)
+            self.d_editor.append(self.editors.setdefault(editor, len(self.editors)))
+            self.d_gap_s.append(times[i + 1] - times[i])
+            self.d_to_publish_s.append(published - times[i + 1])
+            self.d_phase.append(min(2, 3 * i // n_diffs))
+
+            sections = section_ids(old_lines, self.sections) or array("I", [self.sections[NO_SECTION]])
+            added = deleted = 0
+            matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == "equal":
+                    continue
+                self.h_disc.append(number)
+                self.h_from.append(i)
+                self.h_pos.append(i1)
+                self.h_relpos.append(i1 / max(1, len(old_lines)))
+                self.h_section.append(sections[min(i1, len(sections) - 1)])
+                self.h_add.append(j2 - j1)
+                self.h_del.append(i2 - i1)
+                added += j2 - j1
+                deleted += i2 - i1
+            self.d_add.append(meta.get("additions", added))
+            self.d_del.append(meta.get("deletions", deleted))
+            old_lines = new_lines
+
+
+def group_sum(keys: Iterable[int], values: Iterable[float], size: int) -> list[float]:
+    totals = [0.0] * size
+    for key, value in zip(keys, values):
+        totals[key] += value
+    return totals
+
+
+def percentiles(values: Iterable[float], points: tuple[float, ...] = (0.5, 0.9)) -> dict[str, float | None]:
+    ordered = sorted(v for v in values if v == v)  # drop NaN (unparseable timestamps)
+    if not ordered:
+        return {f"p{int(p * 100)}": None for p in points}
+    return {f"p{int(p * 100)}": ordered[min(len(ordered) - 1, int(p * len(ordered)))] for p in points}
+
+
+def _hours(stats: dict[str, float | None]) -> dict[str, float | None]:
+    return {k: (round(v / 3600, 2) if v is not None else None) for k, v in stats.items()}
+
+
+def analyze(table: EditTable, top_sections: int = 15) -> dict[str, Any]:
+    n = len(table.d_type)
+    type_counts = group_sum(table.d_type, (1 for _ in range(n)), len(CHANGE_TYPES))
+    by_phase = {
+        phase: group_sum(table.d_type, (1 if p == code else 0 for p in table.d_phase), len(CHANGE_TYPES))
+        for code, phase in enumerate(PHASES)
+    }
+    section_names = sorted(table.sections, key=table.sections.get)
+    churn = group_sum(table.h_section, (a + d for a, d in zip(table.h_add, table.h_del)), len(section_names))
+    hunks = group_sum(table.h_section, (1 for _ in table.h_section), len(section_names))
+    ranked = sorted(range(len(section_names)), key=lambda s: (-churn[s], section_names[s]))[:top_sections]
+    deciles = group_sum((min(9, int(r * 10)) for r in table.h_relpos), (1 for _ in table.h_relpos), 10)
+    editor_names = sorted(table.editors, key=table.editors.get)
+    per_editor = group_sum(table.d_editor, (1 for _ in table.d_editor), len(editor_names))
+
+    def rate(count: float, total: float) -> float:
+        return round(count / total, 4) if total else 0.0
+
+    return {
+        "discussions": len(table.discussions),
+        "discussions_with_edits": len(set(table.d_disc)),
+        "diffs": n,
+        "hunks": len(table.h_pos),
+        "lines_added": sum(table.d_add),
+        "lines_deleted": sum(table.d_del),
+        "change_types": {t: {"count": int(c), "rate": rate(c, n)} for t, c in zip(CHANGE_TYPES, type_counts) if c},
+        "change_types_by_phase": {
+            phase: {t: int(c) for t, c in zip(CHANGE_TYPES, counts) if c} for phase, counts in by_phase.items()
+        },
+        "rewrite_vs_expansion": {
+            "rewrite_rate": rate(type_counts[CHANGE_TYPES.index("rewrite")], n),
+            "expansion_rate": rate(type_counts[CHANGE_TYPES.index("expansion")] + type_counts[CHANGE_TYPES.index("addition")], n),
+            "reduction_rate": rate(type_counts[CHANGE_TYPES.index("removal")] + type_counts[CHANGE_TYPES.index("compression")], n),
+        },
+        "churn_by_section": [
+            {"section": section_names[s], "churn_lines": int(churn[s]), "hunks": int(hunks[s])} for s in ranked if hunks[s]
+        ],
+        "edit_position_deciles": [int(c) for c in deciles],
+        "edit_to_publish_hours": _hours(percentiles(table.d_to_publish_s, (0.1, 0.5, 0.9))),
+        "gap_between_edits_hours": _hours(percentiles(table.d_gap_s, (0.5, 0.9))),
+        "edits_per_editor": {name: int(c) for name, c in zip(editor_names, per_editor)},
+    }
+
+
+def render_markdown(stats: dict[str, Any]) -> str:
+    out = [
+        "# Polishing Edit Analytics",
+        "",
+        f"Discussions: {stats['discussions']} ({stats['discussions_with_edits']} with edits) | "
+        f"Diffs: {stats['diffs']} | Hunks: {stats['hunks']} | "
+        f"Lines +{stats['lines_added']} / -{stats['lines_deleted']}",
+        "",
+        "## Change Type Distribution",
+        "",
+        "| Type | Count | % | Early | Middle | Late |",
+        "|------|-------|---|-------|--------|------|",
+    ]
+    phases = stats["change_types_by_phase"]
+    for name, entry in sorted(stats["change_types"].items(), key=lambda kv: -kv[1]["count"]):
+        row = [str(phases[p].get(name, 0)) for p in PHASES]
+        out.append(f"| {name} | {entry['count']} | {entry['rate'] * 100:.0f}% | {' | '.join(row)} |")
+    rve = stats["rewrite_vs_expansion"]
+    out += [
+        "",
+        f"Rewrite rate {rve['rewrite_rate'] * 100:.0f}% | addition/expansion rate {rve['expansion_rate'] * 100:.0f}% | "
+        f"removal/compression rate {rve['reduction_rate'] * 100:.0f}%",
+        "",
+        "## Churn by Section",
+        "",
+        "| Section | Churn (lines) | Hunks |",
+        "|---------|---------------|-------|",
+    ]
+    out += [f"| {s['section']} | {s['churn_lines']} | {s['hunks']} |" for s in stats["churn_by_section"]]
+    latency = stats["edit_to_publish_hours"]
+    gaps = stats["gap_between_edits_hours"]
+    out += [
+        "",
+        "## Timing (hours)",
+        "",
+        "| Metric | p10 | p50 | p90 |",
+        "|--------|-----|-----|-----|",
+        f"| Edit to publish | {latency['p10']} | {latency['p50']} | {latency['p90']} |",
+        f"| Gap between edits | - | {gaps['p50']} | {gaps['p90']} |",
+        "",
+        "## Edit Position (document deciles, top to bottom)",
+        "",
+        " ".join(str(c) for c in stats["edit_position_deciles"]),
+        "",
+        "## Edits per Editor",
+        "",
+    ]
+    out += [f"- {name}: {count}" for name, count in sorted(stats["edits_per_editor"].items(), key=lambda kv: -kv[1])]
+    return "\n".join(out) + "\n"
+
+
+def write_edits_csv(table: EditTable, path: Path) -> None:
+    section_names = sorted(table.sections, key=table.sections.get)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["discussion", "from_revision", "line", "relative_position", "section", "added", "deleted"])
+        for row in zip(table.h_disc, table.h_from, table.h_pos, table.h_relpos, table.h_section, table.h_add, table.h_del):
+            writer.writerow([row[0], row[1], row[2], round(row[3], 4), section_names[row[4]], row[5], row[6]])
+
+
+def main() -> int:
+    args = parse_args()
+    with EditCorpus(args.root) as corpus:
+        table = EditTable.load(corpus)
+    stats = analyze(table, args.top_sections)
+    if args.edits_csv:
+        write_edits_csv(table, Path(args.edits_csv))
+    if args.output and args.output.endswith(".json"):
+        Path(args.output).write_text(json.dumps(stats, indent=2) + "\n", encoding="utf-8")
+    elif args.output:
+        Path(args.output).write_text(render_markdown(stats), encoding="utf-8")
+    else:
+        sys.stdout.write(render_markdown(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Delta-chain storage and reader for the polishing benchmark corpus.
+
+Each discussion's revisions live in one pack file (discussion_NN.pack) as a
+sequence of zlib-compressed records: a full-text keyframe every
+KEYFRAME_INTERVAL revisions and line-level deltas against the previous
+revision in between. manifest.json indexes every record (offset, length,
+keyframe flag, sha256), so any revision is rebuilt from its nearest keyframe
+with at most KEYFRAME_INTERVAL - 1 delta applications, and unified diffs are
+computed on demand instead of being stored next to the snapshots.
+
+Reader API:
+  corpus = EditCorpus("benchmark/polishing")
+  corpus.discussions()                 manifest entries
+  corpus.revision(number, index)       text of one revision
+  corpus.diff(number, from_index)      unified diff from_index -> from_index + 1
+  corpus.iter_diffs()                  (discussion, diff entry, diff text) for all
+
+Manifests from the older layout (revision_NN.md / diff_NN_to_MM.diff files)
+are read through the same API; `convert` packs them in place.
+
+Usage:
+  python3 tools/edit_corpus.py stats [--root DIR]
+  python3 tools/edit_corpus.py show NUMBER INDEX [--root DIR]
+  python3 tools/edit_corpus.py diff NUMBER FROM_INDEX [--root DIR]
+  python3 tools/edit_corpus.py verify [--root DIR]
+  python3 tools/edit_corpus.py convert [--root DIR] [--keep-files]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Iterator
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CORPUS = ROOT / "benchmark" / "polishing"
+FORMAT = "delta-chain-v1"
+KEYFRAME_INTERVAL = 8
+
+
+def compute_diff(old_text: str, new_text: str, old_label: str, new_label: str) -> list[str]:
+    """Compute unified diff between two text revisions."""
+    old_lines = old_text.splitlines(keepends=True)
+    new_lines = new_text.splitlines(keepends=True)
+    return list(difflib.unified_diff(old_lines, new_lines, fromfile=old_label, tofile=new_label))
+
+
+def classify_diff(diff_lines: list[str]) -> str:
+    """Classify a diff into change types."""
+    additions = 0
+    deletions = 0
+    for line in diff_lines:
+        if line.startswith("+") and not line.startswith("+++"):
+            additions += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            deletions += 1
+
+    if additions > 0 and deletions == 0:
+        return "addition"
+    elif deletions > 0 and additions == 0:
+        return "removal"
+    elif additions > 0 and deletions > 0:
+        if abs(additions - deletions) <= 2:
+            return "rewrite"
+        elif additions > deletions * 2:
+            return "expansion"
+        elif deletions > additions * 2:
+            return "compression"
+        else:
+            return "mixed"
+    return "none"
+
+
+def diff_labels(snapshots: list[dict[str, Any]], from_index: int) -> tuple[str, str]:
+    old, new = snapshots[from_index], snapshots[from_index + 1]
+    return (f"revision_{old['index']:02d} ({old['timestamp']})", f"revision_{new['index']:02d} ({new['timestamp']})")
+
+
+def diff_entry(snapshots: list[dict[str, Any]], from_index: int, diff_lines: list[str]) -> dict[str, Any]:
+    """Manifest entry for one consecutive diff (same fields as the file layout, minus the file)."""
+    return {
+        "from_revision": from_index,
+        "to_revision": from_index + 1,
+        "from_timestamp": snapshots[from_index]["timestamp"],
+        "to_timestamp": snapshots[from_index + 1]["timestamp"],
+        "change_type": classify_diff(diff_lines),
+        "additions": sum(1 for l in diff_lines if l.startswith("+") and not l.startswith("+++")),
+        "deletions": sum(1 for l in diff_lines if l.startswith("-") and not l.startswith("---")),
+        "diff_lines": len(diff_lines),
+    }
+
+
+def encode_delta(old_text: str, new_text: str) -> list[Any]:
+    """Line ops turning old into new: ["=", n] copy, ["-", n] skip, ["+", lines] insert."""
+    old_lines = old_text.splitlines(keepends=True)
+    new_lines = new_text.splitlines(keepends=True)
+    ops: list[Any] = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+    return ops
+
+
+def apply_delta(old_text: str, ops: list[Any]) -> str:
+    old_lines = old_text.splitlines(keepends=True)
+    out: list[str] = []
+    pos = 0
+    for op, arg in ops:
+        if op == "=":
+            out += old_lines[pos:pos + arg]
+            pos += arg
+        elif op == "-":
+            pos += arg
+        else:
+            out += arg
+    return "".join(out)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PackWriter:
+    """Append compressed records to one discussion pack; returns their index entries."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.handle = path.open("wb")
+        self.offset = 0
+
+    def add(self, record: dict[str, Any]) -> dict[str, int]:
+        blob = zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"), 9)
+        self.handle.write(blob)
+        entry = {"offset": self.offset, "length": len(blob)}
+        self.offset += len(blob)
+        return entry
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def write_discussion(
+    output_dir: Path,
+    disc_meta: dict[str, Any],
+    initial_body: str,
+    revisions: list[str],
+    keyframe_interval: int = KEYFRAME_INTERVAL,
+) -> dict[str, Any]:
+    """Pack one discussion's revisions and fill in its snapshot and diff index.
+
+    disc_meta must already hold the snapshot entries (index, timestamp, ...),
+    one per revision; offsets, keyframe flags, hashes and diff stats are added.
+    """
+    pack_name = f"discussion_{disc_meta['number']:02d}.pack"
+    writer = PackWriter(output_dir / pack_name)
+    try:
+        disc_meta["pack"] = pack_name
+        disc_meta["initial"] = writer.add({"k": initial_body})
+        previous = ""
+        for i, (snapshot, body) in enumerate(zip(disc_meta["snapshots"], revisions)):
+            keyframe = i % keyframe_interval == 0
+            record = {"k": body} if keyframe else {"d": encode_delta(previous, body)}
+            snapshot.update(writer.add(record), keyframe=keyframe, sha256=_sha256(body), chars=len(body))
+            snapshot.pop("file", None)
+            previous = body
+    finally:
+        writer.close()
+
+    disc_meta["diffs"] = []
+    for i in range(1, len(revisions)):
+        old_label, new_label = diff_labels(disc_meta["snapshots"], i - 1)
+        diff_lines = compute_diff(revisions[i - 1], revisions[i], old_label, new_label)
+        disc_meta["diffs"].append(diff_entry(disc_meta["snapshots"], i - 1, diff_lines))
+    disc_meta["diff_count"] = len(disc_meta["diffs"])
+    return disc_meta
+
+
+class EditCorpus:
+    """Indexed reader for a polishing corpus (delta-chain packs or the older file layout)."""
+
+    def __init__(self, root: Path | str = DEFAULT_CORPUS) -> None:
+        self.root = Path(root)
+        manifest_path = self.root / "manifest.json"
+        if not manifest_path.exists():
+            raise SystemExit(f"Corpus manifest not found: {manifest_path}")
+        self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.packed = self.manifest.get("format") == FORMAT
+        self._by_number = {d["number"]: d for d in self.manifest["discussions"]}
+        self._handles: dict[int, Any] = {}
+        self._last: dict[int, tuple[int, str]] = {}
+
+    def discussions(self) -> list[dict[str, Any]]:
+        return self.manifest["discussions"]
+
+    def discussion(self, number: int) -> dict[str, Any]:
+        try:
+            return self._by_number[number]
+        except KeyError:
+            raise SystemExit(f"Discussion not in corpus: {number}") from None
+
+    def _record(self, number: int, entry: dict[str, int]) -> dict[str, Any]:
+        handle = self._handles.get(number)
+        if handle is None:
+            handle = self._handles[number] = (self.root / self.discussion(number)["pack"]).open("rb")
+        handle.seek(entry["offset"])
+        return json.loads(zlib.decompress(handle.read(entry["length"])))
+
+    def _legacy_dir(self, number: int) -> Path:
+        return self.root / f"discussion_{number:02d}"
+
+    def initial(self, number: int) -> str:
+        disc = self.discussion(number)
+        if not self.packed:
+            return (self._legacy_dir(number) / "initial.md").read_text(encoding="utf-8")
+        return self._record(number, disc["initial"])["k"]
+
+    def revision(self, number: int, index: int) -> str:
+        """Rebuild one revision from its nearest keyframe (bounded delta replay)."""
+        disc = self.discussion(number)
+        snapshots = disc["snapshots"]
+        if not 0 <= index < len(snapshots):
+            raise SystemExit(f"Discussion {number} has no revision {index} (0..{len(snapshots) - 1})")
+        if not self.packed:
+            return (self._legacy_dir(number) / snapshots[index]["file"]).read_text(encoding="utf-8")
+        # Sequential readers (diff i-1 -> i) reuse the previous revision.
+        last = self._last.get(number)
+        if last is not None and last[0] <= index and not any(s["keyframe"] for s in snapshots[last[0] + 1:index + 1]):
+            start, text = last
+        else:
+            start = index
+            while not snapshots[start]["keyframe"]:
+                start -= 1
+            text = self._record(number, snapshots[start])["k"]
+        for i in range(start + 1, index + 1):
+            text = apply_delta(text, self._record(number, snapshots[i])["d"])
+        self._last[number] = (index, text)
+        return text
+
+    def final(self, number: int) -> str:
+        return self.revision(number, len(self.discussion(number)["snapshots"]) - 1)
+
+    def diff(self, number: int, from_index: int) -> str:
+        """Unified diff between revision from_index and the next one."""
+        disc = self.discussion(number)
+        if not self.packed:
+            entry = next((d for d in disc["diffs"] if d["from_revision"] == from_index), None)
+            if entry is None:
+                raise SystemExit(f"Discussion {number} has no diff from revision {from_index}")
+            return (self._legacy_dir(number) / entry["file"]).read_text(encoding="utf-8")
+        if not 0 <= from_index < len(disc["snapshots"]) - 1:
+            raise SystemExit(f"Discussion {number} has no diff from revision {from_index}")
+        old_label, new_label = diff_labels(disc["snapshots"], from_index)
+        old_text = self.revision(number, from_index)
+        new_text = self.revision(number, from_index + 1)
+        return "".join(compute_diff(old_text, new_text, old_label, new_label))
+
+    def iter_diffs(self) -> Iterator[tuple[dict[str, Any], dict[str, Any], str]]:
+        for disc in self.discussions():
+            for entry in disc["diffs"]:
+                yield disc, entry, self.diff(disc["number"], entry["from_revision"])
+
+    def close(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def __enter__(self) -> "EditCorpus":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def verify(corpus: EditCorpus) -> list[str]:
+    """Rebuild every revision and diff; return problems (hash mismatches, bad stats)."""
+    problems = []
+    for disc in corpus.discussions():
+        number = disc["number"]
+        for snapshot in disc["snapshots"]:
+            text = corpus.revision(number, snapshot["index"])
+            if "sha256" in snapshot and _sha256(text) != snapshot["sha256"]:
+                problems.append(f"#{number} revision {snapshot['index']}: sha256 mismatch")
+        for entry in disc["diffs"]:
+            lines = corpus.diff(number, entry["from_revision"]).splitlines(keepends=True)
+            if len(lines) != entry["diff_lines"]:
+                problems.append(f"#{number} diff {entry['from_revision']}: {len(lines)} lines, manifest says {entry['diff_lines']}")
+    return problems
+
+
+def convert(root: Path, keep_files: bool) -> dict[str, int]:
+    """Pack an older file-layout corpus into delta chains, in place."""
+    with EditCorpus(root) as corpus:
+        if corpus.packed:
+            raise SystemExit(f"Corpus is already {FORMAT}: {root}")
+        manifest = corpus.manifest
+        before = after = 0
+        for disc in manifest["discussions"]:
+            number = disc["number"]
+            disc_dir = corpus._legacy_dir(number)
+            files = [p for p in disc_dir.iterdir() if p.is_file()] if disc_dir.is_dir() else []
+            before += sum(p.stat().st_size for p in files)
+            revisions = [corpus.revision(number, s["index"]) for s in disc["snapshots"]]
+            write_discussion(root, disc, corpus.initial(number), revisions)
+            after += (root / disc["pack"]).stat().st_size
+            if not keep_files:
+                for path in files:
+                    path.unlink()
+                disc_dir.rmdir()
+    manifest["format"] = FORMAT
+    manifest["keyframe_interval"] = KEYFRAME_INTERVAL
+    (root / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    return {"discussions": len(manifest["discussions"]), "bytes_before": before, "bytes_after": after}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Polishing corpus reader / converter")
+    parser.add_argument("--root", default=str(DEFAULT_CORPUS), help="Corpus directory (default: benchmark/polishing)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Print discussion / snapshot / diff counts")
+    show = sub.add_parser("show", help="Print one revision")
+    show.add_argument("number", type=int)
+    show.add_argument("index", type=int)
+    diff = sub.add_parser("diff", help="Print the diff from one revision to the next")
+    diff.add_argument("number", type=int)
+    diff.add_argument("from_index", type=int)
+    sub.add_parser("verify", help="Rebuild every revision and diff and check them against the manifest")
+    conv = sub.add_parser("convert", help="Pack a file-layout corpus into delta chains")
+    conv.add_argument("--keep-files", action="store_true", help="Keep the revision_NN.md / diff files")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    root = Path(args.root)
+    if args.command == "convert":
+        stats = convert(root, args.keep_files)
+        print(f"discussions={stats['discussions']} bytes_before={stats['bytes_before']} bytes_after={stats['bytes_after']}")
+        return 0
+    with EditCorpus(root) as corpus:
+        if args.command == "stats":
+            m = corpus.manifest
+            print(f"format={m.get('format', 'files')} discussions={len(m['discussions'])} "
+                  f"snapshots={m['total_snapshots']} diffs={m['total_diffs']}")
+        elif args.command == "show":
+            sys.stdout.write(corpus.revision(args.number, args.index))
+        elif args.command == "diff":
+            sys.stdout.write(corpus.diff(args.number, args.from_index))
+        elif args.command == "verify":
+            problems = verify(corpus)
+            for problem in problems:
+                print(f"FAIL: {problem}")
+            print(f"verified {len(corpus.discussions())} discussions: {'OK' if not problems else f'{len(problems)} problem(s)'}")
+            return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
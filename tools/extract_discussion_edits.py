@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 """Extract discussion edit history from GitHub CustomerNewsletter repo.
 
-Uses the GraphQL API to fetch all revisions of each discussion,
-computes diffs between consecutive revisions, and stores as benchmark data.
+Uses the GraphQL API to fetch all revisions of each discussion and stores
+them as benchmark data in the delta-chain corpus format (one pack per
+discussion plus an indexed manifest; see tools/edit_corpus.py). Diffs between
+consecutive revisions are summarized in the manifest and rebuilt on demand
+through EditCorpus.diff().
 
-Usage: python3 tools/extract_discussion_edits.py [--output-dir benchmark/polishing]
+Usage: python3 tools/extract_discussion_edits.py [--output-dir benchmark/polishing] [--profile]
 Requires: gh CLI authenticated (uses `gh auth token`)
 """
 
 import argparse
-import difflib
 import json
 import subprocess
 import sys
 from pathlib import Path
 
+import profiling
+from edit_corpus import FORMAT, KEYFRAME_INTERVAL, write_discussion
+
 
 def get_gh_token():
     """Get GitHub token from gh CLI."""
@@ -97,41 +102,8 @@ def fetch_edits(token, owner, repo, discussion_number, page_size=50):
     return all_edits
 
 
-def compute_diff(old_text, new_text, old_label, new_label):
-    """Compute unified diff between two text revisions."""
-    old_lines = old_text.splitlines(keepends=True)
-    new_lines = new_text.splitlines(keepends=True)
-    return list(difflib.unified_diff(old_lines, new_lines,
-                                      fromfile=old_label, tofile=new_label))
-
-
-def classify_diff(diff_lines):
-    """Classify a diff into change types."""
-    additions = 0
-    deletions = 0
-    for line in diff_lines:
-        if line.startswith("+") and not line.startswith("+++"):
-            additions += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            deletions += 1
-
-    if additions > 0 and deletions == 0:
-        return "addition"
-    elif deletions > 0 and additions == 0:
-        return "removal"
-    elif additions > 0 and deletions > 0:
-        if abs(additions - deletions) <= 2:
-            return "rewrite"
-        elif additions > deletions * 2:
-            return "expansion"
-        elif deletions > additions * 2:
-            return "compression"
-        else:
-            return "mixed"
-    return "none"
-
-
 def main():
+    profiling.init("extract_discussion_edits")
     parser = argparse.ArgumentParser(description="Extract discussion edit history")
     parser.add_argument("--output-dir", default="benchmark/polishing",
                         help="Output directory for extracted data")
@@ -144,12 +116,15 @@ def main():
 
     token = get_gh_token()
     print("Fetching discussions...")
-    discussions = fetch_discussions(token, args.owner, args.repo)
+    with profiling.stage("fetch"):
+        discussions = fetch_discussions(token, args.owner, args.repo)
 
     manifest = {
         "extracted_at": subprocess.run(["date", "-u", "+%Y-%m-%dT%H:%M:%SZ"],
                                         capture_output=True, text=True).stdout.strip(),
         "repo": f"{args.owner}/{args.repo}",
+        "format": FORMAT,
+        "keyframe_interval": KEYFRAME_INTERVAL,
         "discussions": [],
         "total_snapshots": 0,
         "total_diffs": 0,
@@ -162,13 +137,7 @@ def main():
 
         print(f"  #{num}: {title} ({edit_count} edits)")
 
-        disc_dir = output_dir / f"discussion_{num:02d}"
-        disc_dir.mkdir(exist_ok=True)
-
-        # Save initial body
         initial_body = disc["body"]
-        (disc_dir / "initial.md").write_text(initial_body)
-
         disc_meta = {
             "number": num,
             "title": title,
@@ -183,73 +152,36 @@ def main():
             disc_meta["snapshots"].append({
                 "index": 0,
                 "timestamp": disc["createdAt"],
-                "file": "initial.md",
             })
-            manifest["total_snapshots"] += 1
+            revisions = [initial_body]
         else:
             # Fetch all edits (returned newest-first)
-            edits = fetch_edits(token, args.owner, args.repo, num)
+            with profiling.stage("fetch"):
+                edits = fetch_edits(token, args.owner, args.repo, num)
             # Reverse to chronological order (oldest first)
             edits.reverse()
 
+            revisions = []
             for i, edit in enumerate(edits):
-                snapshot_file = f"revision_{i:02d}.md"
-                body = edit["diff"] if edit["diff"] else initial_body
-                (disc_dir / snapshot_file).write_text(body)
-
+                revisions.append(edit["diff"] if edit["diff"] else initial_body)
                 disc_meta["snapshots"].append({
                     "index": i,
                     "timestamp": edit["editedAt"],
                     "editor": edit["editor"]["login"] if edit["editor"] else "unknown",
-                    "file": snapshot_file,
-                    "chars": len(body),
                 })
 
-            # Save final version
-            if edits:
-                final_body = edits[-1]["diff"] if edits[-1]["diff"] else initial_body
-                (disc_dir / "final.md").write_text(final_body)
-
-            # Compute diffs between consecutive revisions
-            for i in range(1, len(edits)):
-                old_body = edits[i-1]["diff"] if edits[i-1]["diff"] else initial_body
-                new_body = edits[i]["diff"] if edits[i]["diff"] else initial_body
-
-                diff_lines = compute_diff(
-                    old_body, new_body,
-                    f"revision_{i-1:02d} ({edits[i-1]['editedAt']})",
-                    f"revision_{i:02d} ({edits[i]['editedAt']})"
-                )
-
-                diff_file = f"diff_{i-1:02d}_to_{i:02d}.diff"
-                (disc_dir / diff_file).write_text("".join(diff_lines))
-
-                change_type = classify_diff(diff_lines)
-                additions = sum(1 for l in diff_lines if l.startswith("+") and not l.startswith("+++"))
-                deletions = sum(1 for l in diff_lines if l.startswith("-") and not l.startswith("---"))
-
-                disc_meta["diffs"].append({
-                    "from_revision": i - 1,
-                    "to_revision": i,
-                    "from_timestamp": edits[i-1]["editedAt"],
-                    "to_timestamp": edits[i]["editedAt"],
-                    "file": diff_file,
-                    "change_type": change_type,
-                    "additions": additions,
-                    "deletions": deletions,
-                    "diff_lines": len(diff_lines),
-                })
-
-            disc_meta["diff_count"] = len(edits) - 1 if len(edits) > 1 else 0
-            manifest["total_snapshots"] += len(edits)
-            manifest["total_diffs"] += disc_meta["diff_count"]
+        with profiling.stage("extract"):
+            write_discussion(output_dir, disc_meta, initial_body, revisions)
+        manifest["total_snapshots"] += len(revisions)
+        manifest["total_diffs"] += disc_meta["diff_count"]
 
         manifest["discussions"].append(disc_meta)
 
     # Write manifest
-    (output_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2) + "\n"
-    )
+    with profiling.stage("write"):
+        (output_dir / "manifest.json").write_text(
+            json.dumps(manifest, indent=2) + "\n"
+        )
 
     print(f"\nExtraction complete:")
     print(f"  Discussions: {len(manifest['discussions'])}")
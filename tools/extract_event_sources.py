@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 """Deterministically extract Phase 2 candidate event URLs.
 
+Each deeplink candidate is then enriched concurrently (title, dates and
+format from JSON-LD / meta tags, cached under .cache/event_pages/) and
+events that end before START_DATE or start after END_DATE + horizon are
+dropped with a recorded reason. candidate_urls keeps every discovered
+deeplink for provenance; enriched_events is the shortlist for curation.
+
+Candidates do not depend on the date range (only the window filter does),
+so a backfill over several cycles (--range, repeatable) crawls each source
+page and enriches each deeplink once, concurrently, then writes one artifact
+per range with the same content individual runs would produce.
+
 Usage:
-  python3 tools/extract_event_sources.py START_DATE END_DATE
+  python3 tools/extract_event_sources.py START_DATE END_DATE [--horizon-days 60] [--no-enrich]
+  python3 tools/extract_event_sources.py --range START_DATE END_DATE [--range START_DATE END_DATE ...]
 
 Output:
-  workspace/newsletter_phase2_event_sources_<END_DATE>.json
+  workspace/newsletter_phase2_event_sources_<END_DATE>.json (one per range)
 """
 
 from __future__ import annotations
@@ -13,25 +25,61 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import glob
+import hashlib
+import html
 import json
 import re
 import sys
-import urllib.error
-import urllib.request
+import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
+import paths
+import profiling
+from kb_index import KBIndexError, load_document
+
+if TYPE_CHECKING:
+    from http_pool import HttpPool
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "kb" / "EVENT_SOURCES.yaml"
 WORKSPACE = ROOT / "workspace"
+CACHE_DIR = paths.CACHE_DIR / "event_pages"
+
+# Newsletters list upcoming events, so the window runs past END_DATE.
+DEFAULT_HORIZON_DAYS = 60
+DEFAULT_CACHE_TTL_HOURS = 24
+USER_AGENT = "Mozilla/5.0 (compatible; newsletter-event-extractor/1.0)"
+# Start a second request for a page once it is slower than 90% of recent fetches.
+HEDGE_PERCENTILE = 0.9
+
+JSON_LD_RE = re.compile(
+    r"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+META_RE = re.compile(r"<meta\s+([^>]+?)/?>", re.IGNORECASE)
+ATTR_RE = re.compile(r"([a-zA-Z:_-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+TIME_RE = re.compile(r"<time[^>]+datetime=[\"']([^\"']+)[\"']", re.IGNORECASE)
+ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+ATTENDANCE_FORMATS = {
+    "onlineeventattendancemode": "Virtual",
+    "offlineeventattendancemode": "In-person",
+    "mixedeventattendancemode": "Hybrid",
+}
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Extract deterministic event-source candidates")
-    parser.add_argument("start", help="Start date (YYYY-MM-DD)")
-    parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    parser.add_argument("start", nargs="?", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end", nargs="?", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--range", nargs=2, action="append", default=[], metavar=("START", "END"), dest="ranges",
+                        help="Backfill another cycle from the same crawl (repeatable)")
+    parser.add_argument("--horizon-days", type=int, default=DEFAULT_HORIZON_DAYS,
+                        help="Keep events starting up to this many days after END_DATE")
+    parser.add_argument("--no-enrich", action="store_true", help="Skip event-page enrichment (offline)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent source and enrichment fetches")
+    parser.add_argument("--cache-ttl-hours", type=float, default=DEFAULT_CACHE_TTL_HOURS)
     return parser.parse_args()
 
 
@@ -46,49 +94,26 @@ def validate_date(value: str) -> str:
 def load_config(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise SystemExit(f"Config file not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise SystemExit(f"Config must be a mapping: {path}")
-    return data
-
-
-def fetch_text(url: str, timeout: int = 30) -> dict[str, Any]:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (compatible; newsletter-event-extractor/1.0)",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        },
-    )
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            status = getattr(resp, "status", 200)
-            raw = resp.read()
-            encoding = resp.headers.get_content_charset() or "utf-8"
-            text = raw.decode(encoding, errors="ignore")
-            return {
-                "fetch_ok": True,
-                "status_code": int(status),
-                "bytes": len(raw),
-                "text": text,
-                "error": "",
-            }
-    except urllib.error.HTTPError as exc:
-        return {
-            "fetch_ok": False,
-            "status_code": int(exc.code),
-            "bytes": 0,
-            "text": "",
-            "error": f"HTTPError: {exc}",
-        }
-    except Exception as exc:  # noqa: BLE001
-        return {
-            "fetch_ok": False,
-            "status_code": 0,
-            "bytes": 0,
-            "text": "",
-            "error": f"FetchError: {exc}",
-        }
+        return load_document(path)
+    except KBIndexError as exc:
+        raise SystemExit(f"Invalid config: {exc}") from exc
+
+
+def fetch_text(pool: HttpPool, url: str) -> dict[str, Any]:
+    """Fetch a source page under the shared pool's retry / hedging / circuit-breaker policy."""
+    from http_pool import decode_body
+
+    fetch = pool.get(url)
+    return {
+        "fetch_ok": fetch["fetch_ok"],
+        "status_code": fetch["status_code"],
+        "bytes": fetch["bytes"],
+        "text": decode_body(fetch) if fetch["fetch_ok"] else "",
+        "error": fetch["error"],
+        "attempts": fetch["attempts"],
+        "skipped": fetch["skipped"],
+    }
 
 
 def normalize_url(url: str) -> str:
@@ -129,6 +154,190 @@ def extract_reactor_event_deeplinks(text: str) -> set[str]:
     return found
 
 
+def _iter_json_ld(node: Any) -> Any:
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_json_ld(item)
+    elif isinstance(node, dict):
+        yield node
+        for key in ("@graph", "subEvent", "itemListElement"):
+            if key in node:
+                yield from _iter_json_ld(node[key])
+
+
+def _is_event(node: dict[str, Any]) -> bool:
+    types = node.get("@type", [])
+    if isinstance(types, str):
+        types = [types]
+    return any(isinstance(t, str) and t.endswith("Event") for t in types)
+
+
+def _as_date(value: Any) -> str:
+    match = ISO_DATE_RE.search(value) if isinstance(value, str) else None
+    if not match:
+        return ""
+    try:
+        return dt.date.fromisoformat(match.group(1)).isoformat()
+    except ValueError:
+        return ""
+
+
+def _event_format(node: dict[str, Any]) -> str:
+    mode = node.get("eventAttendanceMode", "")
+    if isinstance(mode, str) and mode:
+        fmt = ATTENDANCE_FORMATS.get(mode.rsplit("/", 1)[-1].lower())
+        if fmt:
+            return fmt
+    locations = node.get("location", [])
+    if isinstance(locations, dict):
+        locations = [locations]
+    kinds = {loc.get("@type") for loc in locations if isinstance(loc, dict)} if isinstance(locations, list) else set()
+    if "VirtualLocation" in kinds and ("Place" in kinds or "PostalAddress" in kinds):
+        return "Hybrid"
+    if "VirtualLocation" in kinds:
+        return "Virtual"
+    if "Place" in kinds:
+        return "In-person"
+    return ""
+
+
+def extract_event_metadata(text: str) -> dict[str, str]:
+    """Title, start/end date and format from JSON-LD Event data, then meta tags."""
+    meta: dict[str, str] = {"title": "", "start_date": "", "end_date": "", "format": "", "date_source": ""}
+
+    for block in JSON_LD_RE.findall(text):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            continue
+        for node in _iter_json_ld(data):
+            if not _is_event(node):
+                continue
+            meta["title"] = html.unescape(str(node.get("name", ""))).strip()
+            meta["start_date"] = _as_date(node.get("startDate"))
+            meta["end_date"] = _as_date(node.get("endDate")) or meta["start_date"]
+            meta["format"] = _event_format(node)
+            meta["date_source"] = "json-ld" if meta["start_date"] else ""
+            break
+        if meta["start_date"]:
+            break
+
+    tags: dict[str, str] = {}
+    for raw in META_RE.findall(text):
+        attrs = {k.lower(): (a if a else b) for k, a, b in ATTR_RE.findall(raw)}
+        key = attrs.get("property") or attrs.get("name") or attrs.get("itemprop")
+        if key and "content" in attrs:
+            tags.setdefault(key.lower(), html.unescape(attrs["content"]).strip())
+
+    if not meta["title"]:
+        title = TITLE_RE.search(text)
+        meta["title"] = tags.get("og:title") or tags.get("twitter:title") or (
+            html.unescape(" ".join(title.group(1).split())) if title else ""
+        )
+    if not meta["start_date"]:
+        for key in ("startdate", "event:start_time", "event:start_date"):
+            if _as_date(tags.get(key)):
+                meta["start_date"] = _as_date(tags[key])
+                meta["end_date"] = _as_date(tags.get(key.replace("start", "end"))) or meta["start_date"]
+                meta["date_source"] = "meta"
+                break
+    if not meta["start_date"]:
+        times = sorted(filter(None, (_as_date(v) for v in TIME_RE.findall(text))))
+        if times:
+            meta["start_date"], meta["end_date"] = times[0], times[-1]
+            meta["date_source"] = "time-tag"
+    return meta
+
+
+def classify_event_window(meta: dict[str, str], start: str, end: str, horizon_days: int) -> tuple[bool, str]:
+    """Return (keep, reason); events without a parseable date are kept for manual review."""
+    if not meta.get("start_date"):
+        return True, "date unknown"
+    latest = (dt.date.fromisoformat(end) + dt.timedelta(days=horizon_days)).isoformat()
+    if (meta.get("end_date") or meta["start_date"]) < start:
+        return False, f"ended {meta.get('end_date') or meta['start_date']}, before window start {start}"
+    if meta["start_date"] > latest:
+        return False, f"starts {meta['start_date']}, after window end {latest} (END + {horizon_days}d)"
+    return True, "in window"
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+
+def enrich_candidate(pool: HttpPool, url: str, ttl_s: float) -> dict[str, Any]:
+    """Fetch one event page (TTL-cached) and return its metadata plus fetch status."""
+    from http_pool import decode_body
+
+    path = _cache_path(url)
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if time.time() - cached.get("fetched_at", 0) < ttl_s:
+            return {**cached["result"], "cache": "hit"}
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with profiling.stage("fetch"):
+        fetch = pool.get(url)
+    result: dict[str, Any] = {
+        "fetch_ok": fetch["fetch_ok"],
+        "status_code": fetch["status_code"],
+        "error": fetch["error"],
+        "skipped": fetch["skipped"],
+    }
+    if fetch["fetch_ok"]:
+        with profiling.stage("extract"):
+            result.update(extract_event_metadata(decode_body(fetch)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"url": url, "fetched_at": time.time(), "result": result}) + "\n", encoding="utf-8")
+    return {**result, "cache": "miss"}
+
+
+def enrich_candidates(
+    pool: HttpPool,
+    candidate_urls: list[dict[str, Any]],
+    workers: int,
+    ttl_hours: float,
+) -> list[dict[str, Any]]:
+    """Concurrently enrich candidates; metadata per candidate, in order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda c: enrich_candidate(pool, c["url"], ttl_hours * 3600), candidate_urls))
+
+
+def classify_events(
+    candidate_urls: list[dict[str, Any]],
+    results: list[dict[str, Any]],
+    start: str,
+    end: str,
+    horizon_days: int,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Apply one range's event window; return (kept events, dropped events with reasons)."""
+    kept: list[dict[str, Any]] = []
+    dropped: list[dict[str, Any]] = []
+    for item, meta in zip(candidate_urls, results):
+        event = {
+            "url": item["url"],
+            "source_types": item["source_types"],
+            "title": meta.get("title", ""),
+            "start_date": meta.get("start_date", ""),
+            "end_date": meta.get("end_date", ""),
+            "format": meta.get("format", ""),
+            "date_source": meta.get("date_source", ""),
+            "fetch_ok": meta["fetch_ok"],
+            "error": meta["error"],
+            "skipped": meta.get("skipped", False),
+        }
+        keep, reason = classify_event_window(meta, start, end, horizon_days)
+        if not meta["fetch_ok"]:
+            keep, reason = True, f"fetch failed ({meta['error']}); review manually"
+        event["reason"] = reason
+        (kept if keep else dropped).append(event)
+    kept.sort(key=lambda e: (e["start_date"] or "9999", e["url"]))
+    return kept, dropped
+
+
 def load_curator_note_paths(config: dict[str, Any]) -> list[Path]:
     notes_cfg = config.get("curator_notes", {})
     if not isinstance(notes_cfg, dict):
@@ -189,14 +398,29 @@ def add_candidate(
     entry["source_names"].add(source_name)
 
 
-def main() -> int:
-    args = parse_args()
-    start = validate_date(args.start)
-    end = validate_date(args.end)
-    # Date range is metadata/provenance for this deterministic candidate artifact.
-    # Phase 2 filtering and final curation happen downstream.
+def web_source(name: str, url: str, fetch: dict[str, Any], candidates: list[str]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "kind": "web",
+        "url_or_path": url,
+        "fetch_ok": fetch["fetch_ok"],
+        "status_code": fetch["status_code"],
+        "bytes": fetch["bytes"],
+        "error": fetch["error"],
+        "attempts": fetch["attempts"],
+        "skipped": fetch["skipped"],
+        "candidate_urls": candidates,
+    }
+
 
-    config = load_config(CONFIG_PATH)
+def collect_sources(
+    pool: HttpPool, config: dict[str, Any], workers: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch every source once (concurrently) and merge deeplinks; (sources, candidate_urls).
+
+    Nothing here depends on the date range, so one call serves any number of cycles.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
     github_resources_url = config.get("github_resources_events_url", "")
     reactor_series_seed_urls = config.get("reactor_series_seed_urls", [])
@@ -206,55 +430,36 @@ def main() -> int:
     if not isinstance(reactor_series_seed_urls, list):
         raise SystemExit("reactor_series_seed_urls must be a list in kb/EVENT_SOURCES.yaml")
 
-    WORKSPACE.mkdir(parents=True, exist_ok=True)
-    out_path = WORKSPACE / f"newsletter_phase2_event_sources_{end}.json"
+    # Source 1 is the GitHub Resources events page, 2..N the Reactor series pages.
+    reactor_pages = [
+        (f"reactor_series_{index}", url)
+        for index, url in enumerate(reactor_series_seed_urls, start=1)
+        if isinstance(url, str) and url
+    ]
+    page_urls = [github_resources_url] + [url for _, url in reactor_pages]
+    with profiling.stage("fetch"), ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        fetches = list(executor.map(lambda url: fetch_text(pool, url), page_urls))
 
     merged: dict[str, dict[str, Any]] = {}
     sources: list[dict[str, Any]] = []
 
-    # Source 1: GitHub Resources events page
-    github_fetch = fetch_text(github_resources_url)
-    github_candidates = (
-        sorted(extract_github_resources_deeplinks(github_fetch["text"]))
-        if github_fetch["fetch_ok"]
-        else []
-    )
+    github_fetch = fetches[0]
+    with profiling.stage("extract"):
+        github_candidates = (
+            sorted(extract_github_resources_deeplinks(github_fetch["text"]))
+            if github_fetch["fetch_ok"]
+            else []
+        )
     for url in github_candidates:
         add_candidate(merged, url, "github_resources", "github_resources_events")
-    sources.append(
-        {
-            "name": "github_resources_events",
-            "kind": "web",
-            "url_or_path": github_resources_url,
-            "fetch_ok": github_fetch["fetch_ok"],
-            "status_code": github_fetch["status_code"],
-            "bytes": github_fetch["bytes"],
-            "error": github_fetch["error"],
-            "candidate_urls": github_candidates,
-        }
-    )
+    sources.append(web_source("github_resources_events", github_resources_url, github_fetch, github_candidates))
 
-    # Source 2..N: Reactor series pages
-    for index, series_url in enumerate(reactor_series_seed_urls, start=1):
-        if not isinstance(series_url, str) or not series_url:
-            continue
-        fetch = fetch_text(series_url)
-        candidates = sorted(extract_reactor_event_deeplinks(fetch["text"])) if fetch["fetch_ok"] else []
-        source_name = f"reactor_series_{index}"
+    for (source_name, series_url), fetch in zip(reactor_pages, fetches[1:]):
+        with profiling.stage("extract"):
+            candidates = sorted(extract_reactor_event_deeplinks(fetch["text"])) if fetch["fetch_ok"] else []
         for url in candidates:
             add_candidate(merged, url, "reactor", source_name)
-        sources.append(
-            {
-                "name": source_name,
-                "kind": "web",
-                "url_or_path": series_url,
-                "fetch_ok": fetch["fetch_ok"],
-                "status_code": fetch["status_code"],
-                "bytes": fetch["bytes"],
-                "error": fetch["error"],
-                "candidate_urls": candidates,
-            }
-        )
+        sources.append(web_source(source_name, series_url, fetch, candidates))
 
     # Source: Curator notes (optional)
     notes_cfg = config.get("curator_notes", {})
@@ -281,7 +486,8 @@ def main() -> int:
             )
             continue
 
-        candidates = sorted(extract_curator_urls(text, allowed_patterns))
+        with profiling.stage("extract"):
+            candidates = sorted(extract_curator_urls(text, allowed_patterns))
         source_name = f"curator_note::{path.name}"
         for url in candidates:
             add_candidate(merged, url, "curator", source_name)
@@ -309,28 +515,90 @@ def main() -> int:
                 "source_names": sorted(entry["source_names"]),
             }
         )
+    return sources, candidate_urls
+
+
+def parse_ranges(args: argparse.Namespace) -> list[tuple[str, str]]:
+    if (args.start is None) != (args.end is None):
+        raise SystemExit("START_DATE and END_DATE must be given together")
+    ranges = [(args.start, args.end)] if args.start is not None else []
+    ranges += [tuple(pair) for pair in args.ranges]
+    if not ranges:
+        raise SystemExit("Give START_DATE END_DATE and/or --range START_DATE END_DATE")
+    for start, end in ranges:
+        validate_date(start)
+        validate_date(end)
+        if end < start:
+            raise SystemExit(f"END_DATE must not be before START_DATE ({start} {end})")
+    ends = [end for _, end in ranges]
+    if len(set(ends)) != len(ends):
+        raise SystemExit("Each range needs a distinct END_DATE (outputs are named by END_DATE)")
+    return ranges
 
-    payload = {
-        "schema_version": int(config.get("schema_version", 1)),
-        "generated_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "start": start,
-        "end": end,
-        "config_path": str(CONFIG_PATH.relative_to(ROOT)),
-        "sources": sources,
-        "candidate_urls": candidate_urls,
-    }
 
-    out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+def main() -> int:
+    profiling.init("extract_event_sources")
+    args = parse_args()
+    ranges = parse_ranges(args)
+
+    with profiling.stage("config_load"):
+        config = load_config(CONFIG_PATH)
+
+    WORKSPACE.mkdir(parents=True, exist_ok=True)
+
+    from http_pool import HttpPool
+
+    # One pool for source pages and enrichment, so a failing host trips its
+    # circuit breaker once and later URLs on it are skipped, not timed out.
+    pool = HttpPool(timeout=30, user_agent=USER_AGENT, hedge_percentile=HEDGE_PERCENTILE)
+    sources, candidate_urls = collect_sources(pool, config, args.workers)
+
+    enrichment: list[dict[str, Any]] = []
+    if not args.no_enrich:
+        with profiling.stage("enrich"):
+            enrichment = enrich_candidates(pool, candidate_urls, args.workers, args.cache_ttl_hours)
+    pool.close()
 
     github_count = sum(1 for item in candidate_urls if "github_resources" in item["source_types"])
     reactor_count = sum(1 for item in candidate_urls if "reactor" in item["source_types"])
     curator_count = sum(1 for item in candidate_urls if "curator" in item["source_types"])
 
-    print(f"Wrote {out_path}")
-    print(
-        "Candidate summary: "
-        f"total={len(candidate_urls)} github_resources={github_count} reactor={reactor_count} curator={curator_count}"
-    )
+    for start, end in ranges:
+        enriched_events: list[dict[str, Any]] = []
+        dropped_events: list[dict[str, Any]] = []
+        if not args.no_enrich:
+            enriched_events, dropped_events = classify_events(
+                candidate_urls, enrichment, start, end, args.horizon_days
+            )
+
+        payload = {
+            "schema_version": int(config.get("schema_version", 1)),
+            "generated_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "start": start,
+            "end": end,
+            "config_path": str(CONFIG_PATH.relative_to(ROOT)),
+            "sources": sources,
+            "candidate_urls": candidate_urls,
+            "event_window": {
+                "start": start,
+                "end": (dt.date.fromisoformat(end) + dt.timedelta(days=args.horizon_days)).isoformat(),
+                "enriched": not args.no_enrich,
+            },
+            "enriched_events": enriched_events,
+            "dropped_events": dropped_events,
+        }
+
+        out_path = WORKSPACE / f"newsletter_phase2_event_sources_{end}.json"
+        with profiling.stage("write"):
+            out_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+        print(f"Wrote {out_path}")
+        print(
+            "Candidate summary: "
+            f"total={len(candidate_urls)} github_resources={github_count} reactor={reactor_count} curator={curator_count}"
+        )
+        if not args.no_enrich:
+            print(f"Enrichment summary: kept={len(enriched_events)} dropped={len(dropped_events)}")
     return 0
 
 
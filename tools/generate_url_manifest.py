@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Deterministically generate the Phase 1A URL manifest.
+
+Expands per-source URL templates (see
+.github/skills/url-manifest/references/url-patterns.md) over the DATE_RANGE:
+monthly changelog pages, paginated blog/API listings, VS Code release-note
+version sequences and RSS/Atom feed entries from kb/SOURCES.yaml. Every
+candidate is then validated concurrently over a keep-alive pool.
+
+Usage:
+  python3 tools/generate_url_manifest.py START_DATE END_DATE [--workers N] [--no-validate] [--from-store] [--no-store]
+
+Output:
+  workspace/newsletter_phase1a_url_manifest_<START>_to_<END>.md
+  workspace/newsletter_phase1a_url_manifest_<START>_to_<END>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import math
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+from http_pool import HttpPool, decode_body
+from item_store import ItemStore, utc_day
+from kb_index import SOURCES_PATH, load_sources_index
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKSPACE = ROOT / "workspace"
+POLL_SCRIPTS = ROOT / ".github" / "skills" / "kb-maintenance" / "scripts"
+
+VSCODE_RELEASE_URL = "https://code.visualstudio.com/updates/v1_{minor}"
+VSCODE_RELEASE_DATE_RE = re.compile(r"Release date:\s*([A-Z][a-z]+ \d{1,2}, \d{4})")
+
+# Static/templated sources from url-patterns.md, in manifest order.
+TEMPLATES: list[dict[str, Any]] = [
+    {"source": "GitHub Changelog", "kind": "monthly", "pattern": "https://github.blog/changelog/{year}/{month:02d}/"},
+    {"source": "GitHub Blog", "kind": "pages", "pattern": "https://github.blog/latest/page/{page}/", "pages_per_30_days": 2, "min_pages": 3},
+    {"source": "GitHub Blog", "kind": "static", "urls": ["https://github.blog/news-insights/company-news/"]},
+    {"source": "VS Code", "kind": "static", "urls": ["https://code.visualstudio.com/updates"]},
+    {"source": "VS Code", "kind": "vscode_versions", "kb_id": "vscode_updates"},
+    {"source": "Visual Studio", "kind": "static", "urls": [
+        "https://learn.microsoft.com/en-us/visualstudio/releases/2026/release-notes",
+        "https://learn.microsoft.com/en-us/visualstudio/releases/2022/release-notes",
+        "https://devblogs.microsoft.com/visualstudio/",
+    ]},
+    {"source": "Azure DevOps", "kind": "static", "urls": ["https://devblogs.microsoft.com/devops/"]},
+    {"source": "JetBrains", "kind": "pages", "pattern": "https://plugins.jetbrains.com/api/plugins/17718/updates?page={page}&size=8", "pages_per_30_days": 2, "min_pages": 2},
+    {"source": "Xcode", "kind": "static", "urls": ["https://github.com/github/CopilotForXcode/blob/main/CHANGELOG.md"]},
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the Phase 1A URL manifest")
+    parser.add_argument("start", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent validation workers")
+    parser.add_argument("--no-validate", action="store_true", help="Skip existence checks (offline)")
+    parser.add_argument("--no-feeds", action="store_true", help="Skip RSS/Atom feed entry expansion")
+    parser.add_argument("--from-store", action="store_true",
+                        help="Read feed entries from the local item store instead of fetching feeds")
+    parser.add_argument("--no-store", action="store_true",
+                        help="Do not ingest fetched feed entries into the item store (kb/items.sqlite)")
+    return parser.parse_args()
+
+
+def validate_date(value: str) -> dt.date:
+    try:
+        return dt.datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise SystemExit(f"Invalid date '{value}', expected YYYY-MM-DD") from exc
+
+
+def months_in_range(start: dt.date, end: dt.date) -> list[tuple[int, int]]:
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def candidate(source: str, url: str, kind: str, expected: str = "", **extra: Any) -> dict[str, Any]:
+    return {"source": source, "url": url, "kind": kind, "expected": expected, **extra}
+
+
+def expand_templates(start: dt.date, end: dt.date, index: Any) -> list[dict[str, Any]]:
+    days = (end - start).days + 1
+    out: list[dict[str, Any]] = []
+    for tpl in TEMPLATES:
+        kind = tpl["kind"]
+        if kind == "monthly":
+            for year, month in months_in_range(start, end):
+                out.append(candidate(tpl["source"], tpl["pattern"].format(year=year, month=month),
+                                     kind, f"{year}-{month:02d}"))
+        elif kind == "pages":
+            pages = max(tpl["min_pages"], math.ceil(days / 30 * tpl["pages_per_30_days"]))
+            for page in range(1, pages + 1):
+                out.append(candidate(tpl["source"], tpl["pattern"].format(page=page), kind, f"page {page}"))
+        elif kind == "static":
+            for url in tpl["urls"]:
+                out.append(candidate(tpl["source"], url, kind))
+        elif kind == "vscode_versions":
+            out.extend(expand_vscode_versions(tpl, start, end, index))
+    return out
+
+
+def expand_vscode_versions(tpl: dict[str, Any], start: dt.date, end: dt.date, index: Any) -> list[dict[str, Any]]:
+    """Version sequence around the last known release, sized for weekly cadence."""
+    source = index.get(tpl["kb_id"]) or {}
+    latest = (source.get("latest_known") or {})
+    version = str(latest.get("version", ""))
+    match = re.match(r"1\.(\d+)", version)
+    if not match:
+        return []
+    latest_minor = int(match.group(1))
+    try:
+        anchor = dt.datetime.strptime(str(latest.get("release_date", "")), "%Y-%m-%d").date()
+    except ValueError:
+        anchor = end
+
+    # Weekly cadence: one version per 7 days, plus two on each side for slack.
+    before = max(0, math.ceil((anchor - start).days / 7)) + 2
+    after = max(0, math.ceil((end - anchor).days / 7)) + 2
+    lo, hi = max(1, latest_minor - before), latest_minor + after
+    return [
+        candidate(tpl["source"], VSCODE_RELEASE_URL.format(minor=minor), "vscode_version",
+                  f"v1.{minor}", version=f"1.{minor}", probe_date=True)
+        for minor in range(lo, hi + 1)
+    ]
+
+
+def expand_feed_entries(
+    pool: HttpPool, start: dt.date, end: dt.date, index: Any, workers: int, ingest: bool = True
+) -> list[dict[str, Any]]:
+    """Fetch every RSS/Atom feed once and keep entries dated (UTC) inside the range."""
+    sys.path.insert(0, str(POLL_SCRIPTS))
+    from poll_sources import parse_date_flexible, parse_rss_entries
+
+    feeds = [f for f in index.pollable if f["feed_type"] in ("rss", "atom")]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = list(executor.map(lambda f: pool.get(f["feed_url"]), feeds))
+
+    out: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    with ItemStore() if ingest else nullcontext() as store:
+        for feed, result in zip(feeds, fetched):
+            if not result["fetch_ok"]:
+                continue
+            entries, _ = parse_rss_entries(decode_body(result), "")
+            if store is not None:
+                store.ingest(feed["id"], entries, parse_date_flexible)
+            for entry in entries:
+                link = (entry.get("link") or "").strip()
+                when = parse_date_flexible(entry.get("date", ""))
+                if not link or link in seen or when is None:
+                    continue
+                day = utc_day(when)
+                if not start <= day <= end:
+                    continue
+                seen.add(link)
+                out.append(candidate(feed["name"], link, "feed_entry", day.isoformat(),
+                                     title=entry.get("title", ""), feed_id=feed["id"]))
+    return out
+
+
+def feed_entries_from_store(start: dt.date, end: dt.date, index: Any) -> list[dict[str, Any]]:
+    """Same candidates as expand_feed_entries(), read from kb/items.sqlite."""
+    names = {f["id"]: f["name"] for f in index.pollable if f["feed_type"] in ("rss", "atom")}
+    with ItemStore() as store:
+        rows = store.items(start, end, names)
+    out: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for row in rows:
+        if not row["link"] or row["link"] in seen:
+            continue
+        seen.add(row["link"])
+        out.append(candidate(names[row["source_id"]], row["link"], "feed_entry", row["published"][:10],
+                             title=row["title"], feed_id=row["source_id"]))
+    return out
+
+
+def check_candidate(pool: HttpPool, item: dict[str, Any], start: dt.date, end: dt.date) -> dict[str, Any]:
+    if item.get("probe_date"):
+        # Release-note pages carry their actual release date; named months lag (L64).
+        result = pool.get(item["url"])
+        match = VSCODE_RELEASE_DATE_RE.search(decode_body(result)) if result["fetch_ok"] else None
+        if match:
+            released = dt.datetime.strptime(match.group(1), "%B %d, %Y").date()
+            item["release_date"] = released.isoformat()
+            item["in_scope"] = start <= released <= end
+    else:
+        result = pool.exists(item["url"])
+    item["status_code"] = result["status_code"]
+    item["ok"] = result["fetch_ok"]
+    item["error"] = result["error"]
+    if result["final_url"] and result["final_url"] != item["url"]:
+        item["final_url"] = result["final_url"]
+    return item
+
+
+def render_markdown(payload: dict[str, Any]) -> str:
+    start, end = payload["start"], payload["end"]
+    lines = [
+        "# Phase 1A URL Manifest",
+        f"**DATE_RANGE**: {start} to {end}",
+        f"**Reference Year**: {end[:4]}",
+        f"**Generated**: {payload['generated_at_utc'][:10]} (deterministic: tools/generate_url_manifest.py)",
+        "",
+        "## Coverage Summary",
+        "| Source | URLs | Valid | Failed | Unchecked |",
+        "|--------|------|-------|--------|-----------|",
+    ]
+    by_source: dict[str, list[dict[str, Any]]] = {}
+    for item in payload["candidates"]:
+        by_source.setdefault(item["source"], []).append(item)
+    for source, items in by_source.items():
+        valid = sum(1 for i in items if i.get("ok") is True)
+        failed = sum(1 for i in items if i.get("ok") is False)
+        lines.append(f"| {source} | {len(items)} | {valid} | {failed} | {len(items) - valid - failed} |")
+
+    lines += ["", "## Detailed URL Manifests", ""]
+    for number, (source, items) in enumerate(by_source.items(), start=1):
+        lines += [f"### {number}. {source}", "", "| URL | Expected | Status |", "|-----|----------|--------|"]
+        for item in items:
+            if item.get("ok") is None:
+                status = "UNCHECKED"
+            elif not item["ok"]:
+                status = f"FAILED ({item['status_code'] or item['error']})"
+            elif "in_scope" in item:
+                status = f"{'IN SCOPE' if item['in_scope'] else 'OUT OF SCOPE'} (released {item['release_date']})"
+            else:
+                status = f"OK ({item['status_code']})"
+            expected = item["expected"]
+            if item.get("title"):
+                expected = f"{expected} {item['title']}".strip()
+            lines.append(f"| {item['url']} | {expected.replace('|', '/')} | {status} |")
+        lines.append("")
+
+    in_scope = [i["version"] for i in payload["candidates"] if i.get("in_scope")]
+    lines += [
+        "## Boundary Verification",
+        "",
+        f"- [{'x' if payload['months_covered'] else ' '}] Changelog months covered: {', '.join(payload['months_covered'])}",
+        f"- [{'x' if in_scope else ' '}] VS Code versions released in range: {', '.join('v' + v for v in in_scope) or 'none confirmed'}",
+        f"- Total candidates: {len(payload['candidates'])} (valid={payload['summary']['valid']}, failed={payload['summary']['failed']})",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    start = validate_date(args.start)
+    end = validate_date(args.end)
+    if end < start:
+        raise SystemExit("END_DATE must not be before START_DATE")
+
+    index = load_sources_index(SOURCES_PATH)
+    candidates = expand_templates(start, end, index)
+
+    with HttpPool() as pool:
+        if not args.no_feeds and args.from_store:
+            candidates.extend(feed_entries_from_store(start, end, index))
+        elif not args.no_feeds and not args.no_validate:
+            candidates.extend(expand_feed_entries(pool, start, end, index, args.workers,
+                                                  ingest=not args.no_store))
+
+        if args.no_validate:
+            for item in candidates:
+                item["ok"] = None
+        else:
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                candidates = list(executor.map(lambda c: check_candidate(pool, c, start, end), candidates))
+
+    # Unreleased VS Code versions past the sequence head are expected 404s, not failures.
+    candidates = [
+        c for c in candidates
+        if not (c["kind"] == "vscode_version" and c.get("status_code") == 404)
+    ]
+
+    payload = {
+        "generated_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "sources_path": str(SOURCES_PATH.relative_to(ROOT)),
+        "months_covered": [f"{y}-{m:02d}" for y, m in months_in_range(start, end)],
+        "summary": {
+            "total": len(candidates),
+            "valid": sum(1 for c in candidates if c.get("ok") is True),
+            "failed": sum(1 for c in candidates if c.get("ok") is False),
+        },
+        "candidates": candidates,
+    }
+
+    WORKSPACE.mkdir(parents=True, exist_ok=True)
+    stem = f"newsletter_phase1a_url_manifest_{start}_to_{end}"
+    md_path = WORKSPACE / f"{stem}.md"
+    json_path = WORKSPACE / f"{stem}.json"
+    json_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    md_path.write_text(render_markdown(payload), encoding="utf-8")
+
+    print(f"Wrote {md_path}")
+    print(f"Wrote {json_path}")
+    print("Candidate summary: " + " ".join(f"{k}={v}" for k, v in payload["summary"].items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
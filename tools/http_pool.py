@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""Shared keep-alive HTTP client for the deterministic pipeline tools.
+
+Provides SSRF-safe URL validation (same rules as the kb-maintenance scripts),
+a thread-safe pool that reuses one HTTP(S) connection per host per worker
+thread, per-host concurrency limits, manual redirect handling, and the
+HEAD-then-Range-GET existence check used by link health.
+
+Every request runs under the pool's fetch policy:
+  - transient failures (connection errors, 429/5xx) are retried with
+    jittered exponential backoff, honouring a short Retry-After;
+  - with hedge_percentile set, a second identical request is started once
+    the first has run longer than that percentile of recent latencies, and
+    whichever finishes first wins;
+  - a per-host circuit breaker opens after breaker_threshold consecutive
+    transient failures and short-circuits that host for breaker_cooldown_s
+    (then lets one trial request through).
+
+Connections honour HTTPS_PROXY / HTTP_PROXY / NO_PROXY the way urllib does:
+HTTPS targets are tunnelled through the proxy with CONNECT, plain HTTP
+requests are sent to the proxy in absolute form.
+
+Results are plain dicts in the shape extract_event_sources.fetch_text()
+already returns: fetch_ok, status_code, final_url, bytes, body, error, plus
+attempts, hedged and skipped (true when the circuit breaker refused the host).
+"""
+
+from __future__ import annotations
+
+import base64
+import collections
+import http.client
+import ipaddress
+import random
+import re
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
+from urllib.parse import unquote, urljoin, urlsplit
+
+ALLOWED_SCHEMES = {"https"}
+
+BLOCKED_HOSTNAME_PATTERNS = re.compile(
+    r"^(localhost|.*\.local|.*\.internal)$", re.IGNORECASE
+)
+
+USER_AGENT = "Mozilla/5.0 (compatible; newsletter-pipeline/1.0)"
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+RETRY_CODES = {429, 500, 502, 503, 504}
+LATENCY_WINDOW = 200
+# Bodies of read_body=False responses (HEAD, Range GET) are drained up to this
+# many bytes to keep the connection reusable; anything larger closes it instead.
+DRAIN_LIMIT = 64 * 1024
+HEDGE_MIN_SAMPLES = 10
+
+
+def is_private_ip(hostname: str) -> bool:
+    """Check if a hostname resolves to a private/loopback/link-local address."""
+    try:
+        addr = ipaddress.ip_address(hostname)
+        return addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
+    except ValueError:
+        pass  # Not a bare IP; try DNS resolution
+    try:
+        infos = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        for _family, _type, _proto, _canon, sockaddr in infos:
+            addr = ipaddress.ip_address(sockaddr[0])
+            if addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved:
+                return True
+    except (socket.gaierror, OSError):
+        pass  # DNS failure surfaces as a connection error at fetch time
+    return False
+
+
+def validate_url(url: str) -> tuple[bool, str]:
+    """Validate URL scheme, hostname, and block private/loopback targets."""
+    parsed = urlsplit(url)
+    if parsed.scheme not in ALLOWED_SCHEMES:
+        return False, f"blocked scheme '{parsed.scheme}' (allowed: {ALLOWED_SCHEMES})"
+    if not parsed.hostname:
+        return False, "missing hostname"
+    if BLOCKED_HOSTNAME_PATTERNS.match(parsed.hostname):
+        return False, f"blocked hostname '{parsed.hostname}' (localhost/internal)"
+    if is_private_ip(parsed.hostname):
+        return False, f"blocked private/loopback IP for '{parsed.hostname}'"
+    return True, ""
+
+
+def _result(
+    ok: bool,
+    status: int = 0,
+    final_url: str = "",
+    body: bytes = b"",
+    headers: dict[str, str] | None = None,
+    error: str = "",
+) -> dict[str, Any]:
+    return {
+        "fetch_ok": ok,
+        "status_code": status,
+        "final_url": final_url,
+        "bytes": len(body),
+        "body": body,
+        "headers": headers or {},
+        "error": error,
+        "attempts": 1,
+        "hedged": False,
+        "skipped": False,
+    }
+
+
+def is_transient(result: dict[str, Any]) -> bool:
+    """Failures worth retrying: no HTTP response at all, or 429/5xx."""
+    if result["fetch_ok"] or result["skipped"]:
+        return False
+    if result["status_code"]:
+        return result["status_code"] in RETRY_CODES
+    return result["error"].startswith("FetchError")
+
+
+def decode_body(result: dict[str, Any]) -> str:
+    """Decode a result body using its Content-Type charset (default utf-8)."""
+    content_type = result["headers"].get("content-type", "")
+    match = re.search(r"charset=([\w.-]+)", content_type, flags=re.IGNORECASE)
+    encoding = match.group(1) if match else "utf-8"
+    try:
+        return result["body"].decode(encoding, errors="ignore")
+    except LookupError:
+        return result["body"].decode("utf-8", errors="ignore")
+
+
+class HttpPool:
+    """Keep-alive connection pool with per-host limits, retries, hedging and circuit breaking."""
+
+    def __init__(
+        self,
+        timeout: float = 15,
+        max_per_host: int = 4,
+        user_agent: str = USER_AGENT,
+        validate: bool = True,
+        retries: int = 2,
+        backoff_s: float = 0.5,
+        max_backoff_s: float = 8.0,
+        hedge_percentile: float | None = None,
+        breaker_threshold: int = 5,
+        breaker_cooldown_s: float = 60.0,
+    ) -> None:
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.user_agent = user_agent
+        self.validate = validate
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.hedge_percentile = hedge_percentile
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown_s = breaker_cooldown_s
+        # host -> [consecutive transient failures, open-until monotonic time]
+        self._breakers: dict[str, list[float]] = {}
+        self._latencies: collections.deque[float] = collections.deque(maxlen=LATENCY_WINDOW)
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._local = threading.local()
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._validated: dict[str, tuple[bool, str]] = {}
+        self._all_conns: list[http.client.HTTPConnection] = []
+        self._proxies: dict[str, str] | None = None
+
+    def _host_limit(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._host_limits.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_host)
+                self._host_limits[host] = sem
+            return sem
+
+    def _check(self, url: str) -> tuple[bool, str]:
+        host = urlsplit(url).hostname or ""
+        key = f"{urlsplit(url).scheme}://{host}"
+        with self._lock:
+            cached = self._validated.get(key)
+        if cached is None:
+            cached = validate_url(url)
+            with self._lock:
+                self._validated[key] = cached
+        return cached
+
+    def _proxy_for(self, scheme: str, netloc: str) -> str | None:
+        """Proxy URL for a target from the *_PROXY / NO_PROXY environment (as urllib reads it)."""
+        import urllib.request
+
+        with self._lock:
+            if self._proxies is None:
+                self._proxies = urllib.request.getproxies()
+            proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(urlsplit(f"//{netloc}").hostname or netloc):
+            return None
+        return proxy if "://" in proxy else f"http://{proxy}"
+
+    def _conn(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get((scheme, netloc))
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            proxy = self._proxy_for(scheme, netloc)
+            if proxy is None:
+                conn = cls(netloc, timeout=self.timeout)
+            else:
+                parts = urlsplit(proxy)
+                auth = {}
+                if parts.username:
+                    token = base64.b64encode(f"{unquote(parts.username)}:{unquote(parts.password or '')}".encode())
+                    auth["Proxy-Authorization"] = f"Basic {token.decode('ascii')}"
+                proxy_port = parts.port or (443 if parts.scheme == "https" else 80)
+                conn = cls(parts.hostname, proxy_port, timeout=self.timeout)
+                if scheme == "https":
+                    target = urlsplit(f"//{netloc}")
+                    conn.set_tunnel(target.hostname, target.port or 443, headers=auth)
+                else:
+                    conn.absolute_form = (f"{scheme}://{netloc}", auth)  # type: ignore[attr-defined]
+            conns[(scheme, netloc)] = conn
+            with self._lock:
+                self._all_conns.append(conn)
+        return conn
+
+    def _drop_conn(self, scheme: str, netloc: str) -> None:
+        conns = getattr(self._local, "conns", {})
+        conn = conns.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def _breaker_refuses(self, host: str) -> dict[str, Any] | None:
+        """A skipped result while the host's circuit is open, else None."""
+        if self.breaker_threshold <= 0:
+            return None
+        with self._lock:
+            state = self._breakers.get(host)
+            if state is None or state[0] < self.breaker_threshold:
+                return None
+            remaining = state[1] - time.monotonic()
+            if remaining <= 0:
+                # Half-open: let this request through as the trial; park the rest.
+                state[1] = time.monotonic() + self.breaker_cooldown_s
+                return None
+        result = _result(False, error=f"CircuitOpen: {host} skipped after {int(state[0])} consecutive "
+                                      f"failures (retry in {remaining:.0f}s)")
+        result["skipped"] = True
+        return result
+
+    def _breaker_open(self, host: str) -> bool:
+        """Whether the host's circuit is open; unlike _breaker_refuses, never claims the half-open trial."""
+        if self.breaker_threshold <= 0:
+            return False
+        with self._lock:
+            state = self._breakers.get(host)
+            return state is not None and state[0] >= self.breaker_threshold and state[1] > time.monotonic()
+
+    def _breaker_record(self, host: str, transient_failure: bool) -> None:
+        if self.breaker_threshold <= 0:
+            return
+        with self._lock:
+            state = self._breakers.setdefault(host, [0, 0.0])
+            if not transient_failure:
+                state[0] = 0
+                return
+            state[0] += 1
+            if state[0] >= self.breaker_threshold:
+                state[1] = time.monotonic() + self.breaker_cooldown_s
+
+    def _backoff(self, attempt: int, result: dict[str, Any]) -> float:
+        retry_after = result["headers"].get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff_s)
+        # Full jitter: uniform in [0, base * 2^attempt].
+        return random.uniform(0, min(self.max_backoff_s, self.backoff_s * (2 ** attempt)))
+
+    def _hedge_delay(self) -> float | None:
+        if self.hedge_percentile is None:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(self.hedge_percentile * len(samples)))]
+
+    def _timed(self, attempt: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        start = time.monotonic()
+        result = attempt()
+        if result["fetch_ok"]:
+            with self._lock:
+                self._latencies.append(time.monotonic() - start)
+        return result
+
+    def _hedged(self, attempt: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Run attempt; start a duplicate if it outlives the hedge delay and take the first to succeed."""
+        delay = self._hedge_delay()
+        if delay is None:
+            return self._timed(attempt)
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+            executor = self._hedge_executor
+        primary = executor.submit(self._timed, attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        pending = {primary, executor.submit(self._timed, attempt)}
+        first: dict[str, Any] | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result["fetch_ok"] or first is None:
+                    first = result
+                if result["fetch_ok"]:
+                    # The losing request finishes in the background on its own connection.
+                    first["hedged"] = True
+                    return first
+        assert first is not None
+        first["hedged"] = True
+        return first
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        max_redirects: int = 5,
+        read_body: bool = True,
+    ) -> dict[str, Any]:
+        """Issue a request under the fetch policy (breaker, hedging, retries), following redirects."""
+        host = urlsplit(url).netloc
+        skipped = self._breaker_refuses(host)
+        if skipped is not None:
+            return skipped
+        attempt = 0
+        while True:
+            result = self._hedged(lambda: self._request_once(method, url, headers, max_redirects, read_body))
+            transient = is_transient(result)
+            self._breaker_record(host, transient)
+            result["attempts"] = attempt + 1
+            if not transient or attempt >= self.retries or self._breaker_open(host):
+                return result
+            time.sleep(self._backoff(attempt, result))
+            attempt += 1
+
+    def _request_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        max_redirects: int,
+        read_body: bool,
+    ) -> dict[str, Any]:
+        """Issue a request on a pooled connection, following redirects."""
+        current = url
+        for _ in range(max_redirects + 1):
+            if self.validate:
+                ok, reason = self._check(current)
+                if not ok:
+                    return _result(False, final_url=current, error=f"Blocked: {reason}")
+            parts = urlsplit(current)
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+            req_headers = {
+                "User-Agent": self.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Encoding": "identity",
+                **(headers or {}),
+            }
+
+            with self._host_limit(parts.netloc):
+                status, resp_headers, body, error = self._send(parts.scheme, parts.netloc, method, path, req_headers, read_body)
+            if error:
+                return _result(False, final_url=current, error=error)
+            if status in REDIRECT_CODES and resp_headers.get("location"):
+                current = urljoin(current, resp_headers["location"])
+                if status == 303:
+                    method = "GET"
+                continue
+            return _result(200 <= status < 400, status, current, body, resp_headers,
+                           "" if status < 400 else f"HTTPError: HTTP {status}")
+        return _result(False, final_url=current, error=f"Too many redirects (>{max_redirects})")
+
+    def _send(
+        self,
+        scheme: str,
+        netloc: str,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        read_body: bool,
+    ) -> tuple[int, dict[str, str], bytes, str]:
+        # One retry on a fresh socket covers servers that closed an idle keep-alive connection.
+        for attempt in range(2):
+            conn = self._conn(scheme, netloc)
+            target, proxy_headers = getattr(conn, "absolute_form", ("", {}))
+            try:
+                conn.request(method, target + path, headers={**headers, **proxy_headers})
+                resp = conn.getresponse()
+                # Always drain (HEAD included: an unread response blocks the
+                # next request on this keep-alive connection). A server that
+                # ignores Range may send a whole page; cap the drain and drop
+                # the connection rather than download it.
+                if read_body:
+                    body = resp.read()
+                else:
+                    resp.read(DRAIN_LIMIT)
+                    body = b""
+                resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+                if not resp.isclosed() or resp_headers.get("connection", "").lower() == "close":
+                    self._drop_conn(scheme, netloc)
+                return resp.status, resp_headers, body, ""
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as exc:
+                self._drop_conn(scheme, netloc)
+                if attempt == 1:
+                    return 0, {}, b"", f"FetchError: {exc}"
+            except (OSError, http.client.HTTPException) as exc:
+                self._drop_conn(scheme, netloc)
+                return 0, {}, b"", f"FetchError: {exc}"
+        return 0, {}, b"", "FetchError: unreachable"
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> dict[str, Any]:
+        return self.request("GET", url, headers=headers)
+
+    def exists(self, url: str) -> dict[str, Any]:
+        """HEAD first (cheapest); fall back to a one-byte Range GET if HEAD is refused."""
+        result = self.request("HEAD", url)
+        if result["fetch_ok"] or result["skipped"] or result["error"].startswith("Blocked"):
+            return result
+        fallback = self.request("GET", url, headers={"Range": "bytes=0-0"}, read_body=False)
+        if fallback["fetch_ok"] or not result["status_code"]:
+            return fallback
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._all_conns = self._all_conns, []
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for conn in conns:
+            conn.close()
+
+    def __enter__(self) -> "HttpPool":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
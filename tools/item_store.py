@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Persistent SQLite store of RSS/Atom feed entries from kb/SOURCES.yaml.
+
+Feeds only expose a rolling window of recent entries, so every poll is
+ingested here (deduplicated by guid, falling back to the normalized link)
+and indexed by publish date and source id. Pipeline phases then read a
+START..END window from local data instead of re-discovering it on the web.
+
+Usage:
+  python3 tools/item_store.py ingest [--workers N]
+  python3 tools/item_store.py items --start YYYY-MM-DD --end YYYY-MM-DD [--source ID ...] [--json]
+  python3 tools/item_store.py stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+from extract_event_sources import normalize_url
+
+ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = Path(os.environ.get("NEWSLETTER_ITEM_STORE", ROOT / "kb" / "items.sqlite"))
+POLL_SCRIPTS = ROOT / ".github" / "skills" / "kb-maintenance" / "scripts"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    source_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    published TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_published ON items(published);
+CREATE INDEX IF NOT EXISTS items_source_published ON items(source_id, published);
+"""
+
+
+def _utc_now() -> str:
+    return dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _published(value: dt.datetime | None) -> str | None:
+    """Normalize a parsed feed date to sortable UTC ISO text."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def utc_day(value: dt.datetime) -> dt.date:
+    """The UTC calendar day of a parsed feed date; the day items() filters on."""
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc)
+    return value.date()
+
+
+def _parse_day(value: str) -> dt.date:
+    try:
+        return dt.datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise SystemExit(f"Invalid date '{value}', expected YYYY-MM-DD") from exc
+
+
+class ItemStore:
+    """Python API over the feed item store."""
+
+    def __init__(self, db_path: Path = DB_PATH) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ItemStore":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def ingest(
+        self,
+        source_id: str,
+        entries: Iterable[dict[str, Any]],
+        parse_date: Any,
+    ) -> dict[str, int]:
+        """Upsert parsed feed entries (poll_sources.parse_rss_entries shape).
+
+        parse_date converts the raw entry date string to a datetime (or None).
+        """
+        now = _utc_now()
+        stats = {"inserted": 0, "updated": 0, "skipped": 0}
+        with self.conn:
+            for entry in entries:
+                link = (entry.get("link") or "").strip()
+                guid = (entry.get("guid") or "").strip()
+                if not link and not guid:
+                    stats["skipped"] += 1
+                    continue
+                key = guid or normalize_url(link)
+                row = (
+                    key,
+                    source_id,
+                    (entry.get("title") or "").strip(),
+                    link,
+                    guid,
+                    _published(parse_date(entry.get("date") or "")),
+                    now,
+                    now,
+                )
+                cursor = self.conn.execute(
+                    "INSERT INTO items (key, source_id, title, link, guid, published, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(key) DO NOTHING",
+                    row,
+                )
+                if cursor.rowcount:
+                    stats["inserted"] += 1
+                    continue
+                self.conn.execute(
+                    "UPDATE items SET title = ?, link = ?, published = COALESCE(?, published), last_seen = ? "
+                    "WHERE key = ?",
+                    (row[2], link, row[5], now, key),
+                )
+                stats["updated"] += 1
+        return stats
+
+    def items(
+        self,
+        start: dt.date,
+        end: dt.date,
+        sources: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Items published within START..END (inclusive), oldest first."""
+        sql = "SELECT source_id, title, link, guid, published FROM items WHERE published >= ? AND published < ?"
+        params: list[Any] = [start.isoformat(), (end + dt.timedelta(days=1)).isoformat()]
+        wanted = sorted(set(sources or ()))
+        if wanted:
+            sql += f" AND source_id IN ({','.join('?' * len(wanted))})"
+            params.extend(wanted)
+        sql += " ORDER BY published, source_id, link"
+        return [
+            {"source_id": r[0], "title": r[1], "link": r[2], "guid": r[3], "published": r[4]}
+            for r in self.conn.execute(sql, params)
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        total = self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        span = self.conn.execute("SELECT MIN(published), MAX(published) FROM items").fetchone()
+        by_source = dict(self.conn.execute(
+            "SELECT source_id, COUNT(*) FROM items GROUP BY source_id ORDER BY source_id"
+        ).fetchall())
+        return {"items": total, "oldest": span[0], "newest": span[1], "by_source": by_source}
+
+
+def fetch_and_ingest(store: ItemStore, workers: int = 8) -> dict[str, int]:
+    """Fetch every pollable RSS/Atom feed once and ingest all entries."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from http_pool import HttpPool, decode_body
+    from kb_index import SOURCES_PATH, load_sources_index
+
+    sys.path.insert(0, str(POLL_SCRIPTS))
+    from poll_sources import parse_date_flexible, parse_rss_entries
+
+    index = load_sources_index(SOURCES_PATH)
+    feeds = [f for f in index.pollable if f["feed_type"] in ("rss", "atom")]
+    with HttpPool() as pool, ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = list(executor.map(lambda f: pool.get(f["feed_url"]), feeds))
+
+    totals = {"feeds": len(feeds), "failed": 0, "inserted": 0, "updated": 0, "skipped": 0}
+    for feed, result in zip(feeds, fetched):
+        if not result["fetch_ok"]:
+            totals["failed"] += 1
+            print(f"  {feed['id']}: {result['error']}", file=sys.stderr)
+            continue
+        entries, _ = parse_rss_entries(decode_body(result), "")
+        for key, value in store.ingest(feed["id"], entries, parse_date_flexible).items():
+            totals[key] += value
+    return totals
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Persistent feed item store")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="SQLite store path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Fetch all RSS/Atom feeds and store their entries")
+    ingest.add_argument("--workers", type=int, default=8)
+
+    items = sub.add_parser("items", help="List items published in a date window")
+    items.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
+    items.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
+    items.add_argument("--source", action="append", default=[], help="Source id (repeatable)")
+    items.add_argument("--json", action="store_true", help="Emit JSON instead of text")
+
+    sub.add_parser("stats", help="Show store size and date span")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with ItemStore(args.db) as store:
+        if args.command == "ingest":
+            totals = fetch_and_ingest(store, args.workers)
+            print("Ingest: " + " ".join(f"{k}={v}" for k, v in totals.items()))
+            return 0 if totals["failed"] < totals["feeds"] or not totals["feeds"] else 1
+
+        if args.command == "stats":
+            print(json.dumps(store.stats(), indent=2))
+            return 0
+
+        start, end = _parse_day(args.start), _parse_day(args.end)
+        if end < start:
+            raise SystemExit("--end must not be before --start")
+        rows = store.items(start, end, args.source)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    for row in rows:
+        print(f"{row['published'][:10]}  {row['source_id']:<24} {row['title'][:80]}")
+        print(f"            {row['link']}")
+    print(f"Summary: items={len(rows)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
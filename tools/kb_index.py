@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""Compile kb/SOURCES.yaml and kb/EVENT_SOURCES.yaml into cached binary indexes.
+
+Parsing YAML on every tool invocation is the dominant startup cost of the kb
+scripts. This module parses each file once (preferring libyaml's CSafeLoader),
+validates it, and stores a compiled index under .cache/kb_index/ keyed by the
+SHA-256 of the file contents. Later loads only read the index header; per-source
+records are unpickled on first access. PyYAML itself is only imported on a
+cache miss, so warm invocations never pay its import cost.
+
+Usage:
+  python3 tools/kb_index.py build [PATH ...]
+  python3 tools/kb_index.py show [PATH] [--id ID | --section S | --feed-type T | --host H]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+from paths import CACHE_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES_PATH = ROOT / "kb" / "SOURCES.yaml"
+EVENT_SOURCES_PATH = ROOT / "kb" / "EVENT_SOURCES.yaml"
+INDEX_DIR = CACHE_DIR / "kb_index"
+
+# Bump when the header layout or record encoding changes.
+INDEX_FORMAT = 2
+MAGIC = b"KBIX"
+_PREFIX = struct.Struct(">4sHQ")  # magic, format, header length
+
+class KBIndexError(ValueError):
+    """Raised when a kb YAML file fails validation."""
+
+
+def safe_load_yaml(text: str) -> Any:
+    """Parse YAML with the C loader when libyaml is available."""
+    try:
+        import yaml
+    except ImportError as exc:
+        raise KBIndexError("PyYAML required. Install with: pip3 install pyyaml") from exc
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader)  # noqa: S506 - SafeLoader/CSafeLoader only
+    except yaml.YAMLError as exc:
+        raise KBIndexError(f"invalid YAML: {exc}") from exc
+
+
+def file_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _host(url: str) -> str:
+    from urllib.parse import urlparse
+
+    return (urlparse(url).hostname or "").lower()
+
+
+def _validate_sources(data: Any, path: Path) -> list[dict[str, Any]]:
+    if not isinstance(data, dict):
+        raise KBIndexError(f"{path}: top level must be a mapping")
+    sources = data.get("sources", [])
+    if not isinstance(sources, list):
+        raise KBIndexError(f"{path}: 'sources' must be a list")
+
+    problems: list[str] = []
+    seen: set[str] = set()
+    for position, source in enumerate(sources):
+        label = f"sources[{position}]"
+        if not isinstance(source, dict):
+            problems.append(f"{label}: must be a mapping")
+            continue
+        source_id = source.get("id")
+        if not isinstance(source_id, str) or not source_id:
+            problems.append(f"{label}: missing id")
+        elif source_id in seen:
+            problems.append(f"{label}: duplicate id '{source_id}'")
+        else:
+            seen.add(source_id)
+        if not isinstance(source.get("canonical_urls", []), list):
+            problems.append(f"{label}: canonical_urls must be a list")
+        feeds = source.get("update_feeds", [])
+        if not isinstance(feeds, list) or not all(isinstance(feed, dict) for feed in feeds):
+            problems.append(f"{label}: update_feeds must be a list of mappings")
+        if not isinstance(source.get("latest_known", {}) or {}, dict):
+            problems.append(f"{label}: latest_known must be a mapping")
+
+    if problems:
+        raise KBIndexError(f"{path}: " + "; ".join(problems))
+    return sources
+
+
+def _compile_sources(data: Any, path: Path) -> tuple[dict[str, Any], list[bytes]]:
+    """Build the index header and one pickled record per source."""
+    sources = _validate_sources(data, path)
+
+    by_id: dict[str, int] = {}
+    by_section: dict[str, list[str]] = {}
+    by_feed_type: dict[str, list[str]] = {}
+    by_host: dict[str, list[str]] = {}
+    pollable: list[dict[str, Any]] = []
+    urls_to_check: list[dict[str, Any]] = []
+    records: list[bytes] = []
+
+    def add(lookup: dict[str, list[str]], key: str, source_id: str) -> None:
+        bucket = lookup.setdefault(key, [])
+        if source_id not in bucket:
+            bucket.append(source_id)
+
+    for position, source in enumerate(sources):
+        source_id = source["id"]
+        # Scheduling fields for kb_schedule.py (due times per URL / feed).
+        schedule = {
+            "update_cadence": source.get("update_cadence", ""),
+            "stability": source.get("stability", ""),
+            "last_checked": source.get("last_checked", ""),
+        }
+        by_id[source_id] = position
+        records.append(pickle.dumps(source, protocol=pickle.HIGHEST_PROTOCOL))
+        add(by_section, str(source.get("section", "")), source_id)
+
+        for feed in source.get("update_feeds", []) or []:
+            feed_type = feed.get("type", "none")
+            add(by_feed_type, str(feed_type), source_id)
+            if feed_type != "none" and feed.get("url"):
+                add(by_host, _host(feed["url"]), source_id)
+                pollable.append({
+                    "id": source_id,
+                    "name": source.get("name"),
+                    "feed_type": feed["type"],
+                    "feed_url": feed["url"],
+                    **schedule,
+                })
+
+        for url in source.get("canonical_urls", []) or []:
+            add(by_host, _host(url), source_id)
+            urls_to_check.append({
+                "id": source_id,
+                "name": source.get("name"),
+                "url": url,
+                "type": "canonical",
+                **schedule,
+            })
+        ref_url = (source.get("latest_known", {}) or {}).get("reference_url", "")
+        if ref_url:
+            add(by_host, _host(ref_url), source_id)
+            urls_to_check.append({
+                "id": source_id,
+                "name": source.get("name"),
+                "url": ref_url,
+                "type": "reference",
+                **schedule,
+            })
+
+    header = {
+        "kind": "sources",
+        "document": {k: v for k, v in data.items() if k != "sources"},
+        "by_id": by_id,
+        "by_section": by_section,
+        "by_feed_type": by_feed_type,
+        "by_host": by_host,
+        "pollable": pollable,
+        "urls_to_check": urls_to_check,
+    }
+    return header, records
+
+
+def _compile_document(data: Any, path: Path) -> tuple[dict[str, Any], list[bytes]]:
+    if not isinstance(data, dict):
+        raise KBIndexError(f"{path}: top level must be a mapping")
+    return {"kind": "document", "document": data}, []
+
+
+def _index_path(path: Path, digest: str) -> Path:
+    # The source path hash keeps same-named files in different directories
+    # from sharing (and cleaning up) each other's indexes.
+    source = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+    return INDEX_DIR / f"{path.stem}-{source}-{digest[:16]}.idx"
+
+
+def _write_index(index_path: Path, header: dict[str, Any], records: list[bytes]) -> None:
+    offsets: list[tuple[int, int]] = []
+    cursor = 0
+    for record in records:
+        offsets.append((cursor, len(record)))
+        cursor += len(record)
+    header = {**header, "offsets": offsets}
+    header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(f".tmp{os.getpid()}")
+    with tmp_path.open("wb") as fh:
+        fh.write(_PREFIX.pack(MAGIC, INDEX_FORMAT, len(header_bytes)))
+        fh.write(header_bytes)
+        for record in records:
+            fh.write(record)
+    os.replace(tmp_path, index_path)
+
+    # Drop indexes compiled from older revisions of the same file
+    # (same <stem>-<source hash> prefix, different content digest).
+    for stale in index_path.parent.glob(f"{index_path.stem.rsplit('-', 1)[0]}-*.idx"):
+        if stale != index_path:
+            stale.unlink(missing_ok=True)
+
+
+def _read_header(index_path: Path) -> tuple[dict[str, Any], int] | None:
+    try:
+        with index_path.open("rb") as fh:
+            prefix = fh.read(_PREFIX.size)
+            if len(prefix) != _PREFIX.size:
+                return None
+            magic, fmt, header_len = _PREFIX.unpack(prefix)
+            if magic != MAGIC or fmt != INDEX_FORMAT:
+                return None
+            header = pickle.loads(fh.read(header_len))
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return header, _PREFIX.size + header_len
+
+
+class CompiledIndex:
+    """Read-only view over a compiled kb index with lazily loaded records."""
+
+    def __init__(
+        self,
+        path: Path,
+        digest: str,
+        header: dict[str, Any],
+        records_offset: int = 0,
+        index_path: Path | None = None,
+        records: list[bytes] | None = None,
+    ) -> None:
+        self.path = path
+        self.digest = digest
+        self.kind: str = header["kind"]
+        self.document: dict[str, Any] = header["document"]
+        self.by_id: dict[str, int] = header.get("by_id", {})
+        self.by_section: dict[str, list[str]] = header.get("by_section", {})
+        self.by_feed_type: dict[str, list[str]] = header.get("by_feed_type", {})
+        self.by_host: dict[str, list[str]] = header.get("by_host", {})
+        self.pollable: list[dict[str, Any]] = header.get("pollable", [])
+        self.urls_to_check: list[dict[str, Any]] = header.get("urls_to_check", [])
+        self._offsets: list[tuple[int, int]] = header.get("offsets", [])
+        self._records_offset = records_offset
+        self._index_path = index_path
+        self._records = records
+        self._loaded: dict[int, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, source_id: object) -> bool:
+        return source_id in self.by_id
+
+    def _record(self, position: int) -> dict[str, Any]:
+        cached = self._loaded.get(position)
+        if cached is not None:
+            return cached
+        if self._records is not None:
+            raw = self._records[position]
+        else:
+            assert self._index_path is not None
+            start, length = self._offsets[position]
+            with self._index_path.open("rb") as fh:
+                fh.seek(self._records_offset + start)
+                raw = fh.read(length)
+        record = pickle.loads(raw)
+        self._loaded[position] = record
+        return record
+
+    def get(self, source_id: str) -> dict[str, Any] | None:
+        position = self.by_id.get(source_id)
+        return None if position is None else self._record(position)
+
+    def sources(self, ids: list[str] | None = None) -> Iterator[dict[str, Any]]:
+        if ids is None:
+            positions: Any = range(len(self._offsets))
+        else:
+            positions = (self.by_id[i] for i in ids if i in self.by_id)
+        for position in positions:
+            yield self._record(position)
+
+    def in_section(self, section: str) -> list[dict[str, Any]]:
+        return list(self.sources(self.by_section.get(section, [])))
+
+    def with_feed_type(self, feed_type: str) -> list[dict[str, Any]]:
+        return list(self.sources(self.by_feed_type.get(feed_type, [])))
+
+    def on_host(self, host: str) -> list[dict[str, Any]]:
+        return list(self.sources(self.by_host.get(host.lower(), [])))
+
+
+def load_index(path: Path, use_cache: bool = True) -> CompiledIndex:
+    """Return the compiled index for a kb YAML file, compiling on cache miss."""
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = file_digest(raw)
+    index_path = _index_path(path, digest)
+
+    if use_cache:
+        cached = _read_header(index_path)
+        if cached is not None:
+            header, records_offset = cached
+            return CompiledIndex(path, digest, header, records_offset, index_path=index_path)
+
+    try:
+        data = safe_load_yaml(raw.decode("utf-8"))
+    except KBIndexError as exc:
+        raise KBIndexError(f"{path}: {exc}") from exc
+    compile_fn = _compile_sources if isinstance(data, dict) and "sources" in data else _compile_document
+    header, records = compile_fn(data, path)
+
+    if use_cache:
+        try:
+            _write_index(index_path, header, records)
+        except OSError:
+            pass  # Read-only checkout: fall back to the in-memory index.
+    header = {**header, "offsets": [(0, len(r)) for r in records]}
+    return CompiledIndex(path, digest, header, records=records)
+
+
+def load_sources_index(path: Path | str = SOURCES_PATH) -> CompiledIndex:
+    index = load_index(Path(path))
+    if index.kind != "sources":
+        raise KBIndexError(f"{path}: no 'sources' list")
+    return index
+
+
+def load_document(path: Path | str) -> dict[str, Any]:
+    """Return the parsed top-level mapping of a kb YAML file via the index cache."""
+    index = load_index(Path(path))
+    if index.kind == "sources":
+        return {**index.document, "sources": list(index.sources())}
+    return index.document
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build or query compiled kb indexes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Compile indexes (default: SOURCES.yaml and EVENT_SOURCES.yaml)")
+    build.add_argument("paths", nargs="*", type=Path)
+
+    show = sub.add_parser("show", help="Print indexed sources as JSON")
+    show.add_argument("path", nargs="?", type=Path, default=SOURCES_PATH)
+    group = show.add_mutually_exclusive_group()
+    group.add_argument("--id", dest="source_id")
+    group.add_argument("--section")
+    group.add_argument("--feed-type")
+    group.add_argument("--host")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        if args.command == "build":
+            for path in args.paths or [SOURCES_PATH, EVENT_SOURCES_PATH]:
+                index = load_index(path)
+                print(f"{path}: {index.kind} index {index.digest[:16]} ({len(index)} sources)")
+            return 0
+
+        index = load_sources_index(args.path)
+        if args.source_id:
+            found = index.get(args.source_id)
+            rows = [found] if found else []
+        elif args.section:
+            rows = index.in_section(args.section)
+        elif args.feed_type:
+            rows = index.with_feed_type(args.feed_type)
+        elif args.host:
+            rows = index.on_host(args.host)
+        else:
+            rows = list(index.sources())
+    except (KBIndexError, OSError) as exc:
+        raise SystemExit(f"Error: {exc}") from exc
+
+    print(json.dumps(rows, indent=2, default=str))
+    return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
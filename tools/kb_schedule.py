@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Cadence-aware due times for kb link-health checks and feed polling.
+
+Each kb/SOURCES.yaml source carries update_cadence, stability and
+last_checked. A check interval is derived from those fields and from the last
+observed result, and each URL / feed is due at (last check + interval):
+
+  link health  base = STABILITY_DAYS[stability], halved for "frequent" sources
+  feed polling base = CADENCE_DAYS[update_cadence], halved for "low" stability
+               halved again after a poll that found new entries, stretched
+               (up to 2x) after consecutive polls with nothing new
+  failures     retried after RETRY_HOURS, doubling per consecutive failure,
+               never later than the regular interval
+
+Results are kept per job under .cache/kb_schedule/<job>.json; an item never
+seen by the scheduler falls back to its source's last_checked date.
+check_link_health.py and poll_sources.py use this for --due runs (only due
+items, most overdue first, within --budget seconds) and --write-back, which
+updates last_checked in kb/SOURCES.yaml for sources whose every URL / feed has
+been confirmed since.
+
+Usage:
+  python3 tools/kb_schedule.py [link_health|poll] [--all]
+
+Output:
+  The job's items in priority order with due time, interval and last outcome
+  (due items only unless --all).
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from paths import CACHE_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES_PATH = ROOT / "kb" / "SOURCES.yaml"
+STATE_DIR = CACHE_DIR / "kb_schedule"
+
+JOBS = ("link_health", "poll")
+DAY_S = 86400.0
+STABILITY_DAYS = {"high": 14.0, "medium": 7.0, "low": 2.0}
+CADENCE_DAYS = {"frequent": 1.0, "irregular": 3.0, "monthly": 7.0}
+DEFAULT_DAYS = {"link_health": 7.0, "poll": 3.0}
+RETRY_HOURS = 6.0
+# Outcomes that confirm an item; anything else counts as a failure.
+OK_OUTCOMES = {"ok", "new", "unchanged"}
+
+SOURCE_ID_LINE = re.compile(r'^\s*-\s+id:\s*["\']?([^"\'\s]+)["\']?\s*$')
+LAST_CHECKED_LINE = re.compile(r'^(\s+last_checked:\s*)(["\']?)([^"\'\s]*)\2(\s*)$')
+
+
+def item_key(item: dict[str, Any]) -> str:
+    return f"{item['id']}|{item.get('url') or item.get('feed_url', '')}"
+
+
+def _date_epoch(value: Any) -> float | None:
+    try:
+        day = dt.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+    return dt.datetime(day.year, day.month, day.day, tzinfo=dt.timezone.utc).timestamp()
+
+
+class Schedule:
+    """Due times and persisted results for one job's items."""
+
+    def __init__(self, job: str, state_dir: Path = STATE_DIR, now: float | None = None) -> None:
+        if job not in JOBS:
+            raise ValueError(f"Unknown schedule job: {job}")
+        self.job = job
+        self.path = state_dir / f"{job}.json"
+        self.now = time.time() if now is None else now
+        try:
+            self.state: dict[str, dict[str, Any]] = json.loads(self.path.read_text(encoding="utf-8"))["items"]
+        except (OSError, ValueError, KeyError):
+            self.state = {}
+
+    def interval_s(self, item: dict[str, Any]) -> float:
+        cadence = item.get("update_cadence", "")
+        stability = item.get("stability", "")
+        if self.job == "link_health":
+            days = STABILITY_DAYS.get(stability, DEFAULT_DAYS[self.job])
+            if cadence == "frequent":
+                days /= 2
+        else:
+            days = CADENCE_DAYS.get(cadence, DEFAULT_DAYS[self.job])
+            if stability == "low":
+                days /= 2
+        last = self.state.get(item_key(item), {})
+        if last.get("outcome") == "new":
+            days /= 2
+        elif last.get("quiet_streak", 0) > 1:
+            days *= min(2.0, 1 + 0.25 * (last["quiet_streak"] - 1))
+        interval = days * DAY_S
+        failures = last.get("failures", 0)
+        if failures:
+            interval = min(interval, RETRY_HOURS * 3600 * 2 ** (failures - 1))
+        return interval
+
+    def last_checked_at(self, item: dict[str, Any]) -> float:
+        recorded = self.state.get(item_key(item), {}).get("checked_at")
+        if recorded is not None:
+            return recorded
+        return _date_epoch(item.get("last_checked")) or 0.0
+
+    def due_at(self, item: dict[str, Any]) -> float:
+        return self.last_checked_at(item) + self.interval_s(item)
+
+    def plan(self, items: Iterable[dict[str, Any]], due_only: bool = True) -> list[dict[str, Any]]:
+        """Distinct items annotated with due_at / interval_s / overdue, most overdue
+        (relative to their own interval) first; with due_only, items not yet due
+        are dropped."""
+        planned = []
+        seen: set[str] = set()
+        for item in items:
+            if item_key(item) in seen:
+                continue
+            seen.add(item_key(item))
+            interval = self.interval_s(item)
+            due_at = self.last_checked_at(item) + interval
+            overdue = (self.now - due_at) / interval
+            if due_only and overdue < 0:
+                continue
+            planned.append({**item, "due_at": due_at, "interval_s": interval, "overdue": overdue})
+        planned.sort(key=lambda i: (-i["overdue"], item_key(i)))
+        return planned
+
+    def record(self, item: dict[str, Any], outcome: str, at: float | None = None) -> None:
+        """Store one result: ok / broken / error / blocked for links, new / unchanged / error for feeds."""
+        key = item_key(item)
+        previous = self.state.get(key, {})
+        ok = outcome in OK_OUTCOMES
+        entry = {
+            "checked_at": time.time() if at is None else at,
+            "outcome": outcome,
+            "failures": 0 if ok else previous.get("failures", 0) + 1,
+            "quiet_streak": previous.get("quiet_streak", 0) + 1 if outcome == "unchanged" else 0,
+        }
+        if ok:
+            entry["confirmed_at"] = entry["checked_at"]
+        elif "confirmed_at" in previous:
+            entry["confirmed_at"] = previous["confirmed_at"]
+        self.state[key] = entry
+
+    def confirmed_dates(self, items: Iterable[dict[str, Any]]) -> dict[str, str]:
+        """source id -> date (UTC) by which every one of its items was last confirmed;
+        sources with an item that is failing or was never checked are left out."""
+        confirmed: dict[str, list[float | None]] = {}
+        for item in items:
+            last = self.state.get(item_key(item), {})
+            at = last.get("confirmed_at") if last.get("outcome") in OK_OUTCOMES else None
+            confirmed.setdefault(item["id"], []).append(at)
+        return {
+            source_id: dt.datetime.fromtimestamp(min(times), tz=dt.timezone.utc).date().isoformat()
+            for source_id, times in confirmed.items()
+            if None not in times
+        }
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text(json.dumps({"job": self.job, "items": self.state}, indent=1, sort_keys=True) + "\n",
+                       encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class Budget:
+    """Wall-clock budget for a run; None means unlimited."""
+
+    def __init__(self, seconds: float | None) -> None:
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+
+    def exhausted(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+def write_back_last_checked(dates: dict[str, str], path: Path = SOURCES_PATH) -> list[str]:
+    """Advance last_checked in SOURCES.yaml in place (formatting and comments kept);
+    returns the ids that changed. Dates never move backwards."""
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    changed: list[str] = []
+    current = None
+    for i, line in enumerate(lines):
+        match = SOURCE_ID_LINE.match(line)
+        if match:
+            current = match.group(1)
+            continue
+        field = LAST_CHECKED_LINE.match(line.rstrip("\n"))
+        if not field or current not in dates:
+            continue
+        new = dates[current]
+        if field.group(3) and field.group(3) >= new:
+            continue
+        quote = field.group(2) or '"'
+        ending = "\n" if line.endswith("\n") else ""
+        lines[i] = f"{field.group(1)}{quote}{new}{quote}{field.group(4)}{ending}"
+        changed.append(current)
+    if changed:
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        tmp.write_text("".join(lines), encoding="utf-8")
+        os.replace(tmp, path)
+    return changed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Show kb maintenance due times")
+    parser.add_argument("job", nargs="?", default="link_health", choices=JOBS)
+    parser.add_argument("--all", action="store_true", help="List items that are not due yet too")
+    return parser.parse_args()
+
+
+def main() -> int:
+    from kb_index import load_sources_index
+
+    args = parse_args()
+    index = load_sources_index()
+    items = index.urls_to_check if args.job == "link_health" else index.pollable
+    schedule = Schedule(args.job)
+    planned = schedule.plan(items, due_only=not args.all)
+    print(f"# {args.job} schedule: {sum(1 for i in planned if i['overdue'] >= 0)}/{len(items)} due")
+    for item in planned:
+        due = dt.datetime.fromtimestamp(item["due_at"], tz=dt.timezone.utc).strftime("%Y-%m-%d %H:%M")
+        last = schedule.state.get(item_key(item), {}).get("outcome", "-")
+        url = item.get("url") or item.get("feed_url")
+        print(f"  {'DUE ' if item['overdue'] >= 0 else 'wait'} {due}Z  every {item['interval_s'] / DAY_S:4.1f}d  "
+              f"last={last:<9} {item['id']}  {url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Shared filesystem locations for the pipeline tools.
+
+CACHE_DIR is the root of every tool cache (.cache/ in the repo unless
+NEWSLETTER_CACHE_DIR points elsewhere); each tool keeps its own
+subdirectory or database file under it.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("NEWSLETTER_CACHE_DIR", ROOT / ".cache"))
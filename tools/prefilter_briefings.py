@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Deterministic Phase 5b pre-filter: per-briefing short lists of newsletter items.
+
+Parses an assembled newsletter into items (top-level bullets and event table
+rows, each with its H1 > H2 > H3 section path), indexes every item once
+against all use-case signals, kb/TAXONOMY.md applies_to tags and the
+config/profile.yaml audience (roles, industries), then scores each use case
+in .github/skills/use-case-filter/references/use_case_definitions.yaml with
+the skill's weights:
+
+  keyword / feature / event signal  3.0 per distinct term (events only in
+                                    the events section)
+  category (item's H1 in categories) 2.0
+  capability (shared taxonomy tags)  1.5 per tag ("general" excluded)
+  adjacency (same subsection as a    1.0
+    direct signal match)
+  audience (mentions a profile       1.0
+    industry or role)
+
+An item is a candidate only with a signal or capability match; candidates at
+or above --min-score are kept in score order, capped at --max-items. Use
+cases with fewer than 3 candidates are skipped, as the skill does. Scoring
+fans out to a process pool only when use cases x items is large; the index is
+built once either way.
+
+Usage:
+  python3 tools/prefilter_briefings.py [NEWSLETTER] [--out-dir output/briefings/inputs]
+      [--use-case ID ...] [--max-items 15] [--min-score 3] [--jobs N] [--json]
+
+Output:
+  <out-dir>/<YYYY-MM>_<use_case_id>.md per qualifying use case: briefing header
+  (name, framing, audience, newsletter link) and the selected items verbatim,
+  each preceded by a <!-- score | section | matched --> comment.
+  <out-dir>/<YYYY-MM>_manifest.json with every use case's counts and scores.
+  A one-line summary per use case on stdout (the manifest with --json).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any
+
+from kb_index import safe_load_yaml
+from text_match import SubstringMatcher
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFINITIONS_PATH = ROOT / ".github" / "skills" / "use-case-filter" / "references" / "use_case_definitions.yaml"
+PROFILE_PATH = ROOT / "config" / "profile.yaml"
+TAXONOMY_PATH = ROOT / "kb" / "TAXONOMY.md"
+OUTPUT_DIR = ROOT / "output"
+
+SIGNAL_WEIGHT = 3.0
+CATEGORY_WEIGHT = 2.0
+CAPABILITY_WEIGHT = 1.5
+ADJACENCY_WEIGHT = 1.0
+AUDIENCE_WEIGHT = 1.0
+MIN_ITEMS = 3
+EVENTS_SECTION = "Webinars, Events, and Recordings"
+POOL_MIN_PAIRS = 20000
+
+# Surface spellings for applies_to tags beyond the tag name itself.
+TAG_ALIASES = {
+    "web": ["github.com"],
+    "vscode": ["vs code", "visual studio code"],
+    "cli": ["command line", "command-line"],
+    "mcp": ["model context protocol"],
+    "agents": ["agent", "agentic", "subagent", "autopilot", "orchestration"],
+    "skills": ["skill"],
+    "evals": ["eval", "evaluation", "benchmark", "scorecard"],
+    "security": ["secret scanning", "code scanning", "vulnerability", "governance", "permission", "sandbox"],
+    "enterprise": ["policy", "policies", "admin", "administration", "rollout"],
+}
+TAG_LINE = re.compile(r"^-\s+`([a-z0-9_]+)`:")
+HEADING = re.compile(r"^(#{1,3})\s+(.+?)\s*$")
+BULLET = re.compile(r"^[-*]\s+\S")
+TABLE_SEPARATOR = re.compile(r"^\|[\s:|-]+\|$")
+CYCLE_PREFIX = re.compile(r"^(\d{4}-\d{2})")
+
+
+def load_taxonomy_tags(path: Path = TAXONOMY_PATH) -> dict[str, re.Pattern[str]]:
+    """applies_to tag -> word-boundary regex over its name and aliases."""
+    tags: dict[str, re.Pattern[str]] = {}
+    in_section = False
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("## "):
+            in_section = line.strip() == "## applies_to Tags"
+            continue
+        match = TAG_LINE.match(line) if in_section else None
+        if not match or match.group(1) == "general":
+            continue
+        tag = match.group(1)
+        spellings = [tag.replace("_", " "), *TAG_ALIASES.get(tag, [])]
+        alternatives = "|".join(re.escape(s) for s in sorted(spellings, key=len, reverse=True))
+        tags[tag] = re.compile(rf"(?<![\w-])(?:{alternatives})s?(?![\w-])", re.IGNORECASE)
+    return tags
+
+
+def profile_terms(path: Path = PROFILE_PATH) -> dict[str, list[str]]:
+    audience = (safe_load_yaml(path.read_text(encoding="utf-8")) or {}).get("audience", {})
+    roles = [*audience.get("primary_roles", []), *audience.get("secondary_roles", [])]
+    return {"roles": [str(r) for r in roles], "industries": [str(i) for i in audience.get("industries", [])]}
+
+
+def parse_items(text: str) -> tuple[str, list[dict[str, Any]]]:
+    """(issue title, items): top-level bullets with their continuation lines and
+    table body rows, each tagged with its section path."""
+    title = ""
+    path: list[str] = []
+    items: list[dict[str, Any]] = []
+    current: list[str] | None = None
+    in_table = False
+
+    def flush() -> None:
+        nonlocal current
+        if current:
+            items.append({"index": len(items), "section": list(path), "text": "\n".join(current).rstrip()})
+        current = None
+
+    for line in text.splitlines():
+        heading = HEADING.match(line)
+        if heading:
+            flush()
+            in_table = False
+            level, name = len(heading.group(1)), heading.group(2)
+            if level == 1 and not title:
+                title = name
+                continue
+            path = path[: level - 1] + [name]
+            continue
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            flush()
+            if not in_table:
+                in_table = True  # header row
+            elif not TABLE_SEPARATOR.match(stripped):
+                items.append({"index": len(items), "section": list(path), "text": stripped})
+            continue
+        in_table = False
+        if BULLET.match(line):
+            flush()
+            current = [line]
+        elif current is None:
+            continue
+        elif not stripped or line.startswith((" ", "\t")) or current[-1].strip():
+            current.append(line)  # blank, indented (nested / annotation) or lazy continuation
+        else:
+            flush()  # unindented paragraph after a blank line ends the bullet
+    flush()
+    for item in items:
+        item["text"] = re.sub(r"\n{3,}", "\n\n", item["text"])
+    return title, items
+
+
+def build_index(items: list[dict[str, Any]], use_cases: list[dict[str, Any]],
+                tags: dict[str, re.Pattern[str]], profile: dict[str, list[str]]) -> list[dict[str, Any]]:
+    """Scan each item once for every signal term, tag and profile term.
+
+    Terms must start at a word boundary ("actions" never matches inside
+    "interactions"); acronyms such as API or MCP must be whole words, other
+    terms may be stems ("moderniz", "onboard") and run on into longer words.
+    """
+    signal_terms = {str(t) for uc in use_cases for kind in ("keywords", "features", "events")
+                    for t in uc.get("signals", {}).get(kind, [])}
+    terms = {t.lower() for t in signal_terms}
+    acronyms = {t.lower() for t in signal_terms if t.isupper()}
+    audience_terms = {t.lower().rstrip("s") for t in [*profile["roles"], *profile["industries"]]}
+    matcher = SubstringMatcher(terms | audience_terms)
+    index = []
+    for item in items:
+        lowered = item["text"].lower()
+        found = matcher.find_words(lowered, whole=acronyms)
+        index.append({
+            "terms": sorted(found & terms),
+            "audience": sorted(found & audience_terms),
+            "tags": sorted(tag for tag, pattern in tags.items() if pattern.search(item["text"])),
+        })
+    return index
+
+
+def use_case_tags(use_case: dict[str, Any], tags: dict[str, re.Pattern[str]]) -> set[str]:
+    signals = use_case.get("signals", {})
+    text = " ".join([use_case.get("name", ""), use_case.get("description", ""),
+                     *[str(t) for kind in ("keywords", "features") for t in signals.get(kind, [])]])
+    return {tag for tag, pattern in tags.items() if pattern.search(text)}
+
+
+def score_use_case(job: tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]], dict[str, Any]]) -> dict[str, Any]:
+    """Score every item for one use case and pick its short list."""
+    use_case, items, index, options = job
+    signals = use_case.get("signals", {})
+    direct = {t.lower() for kind in ("keywords", "features") for t in signals.get(kind, [])}
+    events = {t.lower() for t in signals.get("events", [])}
+    categories = set(signals.get("categories", []))
+    wanted_tags = set(options["tags"])
+
+    scored = []
+    for item, entry in zip(items, index):
+        section = item["section"]
+        in_events = bool(section) and section[0] == EVENTS_SECTION
+        matched = [t for t in entry["terms"] if t in direct or (in_events and t in events)]
+        shared = [t for t in entry["tags"] if t in wanted_tags]
+        score = SIGNAL_WEIGHT * len(matched) + CAPABILITY_WEIGHT * len(shared)
+        if section and section[0] in categories:
+            score += CATEGORY_WEIGHT
+        if entry["audience"]:
+            score += AUDIENCE_WEIGHT
+        scored.append({"item": item["index"], "score": score, "matched": matched, "tags": shared,
+                       "candidate": bool(matched or shared)})
+
+    hit_sections = {tuple(items[s["item"]]["section"]) for s in scored if s["matched"]}
+    for entry in scored:
+        if not entry["matched"] and tuple(items[entry["item"]]["section"]) in hit_sections:
+            entry["score"] += ADJACENCY_WEIGHT
+
+    candidates = [s for s in scored if s["candidate"] and s["score"] >= options["min_score"]]
+    candidates.sort(key=lambda s: (-s["score"], s["item"]))
+    selected = candidates[: options["max_items"]]
+    return {
+        "id": use_case["id"],
+        "name": use_case.get("name", use_case["id"]),
+        "candidates": len(candidates),
+        "selected": [{"item": s["item"], "score": s["score"], "matched": s["matched"], "tags": s["tags"]}
+                     for s in selected],
+        "qualifies": len(candidates) >= MIN_ITEMS,
+    }
+
+
+def score_all(use_cases: list[dict[str, Any]], items: list[dict[str, Any]], index: list[dict[str, Any]],
+              tags: dict[str, re.Pattern[str]], min_score: float, max_items: int, jobs: int) -> list[dict[str, Any]]:
+    """Results in use-case order, fanning out to a process pool for large inputs."""
+    work = [(uc, items, index, {"tags": sorted(use_case_tags(uc, tags)), "min_score": min_score,
+                                "max_items": max_items}) for uc in use_cases]
+    if jobs <= 1 or len(use_cases) < 2 or len(use_cases) * len(items) < POOL_MIN_PAIRS:
+        return [score_use_case(job) for job in work]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        return list(pool.map(score_use_case, work))
+
+
+def render_input(result: dict[str, Any], use_case: dict[str, Any], items: list[dict[str, Any]],
+                 issue: str, newsletter: Path, profile_roles: list[str]) -> str:
+    audience = use_case.get("audience", [])
+    targeted = [r for r in profile_roles if any(r.lower() in a.lower() for a in audience)]
+    lines = [
+        f"# {result['name']}: {issue} GitHub Updates",
+        "",
+        f"<!-- prefilter: {len(result['selected'])} of {result['candidates']} candidate items; "
+        f"source {newsletter.name} -->",
+        "",
+        f"**Framing:** {use_case.get('framing', '').strip()}",
+        "",
+        f"**Audience:** {'; '.join(audience)}",
+    ]
+    if targeted:
+        lines.append(f"**Profile roles:** {', '.join(targeted)}")
+    lines += ["", f"**Full newsletter link:** [full {issue} newsletter](../{newsletter.name})", "", "---", "",
+              "## Candidate Items", ""]
+    for entry in result["selected"]:
+        item = items[entry["item"]]
+        note = " | ".join([f"{entry['score']:g}", " > ".join(item["section"]) or "-",
+                           ", ".join(entry["matched"] + [f"tag:{t}" for t in entry["tags"]]) or "-"])
+        lines += [f"<!-- {note} -->", item["text"], ""]
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def latest_newsletter() -> Path:
+    found = sorted(OUTPUT_DIR.glob("*_newsletter.md"), key=lambda p: p.stat().st_mtime, reverse=True)
+    if not found:
+        raise SystemExit("Error: No newsletter found in output/. Pass a NEWSLETTER path.")
+    return found[0]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-select newsletter items for Phase 5b use-case briefings")
+    parser.add_argument("newsletter", nargs="?", type=Path, help="Assembled newsletter (default: latest in output/)")
+    parser.add_argument("--out-dir", type=Path, default=OUTPUT_DIR / "briefings" / "inputs")
+    parser.add_argument("--definitions", type=Path, default=DEFINITIONS_PATH)
+    parser.add_argument("--use-case", action="append", dest="use_cases", metavar="ID",
+                        help="Only this use case (repeatable)")
+    parser.add_argument("--max-items", type=int, default=15, help="Items kept per briefing (default: 15)")
+    parser.add_argument("--min-score", type=float, default=3.0, help="Minimum item score (default: 3)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for large inputs (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the manifest as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    newsletter = args.newsletter or latest_newsletter()
+    if not newsletter.is_file():
+        raise SystemExit(f"Error: File not found: {newsletter}")
+    use_cases = (safe_load_yaml(args.definitions.read_text(encoding="utf-8")) or {}).get("use_cases", [])
+    if args.use_cases:
+        unknown = set(args.use_cases) - {uc["id"] for uc in use_cases}
+        if unknown:
+            raise SystemExit(f"Error: Unknown use case(s): {', '.join(sorted(unknown))}")
+        use_cases = [uc for uc in use_cases if uc["id"] in args.use_cases]
+
+    title, items = parse_items(newsletter.read_text(encoding="utf-8"))
+    issue = re.sub(r"\s+Newsletter$", "", title) or newsletter.stem
+    tags = load_taxonomy_tags()
+    profile = profile_terms()
+    index = build_index(items, use_cases, tags, profile)
+    results = score_all(use_cases, items, index, tags, args.min_score, args.max_items, args.jobs)
+
+    prefix_match = CYCLE_PREFIX.match(newsletter.name)
+    prefix = prefix_match.group(1) if prefix_match else newsletter.stem.split("_")[0]
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    by_id = {uc["id"]: uc for uc in use_cases}
+    manifest = {"newsletter": str(newsletter), "items": len(items), "use_cases": []}
+    for result in results:
+        path = args.out_dir / f"{prefix}_{result['id']}.md"
+        if result["qualifies"]:
+            path.write_text(render_input(result, by_id[result["id"]], items, issue, newsletter, profile["roles"]),
+                            encoding="utf-8")
+        elif path.exists():
+            path.unlink()
+        manifest["use_cases"].append({
+            **result,
+            "input": str(path) if result["qualifies"] else None,
+        })
+    (args.out_dir / f"{prefix}_manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    if args.json:
+        print(json.dumps(manifest, indent=2))
+        return 0
+    print(f"{newsletter.name}: {len(items)} items, {sum(r['qualifies'] for r in results)}/{len(results)} briefings")
+    for result in results:
+        status = f"{len(result['selected']):>2} of {result['candidates']:>2} candidates" if result["qualifies"] \
+            else f"skipped ({result['candidates']} < {MIN_ITEMS} candidates)"
+        print(f"  {result['id']:<24} {status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -70,14 +70,16 @@ prepared_epoch="$(date +%s)"
 cycle="${START}_to_${END}"
 marker="workspace/newsletter_run_marker_${cycle}.json"
 
-mkdir -p workspace workspace/archived/preflight
+mkdir -p workspace workspace/archived
 
 if [ "$NO_REUSE" -eq 1 ]; then
-  archive_dir="workspace/archived/preflight/${cycle}_${timestamp}"
-  mkdir -p "$archive_dir"
+  # Content-addressed archive: re-runs only add manifest entries for unchanged files.
+  # Keyed by the END month, as archive_workspace.sh does.
+  # Restore with: python3 tools/workspace_store.py restore --cycle YYYY-MM --run preflight_<timestamp>
+  archive_run="preflight_${timestamp}"
 
   echo "Preparing clean cycle (no-reuse): $cycle"
-  echo "Archive dir: $archive_dir"
+  echo "Archive: workspace/archived/manifests/${cycle_ym}.json (run ${archive_run})"
 
   patterns=(
     "workspace/newsletter_phase1a_url_manifest_${START}_to_${END}.md"
@@ -102,21 +104,23 @@ if [ "$NO_REUSE" -eq 1 ]; then
     "workspace/${cycle_ym}_editorial_corrections.md"
   )
 
-  moved=0
+  to_archive=()
   for pattern in "${patterns[@]}"; do
     while IFS= read -r file; do
       [ -z "$file" ] && continue
-      mv "$file" "$archive_dir/"
-      moved=$((moved + 1))
+      to_archive+=("$file")
     done < <(compgen -G "$pattern" || true)
   done
 
   if [ -f "$output_file" ]; then
-    mv "$output_file" "$archive_dir/$(basename "$output_file" .md)_preflight_prev.md"
-    moved=$((moved + 1))
+    to_archive+=("$output_file")
   fi
 
-  echo "Archived ${moved} cycle artifact(s)."
+  if [ "${#to_archive[@]}" -gt 0 ]; then
+    python3 tools/workspace_store.py put --cycle "$cycle_ym" --run "$archive_run" --remove "${to_archive[@]}"
+  fi
+
+  echo "Archived ${#to_archive[@]} cycle artifact(s)."
 else
   echo "Preparing cycle marker only (reuse allowed): $cycle"
 fi
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Opt-in stage timers, cProfile and tracemalloc hooks for the pipeline tools.
+
+Disabled by default; every hook is then a no-op. Enable per run with either
+
+  NEWSLETTER_PROFILE=1                      stage timers only
+  NEWSLETTER_PROFILE=cprofile,tracemalloc   timers plus the named extras
+  --profile / --profile=cprofile            same, as a command-line flag
+
+On exit an enabled tool writes one JSON trace to .cache/traces/ (override with
+NEWSLETTER_TRACE_DIR) holding wall/CPU time, peak RSS, the tracemalloc peak,
+per-stage call counts and durations, and the top cProfile entries (the full
+profile is saved alongside as <trace>.prof). tools/trace_report.py collects a
+cycle's traces into one report.
+
+Usage in a tool:
+  import profiling
+
+  profiling.init("extract_event_sources")   # before argument parsing
+  with profiling.stage("fetch"):
+      ...
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterator
+
+from paths import CACHE_DIR
+
+TRACE_DIR = Path(os.environ.get("NEWSLETTER_TRACE_DIR", CACHE_DIR / "traces"))
+
+MODES = {"timers", "cprofile", "tracemalloc"}
+TOP_FUNCTIONS = 25
+
+# Imported by every instrumented tool, so the disabled path stays import-light:
+# json, datetime, threading and the profilers load only once init() enables tracing.
+_NULL = nullcontext()
+_state: dict[str, Any] | None = None
+
+
+def _parse_modes(value: str) -> set[str]:
+    value = value.strip().lower()
+    if not value or value in {"0", "false", "no", "off"}:
+        return set()
+    modes = {"timers"}
+    for part in value.split(","):
+        part = part.strip()
+        if part in MODES:
+            modes.add(part)
+        elif part == "all":
+            modes |= MODES
+    return modes
+
+
+def _take_profile_flag(argv: list[str]) -> str | None:
+    """Remove --profile[=MODES] from argv in place; return its value if present."""
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg == "--profile":
+            del argv[i]
+            return "1"
+        if arg.startswith("--profile="):
+            del argv[i]
+            return arg.split("=", 1)[1] or "1"
+    return None
+
+
+def enabled() -> bool:
+    return _state is not None
+
+
+def init(tool: str, argv: list[str] | None = None) -> bool:
+    """Enable tracing for this process if requested; return whether it is on.
+
+    Strips --profile from argv (default sys.argv) so the tool's own argument
+    parsing never sees it.
+    """
+    global _state
+    argv = sys.argv if argv is None else argv
+    flag = _take_profile_flag(argv)
+    modes = _parse_modes(flag if flag is not None else os.environ.get("NEWSLETTER_PROFILE", ""))
+    if not modes or _state is not None:
+        return _state is not None
+
+    import atexit
+    import datetime as dt
+    import threading
+
+    _state = {
+        "tool": tool,
+        "modes": sorted(modes),
+        "argv": argv[1:],
+        "started_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "t0": time.perf_counter(),
+        "cpu0": time.process_time(),
+        "stages": {},
+        "profiler": None,
+        "lock": threading.Lock(),
+    }
+    if "tracemalloc" in modes:
+        import tracemalloc
+
+        tracemalloc.start()
+    if "cprofile" in modes:
+        import cProfile
+
+        _state["profiler"] = cProfile.Profile()
+        _state["profiler"].enable()
+    atexit.unregister(write_trace)  # one hook per process, however many tools init in it
+    atexit.register(write_trace)
+    return True
+
+
+@contextmanager
+def _timed(state: dict[str, Any], name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with state["lock"]:
+            entry = state["stages"].setdefault(name, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+            entry["calls"] += 1
+            entry["total_s"] += elapsed
+            entry["max_s"] = max(entry["max_s"], elapsed)
+
+
+def stage(name: str):
+    """Context manager timing one occurrence of a named stage (thread-safe)."""
+    if _state is None:
+        return _NULL
+    return _timed(_state, name)
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _profile_top(profiler: Any, prof_path: Path) -> list[dict[str, Any]]:
+    import pstats
+
+    profiler.dump_stats(str(prof_path))
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_cc, calls, tottime, cumtime, _callers) in stats.stats.items():
+        rows.append({
+            "function": f"{Path(filename).name}:{line}({func})",
+            "calls": calls,
+            "tottime_s": round(tottime, 6),
+            "cumtime_s": round(cumtime, 6),
+        })
+    rows.sort(key=lambda r: r["cumtime_s"], reverse=True)
+    return rows[:TOP_FUNCTIONS]
+
+
+def write_trace() -> Path | None:
+    """Write the run's trace JSON (registered with atexit by init)."""
+    global _state
+    state, _state = _state, None
+    if state is None:
+        return None
+    if state["profiler"] is not None:
+        state["profiler"].disable()
+    import datetime as dt
+    import json
+
+    stamp = dt.datetime.now(tz=dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    TRACE_DIR.mkdir(parents=True, exist_ok=True)
+    path = TRACE_DIR / f"{state['tool']}-{stamp}-{os.getpid()}.json"
+    run = 1
+    while path.exists():  # same tool twice within a second of one dispatcher batch
+        run += 1
+        path = TRACE_DIR / f"{state['tool']}-{stamp}-{os.getpid()}-{run}.json"
+
+    trace: dict[str, Any] = {
+        "tool": state["tool"],
+        "modes": state["modes"],
+        "argv": state["argv"],
+        "pid": os.getpid(),
+        "started_at_utc": state["started_at_utc"],
+        "finished_at_epoch": time.time(),
+        "wall_s": round(time.perf_counter() - state["t0"], 6),
+        "cpu_s": round(time.process_time() - state["cpu0"], 6),
+        "peak_rss_kb": _peak_rss_kb(),
+        "stages": {
+            name: {**entry, "total_s": round(entry["total_s"], 6), "max_s": round(entry["max_s"], 6)}
+            for name, entry in state["stages"].items()
+        },
+    }
+    if "tracemalloc" in state["modes"]:
+        import tracemalloc
+
+        trace["tracemalloc_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    if state["profiler"] is not None:
+        prof_path = path.with_suffix(".prof")
+        trace["cprofile_top"] = _profile_top(state["profiler"], prof_path)
+        trace["cprofile_path"] = str(prof_path)
+
+    path.write_text(json.dumps(trace, indent=2) + "\n", encoding="utf-8")
+    print(f"[profile] trace written: {path}", file=sys.stderr)
+    return path
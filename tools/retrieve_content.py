@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""Deterministic Phase 1B retrieval: fetch manifest URLs and extract main text.
+
+Reads the Phase 1A manifest (JSON sidecar when present, otherwise URLs in the
+markdown), fetches every URL concurrently over the shared keep-alive pool,
+converts HTML to compact main-content markdown with a streaming parser, and
+writes token-budgeted source-text chunks per Phase 1B source. The Phase 1B
+agent then reads these chunks and writes the interim files; it no longer
+fetches pages or strips boilerplate itself.
+
+Extracted text is cached under .cache/retrieval/ by URL (with ETag /
+Last-Modified revalidation) and by content hash, so unchanged pages are
+never re-extracted.
+
+Usage:
+  python3 tools/retrieve_content.py START_DATE END_DATE [--max-tokens 12000] [--workers 12]
+
+Output:
+  workspace/newsletter_phase1b_source_text_<source>_<START>_to_<END>_partNN.md
+  workspace/newsletter_phase1b_source_text_<START>_to_<END>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin
+
+import paths
+from http_pool import HttpPool, decode_body
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKSPACE = ROOT / "workspace"
+CACHE_DIR = paths.CACHE_DIR / "retrieval"
+
+SOURCES = ("github", "vscode", "visualstudio", "jetbrains", "xcode")
+CHARS_PER_TOKEN = 4
+
+# Manifest source names / feed ids -> Phase 1B interim source.
+BUCKET_RULES = [
+    (re.compile(r"vs ?code|code\.visualstudio", re.IGNORECASE), "vscode"),
+    (re.compile(r"visual ?studio|visual_studio|^vs_|devblogs\.microsoft|azure", re.IGNORECASE), "visualstudio"),
+    (re.compile(r"jetbrains", re.IGNORECASE), "jetbrains"),
+    (re.compile(r"xcode", re.IGNORECASE), "xcode"),
+    (re.compile(r"github|^gh_", re.IGNORECASE), "github"),
+]
+
+SKIP_TAGS = {"script", "style", "noscript", "svg", "nav", "header", "footer", "aside", "form", "template", "iframe"}
+MAIN_TAGS = {"main", "article"}
+BLOCK_TAGS = {"p", "div", "section", "br", "tr", "table", "ul", "ol", "pre", "blockquote", "dl", "dt", "dd"}
+HEADING_TAGS = {"h1": "#", "h2": "##", "h3": "###", "h4": "####", "h5": "#####", "h6": "######"}
+URL_RE = re.compile(r"https?://[^\s)>\]\"'<|]+")
+
+
+class MainTextExtractor(HTMLParser):
+    """Streaming HTML -> compact markdown, preferring <main>/<article> content."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._body: list[str] = []
+        self._main: list[str] = []
+        self._href: str | None = None
+        self._link_text: list[str] = []
+
+    def _emit(self, text: str) -> None:
+        self._body.append(text)
+        if self._main_depth:
+            self._main.append(text)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        if tag in MAIN_TAGS:
+            self._main_depth += 1
+        if tag in HEADING_TAGS:
+            self._emit(f"\n\n{HEADING_TAGS[tag]} ")
+        elif tag == "li":
+            self._emit("\n- ")
+        elif tag in BLOCK_TAGS:
+            self._emit("\n")
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            if href and not href.startswith(("#", "javascript:", "mailto:")):
+                self._href = urljoin(self.base_url, href)
+                self._link_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth:
+            return
+        if tag == "a" and self._href is not None:
+            text = " ".join("".join(self._link_text).split())
+            if text:
+                self._emit(f"[{text}]({self._href})")
+            self._href = None
+        elif tag in HEADING_TAGS or tag in BLOCK_TAGS:
+            self._emit("\n")
+        if tag in MAIN_TAGS:
+            self._main_depth = max(0, self._main_depth - 1)
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._href is not None:
+            self._link_text.append(data)
+            return
+        self._emit(re.sub(r"\s+", " ", data))
+
+    def text(self) -> str:
+        parts = self._main if "".join(self._main).strip() else self._body
+        lines = [line.strip() for line in "".join(parts).splitlines()]
+        out: list[str] = []
+        for line in lines:
+            if not line or line in ("-", "#"):
+                if out and out[-1] != "":
+                    out.append("")
+                continue
+            out.append(line)
+        return "\n".join(out).strip() + "\n"
+
+
+def html_to_text(html: str, base_url: str, chunk_size: int = 65536) -> str:
+    parser = MainTextExtractor(base_url)
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+    parser.close()
+    return parser.text()
+
+
+def _strip_html_values(value: Any, base_url: str) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_html_values(v, base_url) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_strip_html_values(v, base_url) for v in value]
+    if isinstance(value, str) and "<" in value and ">" in value:
+        return html_to_text(value, base_url).strip()
+    return value
+
+
+def extract_text(result: dict[str, Any], url: str) -> str:
+    content_type = result["headers"].get("content-type", "").lower()
+    body = decode_body(result)
+    if "json" in content_type:
+        try:
+            return json.dumps(_strip_html_values(json.loads(body), url), indent=1, ensure_ascii=False) + "\n"
+        except ValueError:
+            return body
+    if "html" in content_type or body.lstrip()[:15].lower().startswith(("<!doctype", "<html")):
+        return html_to_text(body, url)
+    return body
+
+
+class RetrievalCache:
+    """URL -> metadata and content-hash -> extracted text, on disk."""
+
+    def __init__(self, root: Path = CACHE_DIR) -> None:
+        self.urls = root / "urls"
+        self.texts = root / "text"
+
+    def _url_path(self, url: str) -> Path:
+        return self.urls / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def meta(self, url: str) -> dict[str, Any] | None:
+        path = self._url_path(url)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def text(self, content_sha: str) -> str | None:
+        try:
+            return (self.texts / f"{content_sha}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def store(self, url: str, meta: dict[str, Any], text: str | None) -> None:
+        self.urls.mkdir(parents=True, exist_ok=True)
+        self.texts.mkdir(parents=True, exist_ok=True)
+        if text is not None:
+            (self.texts / f"{meta['content_sha256']}.md").write_text(text, encoding="utf-8")
+        self._url_path(url).write_text(json.dumps(meta, indent=1) + "\n", encoding="utf-8")
+
+
+def retrieve(pool: HttpPool, cache: RetrievalCache, url: str, max_age_s: float) -> dict[str, Any]:
+    meta = cache.meta(url)
+    if meta and time.time() - meta.get("fetched_at", 0) < max_age_s:
+        text = cache.text(meta["content_sha256"])
+        if text is not None:
+            return {"url": url, "ok": True, "cache": "fresh", "status_code": meta["status_code"], "text": text, "error": ""}
+
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    result = pool.get(url, headers=headers or None)
+
+    if result["status_code"] == 304 and meta:
+        text = cache.text(meta["content_sha256"])
+        if text is not None:
+            cache.store(url, {**meta, "fetched_at": time.time()}, None)
+            return {"url": url, "ok": True, "cache": "revalidated", "status_code": 304, "text": text, "error": ""}
+        result = pool.get(url)
+
+    if not result["fetch_ok"]:
+        return {"url": url, "ok": False, "cache": "miss", "status_code": result["status_code"], "text": "", "error": result["error"]}
+
+    content_sha = hashlib.sha256(result["body"]).hexdigest()
+    text = cache.text(content_sha)
+    state = "content-hit"
+    if text is None:
+        text = extract_text(result, result["final_url"] or url)
+        state = "miss"
+    cache.store(url, {
+        "url": url,
+        "status_code": result["status_code"],
+        "etag": result["headers"].get("etag", ""),
+        "last_modified": result["headers"].get("last-modified", ""),
+        "content_sha256": content_sha,
+        "fetched_at": time.time(),
+    }, text if state == "miss" else None)
+    return {"url": url, "ok": True, "cache": state, "status_code": result["status_code"], "text": text, "error": ""}
+
+
+def bucket_for(item: dict[str, Any]) -> str:
+    for key in (item.get("feed_id", ""), item.get("source", ""), item.get("url", "")):
+        for pattern, bucket in BUCKET_RULES:
+            if key and pattern.search(key):
+                return bucket
+    return "github"
+
+
+def load_manifest(start: str, end: str) -> list[dict[str, Any]]:
+    stem = WORKSPACE / f"newsletter_phase1a_url_manifest_{start}_to_{end}"
+    json_path, md_path = stem.with_suffix(".json"), stem.with_suffix(".md")
+    if json_path.exists():
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        items = [c for c in data.get("candidates", []) if c.get("ok") is not False and c.get("in_scope", True)]
+    elif md_path.exists():
+        urls = dict.fromkeys(URL_RE.findall(md_path.read_text(encoding="utf-8")))
+        items = [{"url": u, "source": ""} for u in urls]
+    else:
+        raise SystemExit(f"Phase 1A manifest not found: {md_path}")
+    for item in items:
+        item["bucket"] = bucket_for(item)
+    return items
+
+
+def split_paragraph(para: str, limit: int) -> list[str]:
+    """Split an oversized paragraph at line boundaries, and long lines at character boundaries."""
+    pieces: list[str] = []
+    current = ""
+    for line in para.split("\n"):
+        while len(line) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            pieces.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_documents(docs: list[dict[str, Any]], max_chars: int) -> list[str]:
+    """Pack documents into parts of at most max_chars, splitting long pages at blank lines
+    and oversized paragraphs (e.g. JSON bodies) across continuation parts."""
+    parts: list[str] = []
+    current = ""
+    for doc in docs:
+        header = f"## Source: {doc['url']}\n\n"
+        limit = max(1, max_chars - len(header) - len(" (continued)") - 2)
+        if current and len(current) + len(header) + len(doc["text"]) > max_chars:
+            parts.append(current)
+            current = ""
+        current += header
+        for para in doc["text"].split("\n\n"):
+            for piece in split_paragraph(para.strip(), limit):
+                piece += "\n\n"
+                if len(current) + len(piece) > max_chars:
+                    parts.append(current)
+                    current = f"## Source: {doc['url']} (continued)\n\n"
+                current += piece
+    if current.strip():
+        parts.append(current)
+    return parts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch Phase 1A manifest URLs and extract main text")
+    parser.add_argument("start", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--max-tokens", type=int, default=12000, help="Token budget per output part")
+    parser.add_argument("--workers", type=int, default=12)
+    parser.add_argument("--max-age-hours", type=float, default=12, help="Reuse cached text without revalidation")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    for value in (args.start, args.end):
+        try:
+            dt.datetime.strptime(value, "%Y-%m-%d")
+        except ValueError as exc:
+            raise SystemExit(f"Invalid date '{value}', expected YYYY-MM-DD") from exc
+
+    items = load_manifest(args.start, args.end)
+    cache = RetrievalCache()
+    with HttpPool() as pool, ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(lambda i: retrieve(pool, cache, i["url"], args.max_age_hours * 3600), items))
+
+    WORKSPACE.mkdir(parents=True, exist_ok=True)
+    for stale in WORKSPACE.glob(f"newsletter_phase1b_source_text_*_{args.start}_to_{args.end}_part*.md"):
+        stale.unlink()
+
+    index: dict[str, Any] = {
+        "generated_at_utc": dt.datetime.now(tz=dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "start": args.start,
+        "end": args.end,
+        "max_tokens_per_part": args.max_tokens,
+        "sources": {},
+        "urls": [],
+    }
+    for source in SOURCES:
+        docs = [
+            {"url": item["url"], "text": result["text"]}
+            for item, result in zip(items, results)
+            if item["bucket"] == source and result["ok"] and result["text"].strip()
+        ]
+        files = []
+        for number, part in enumerate(chunk_documents(docs, args.max_tokens * CHARS_PER_TOKEN), start=1):
+            path = WORKSPACE / f"newsletter_phase1b_source_text_{source}_{args.start}_to_{args.end}_part{number:02d}.md"
+            path.write_text(
+                f"# Phase 1B Source Text: {source} (part {number})\n"
+                f"**DATE_RANGE**: {args.start} to {args.end}\n\n{part}",
+                encoding="utf-8",
+            )
+            files.append(str(path.relative_to(ROOT)))
+        index["sources"][source] = {"documents": len(docs), "parts": files}
+
+    for item, result in zip(items, results):
+        index["urls"].append({
+            "url": item["url"],
+            "source": item["bucket"],
+            "ok": result["ok"],
+            "status_code": result["status_code"],
+            "cache": result["cache"],
+            "chars": len(result["text"]),
+            "error": result["error"],
+        })
+
+    index_path = WORKSPACE / f"newsletter_phase1b_source_text_{args.start}_to_{args.end}.json"
+    index_path.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+
+    ok = sum(1 for r in results if r["ok"])
+    cached = sum(1 for r in results if r["cache"] != "miss" and r["ok"])
+    print(f"Wrote {index_path}")
+    print(f"Retrieval summary: urls={len(results)} ok={ok} failed={len(results) - ok} cached={cached}")
+    for source, info in index["sources"].items():
+        print(f"  {source}: documents={info['documents']} parts={len(info['parts'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,42 @@
 #!/usr/bin/env python3
-"""Run a single Copilot CLI phase with timeout and log capture."""
+"""Run a single Copilot CLI phase with timeout and log capture.
+
+Phases that declare their output artifacts (--output) are memoized: the run is
+fingerprinted from the final prompt text, agent, model, declared input
+artifacts (--input; files, directories or globs, "!glob" to leave files out),
+the agent definition, every file of each skill the prompt references and every
+tools/ script it names (plus the sibling modules those scripts import). A successful run stores its
+outputs and log under .cache/phases/<key>/; a later run with the same
+fingerprint restores them instead of invoking copilot.
+
+Usage:
+  python3 tools/run_copilot_phase.py --agent NAME --model MODEL --prompt-file P --log L
+      [--input PATH]... [--output PATH]... [--refresh | --no-cache]
+"""
 
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+import paths
+import profiling
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = paths.CACHE_DIR / "phases"
+SKILL_REF = re.compile(r"\.github/skills/([A-Za-z0-9_.-]+)/")
+TOOL_REF = re.compile(r"\btools/([A-Za-z0-9_.-]+\.(?:py|sh))\b")
+TOOL_IMPORT = re.compile(r"^\s*(?:from|import)\s+(\w+)", re.MULTILINE)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run one Copilot CLI prompt with timeout")
@@ -17,6 +46,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--log", required=True, help="Path to log file")
     parser.add_argument("--timeout", type=int, default=1800, help="Timeout seconds")
     parser.add_argument("--cwd", default=".", help="Working directory")
+    parser.add_argument(
+        "--context-query",
+        help="Append a token-bounded context pack from tools/search_index.py for this topic",
+    )
+    parser.add_argument("--context-tokens", type=int, default=1500, help="Context pack token budget")
+    parser.add_argument("--input", action="append", default=[],
+                        help="Input artifact (file, directory or glob) the phase reads; repeatable. "
+                             "A leading ! excludes the matching files")
+    parser.add_argument("--output", action="append", default=[],
+                        help="Output artifact the phase writes; repeatable. Enables the phase cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore a cached result but store the new one")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the phase cache")
     return parser.parse_args()
 
 
@@ -34,13 +75,156 @@ def _to_text(value: object) -> str:
     return str(value)
 
 
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _expand(spec: str, base: Path) -> list[Path]:
+    """A declared input as the sorted list of files it covers."""
+    path = base / spec
+    if glob.has_magic(spec):
+        paths = [Path(p) for p in glob.glob(str(path))]
+    else:
+        paths = [path]
+    files = []
+    for candidate in paths:
+        if candidate.is_dir():
+            files += [f for f in candidate.rglob("*") if f.is_file() and "__pycache__" not in f.parts]
+        elif candidate.is_file():
+            files.append(candidate)
+    return sorted(files)
+
+
+def _referenced_tools(prompt: str, base: Path) -> list[str]:
+    """tools/ scripts the prompt names, plus the tools/ modules they import."""
+    pending = sorted(set(TOOL_REF.findall(prompt)))
+    seen: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = base / "tools" / name
+        if name.endswith(".py") and path.is_file():
+            for module in TOOL_IMPORT.findall(path.read_text(encoding="utf-8", errors="replace")):
+                if (base / "tools" / f"{module}.py").is_file():
+                    pending.append(f"{module}.py")
+    return [f"tools/{name}" for name in sorted(seen)]
+
+
+def phase_fingerprint(args: argparse.Namespace, prompt: str, base: Path) -> dict[str, object]:
+    """Everything a phase's result depends on; the cache key is its hash."""
+    excluded = {str(f.resolve()) for spec in args.input if spec.startswith("!")
+                for f in _expand(spec[1:], base)}
+    excluded |= {str((base / o).resolve()) for o in args.output}
+    specs = [spec for spec in args.input if not spec.startswith("!")]
+    specs += [f".github/skills/{name}" for name in sorted(set(SKILL_REF.findall(prompt)))]
+    specs += _referenced_tools(prompt, base)
+    specs += [f".github/agents/{args.agent}.agent.md", ".github/copilot-instructions.md"]
+    files: dict[str, str] = {}
+    for spec in specs:
+        matched = [f for f in _expand(spec, base) if str(f.resolve()) not in excluded]
+        if not matched:
+            files[spec] = "missing"
+        for f in matched:
+            files[os.path.relpath(f, base)] = _file_digest(f)
+    return {
+        "agent": args.agent,
+        "model": args.model,
+        "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        "outputs": sorted(args.output),
+        "files": dict(sorted(files.items())),
+    }
+
+
+class PhaseCache:
+    """Fingerprint key -> a phase's output artifacts and log, on disk."""
+
+    def __init__(self, root: Path = CACHE_DIR) -> None:
+        self.root = root
+
+    @staticmethod
+    def key(fingerprint: dict[str, object]) -> str:
+        return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+    def restore(self, key: str, base: Path) -> dict[str, object] | None:
+        entry = self.root / key
+        try:
+            meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        stored = [entry / "files" / str(i) for i in range(len(meta["outputs"]))]
+        if not all(f.is_file() for f in stored):
+            return None
+        for rel, src in zip(meta["outputs"], stored):
+            dest = base / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, dest)
+        meta["log"] = (entry / "log.txt").read_text(encoding="utf-8")
+        return meta
+
+    def store(self, key: str, base: Path, fingerprint: dict[str, object], outputs: list[str], log: str) -> bool:
+        if not all((base / rel).is_file() and (base / rel).stat().st_size > 0 for rel in outputs):
+            return False
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        (tmp / "files").mkdir(parents=True)
+        for i, rel in enumerate(outputs):
+            shutil.copyfile(base / rel, tmp / "files" / str(i))
+        (tmp / "log.txt").write_text(log, encoding="utf-8")
+        meta = {"outputs": outputs, "fingerprint": fingerprint, "stored_at_epoch": int(time.time())}
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=1) + "\n", encoding="utf-8")
+        shutil.rmtree(self.root / key, ignore_errors=True)
+        os.replace(tmp, self.root / key)
+        return True
+
+
+def build_context_section(query: str, max_tokens: int) -> str:
+    from search_index import SearchIndex
+
+    with SearchIndex() as index:
+        index.update()
+        pack = index.context_pack(query, max_tokens=max_tokens)
+    if not pack:
+        return ""
+    return (
+        "\n\n---\n\n## Relevant Local Context\n\n"
+        f"Passages from kb/, reference/, archive/ and output/ matching: {query}\n\n{pack}"
+    )
+
+
 def run_phase(args: argparse.Namespace) -> int:
     prompt_path = Path(args.prompt_file)
     if not prompt_path.exists():
         print(f"ERROR: prompt file not found: {prompt_path}", file=sys.stderr)
         return 2
 
-    prompt = prompt_path.read_text(encoding="utf-8")
+    with profiling.stage("config_load"):
+        prompt = prompt_path.read_text(encoding="utf-8")
+    if args.context_query:
+        with profiling.stage("extract"):
+            prompt += build_context_section(args.context_query, args.context_tokens)
+
+    cache = key = fingerprint = None
+    base = Path(args.cwd)
+    if args.output and not args.no_cache:
+        cache = PhaseCache()
+        with profiling.stage("fingerprint"):
+            fingerprint = phase_fingerprint(args, prompt, base)
+            key = cache.key(fingerprint)
+        if not args.refresh:
+            with profiling.stage("cache_restore"):
+                hit = cache.restore(key, base)
+            if hit is not None:
+                combined = f"[phase-cache] hit {key[:12]}: restored {', '.join(hit['outputs'])}\n" + hit["log"]
+                write_log(Path(args.log), combined)
+                print(combined, end="")
+                return 0
+
     cmd = [
         "copilot",
         "--agent",
@@ -58,16 +242,21 @@ def run_phase(args: argparse.Namespace) -> int:
     ]
 
     try:
-        completed = subprocess.run(
-            cmd,
-            cwd=args.cwd,
-            text=True,
-            capture_output=True,
-            timeout=args.timeout,
-            check=False,
-        )
+        with profiling.stage("agent"):
+            completed = subprocess.run(
+                cmd,
+                cwd=args.cwd,
+                text=True,
+                capture_output=True,
+                timeout=args.timeout,
+                check=False,
+            )
         combined = _to_text(completed.stdout) + _to_text(completed.stderr)
-        write_log(Path(args.log), combined)
+        with profiling.stage("write"):
+            write_log(Path(args.log), combined)
+            if cache is not None and completed.returncode == 0:
+                if cache.store(key, base, fingerprint, args.output, combined):
+                    combined += f"[phase-cache] stored {key[:12]}\n"
         if combined:
             print(combined, end="")
         return completed.returncode
@@ -81,6 +270,7 @@ def run_phase(args: argparse.Namespace) -> int:
 
 
 def main() -> int:
+    profiling.init("run_copilot_phase")
     args = parse_args()
     return run_phase(args)
 
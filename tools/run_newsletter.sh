@@ -18,6 +18,9 @@
 # Optional strict gate:
 #   STRICT=1 (default) runs tools/validate_pipeline_strict.sh at the end.
 #   STRICT=0 disables the strict contract validator.
+# Profiling:
+#   Tools run with NEWSLETTER_PROFILE=1 (or --profile) write traces; when any
+#   exist, tools/trace_report.py collects them into one cycle report.
 
 set -euo pipefail
 cd "$(git rev-parse --show-toplevel)"
@@ -225,6 +228,14 @@ echo "  Phase 4  (Newsletter):        $([ -f "$OUTPUT" ] && echo 'DONE' || echo
 echo "  Validation:                   $([ -f "$OUTPUT" ] && echo 'RUN' || echo 'PENDING')"
 echo "══════════════════════════════════════════════════════"
 
+# ── Profiling traces (tools run with NEWSLETTER_PROFILE=1 or --profile) ──
+TRACE_DIR="${NEWSLETTER_TRACE_DIR:-${NEWSLETTER_CACHE_DIR:-.cache}/traces}"
+if compgen -G "$TRACE_DIR/*.json" >/dev/null; then
+  echo ""
+  echo "Trace Report:"
+  python3 tools/trace_report.py "$START" "$END" | sed 's/^/  /'
+fi
+
 if [ "$STRICT" = "1" ]; then
   echo ""
   echo "Strict Contract Gate:"
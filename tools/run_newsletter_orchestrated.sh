@@ -28,6 +28,7 @@ NO_REUSE="${NO_REUSE:-1}"
 MAX_RETRIES="${MAX_RETRIES:-2}"
 PHASE_TIMEOUT_SECONDS="${PHASE_TIMEOUT_SECONDS:-1800}"
 BENCHMARK_MODE="${BENCHMARK_MODE:-}"
+PHASE_CACHE="${PHASE_CACHE:-1}"
 
 if [ -z "$BENCHMARK_MODE" ] && [ "$START" = "2025-12-05" ] && [ "$END" = "2026-02-13" ]; then
   BENCHMARK_MODE="feb2026_consistency"
@@ -65,6 +66,9 @@ receipt_file="workspace/newsletter_phase_receipts_${END}.json"
 cycle_ym="$(echo "$END" | cut -d- -f1-2)"
 editorial_review="workspace/${cycle_ym}_editorial_review.md"
 phase45_polishing_report="workspace/newsletter_phase4_5_polishing_${END}.md"
+# Curator notes as kb/EVENT_SOURCES.yaml finds them (globs minus exclude_globs),
+# in the ";"-separated cache input form; "!" marks an excluded glob.
+curator_note_inputs="workspace/curator_notes_*.md;workspace/[A-Za-z]*.md;!workspace/curator_notes_processed_*.md;!workspace/curator_notes_editorial_signals_*.md;!workspace/newsletter_*.md"
 CHECK_FAILURES=0
 
 year="${END%%-*}"
@@ -241,12 +245,30 @@ run_phase() {
   local prompt_file="$4"
   local artifacts_csv="$5"
   local receipts_csv="$6"
+  local inputs_csv="${7:-}"
+  local -a cache_args=() artifacts inputs
+
+  # Phase cache: identical prompt/agent/model/inputs/skills restore the
+  # previous outputs instead of re-running. Retries bypass the cached entry.
+  if [ "$PHASE_CACHE" = "1" ]; then
+    IFS=';' read -r -a artifacts <<< "$artifacts_csv"
+    IFS=';' read -r -a inputs <<< "$inputs_csv"
+    for f in "${artifacts[@]}"; do
+      [ -n "$f" ] && cache_args+=(--output "$f")
+    done
+    for f in ${inputs[@]+"${inputs[@]}"}; do
+      [ -n "$f" ] && cache_args+=(--input "$f")
+    done
+  fi
 
   local attempt=1
   while [ "$attempt" -le "$MAX_RETRIES" ]; do
     local log_file="$log_dir/${phase_name}.attempt${attempt}.log"
     echo
     echo "[orchestrator] phase=$phase_name agent=$agent_name attempt=$attempt timeout=${timeout_s}s"
+    if [ "$attempt" -gt 1 ] && [ "${#cache_args[@]}" -gt 0 ]; then
+      cache_args+=(--refresh)
+    fi
 
     if python3 tools/run_copilot_phase.py \
       --agent "$agent_name" \
@@ -254,7 +276,8 @@ run_phase() {
       --prompt-file "$prompt_file" \
       --log "$log_file" \
       --timeout "$timeout_s" \
-      --cwd "$ROOT"; then
+      --cwd "$ROOT" \
+      ${cache_args[@]+"${cache_args[@]}"}; then
       normalize_receipts "$phase_name" "$artifacts_csv" "$receipts_csv"
       if check_artifacts_and_receipts "$phase_name" "$artifacts_csv" "$receipts_csv"; then
         echo "[orchestrator] phase=$phase_name PASS"
@@ -310,6 +333,7 @@ echo "[orchestrator] run_id=$run_id"
 echo "[orchestrator] date_range=$START to $END"
 echo "[orchestrator] model=$MODEL"
 echo "[orchestrator] benchmark_mode=${BENCHMARK_MODE:-<none>}"
+echo "[orchestrator] phase_cache=$PHASE_CACHE"
 
 if [ "$NO_REUSE" = "1" ]; then
   echo
@@ -432,34 +456,40 @@ Run validate_newsletter.sh on $output_file.
 Stop after these outputs and receipts are complete." 
 
 run_phase phase0_scope customer_newsletter "$PHASE_TIMEOUT_SECONDS" "$phase0_prompt" \
-  "$scope_contract" "phase0_scope_contract"
+  "$scope_contract" "phase0_scope_contract" "kb/SOURCES.yaml"
 
 run_phase phase1a_manifest customer_newsletter "$PHASE_TIMEOUT_SECONDS" "$phase1a_prompt" \
-  "$manifest" "phase1a_manifest"
+  "$manifest" "phase1a_manifest" "kb/SOURCES.yaml"
 
 run_phase phase1b_retrieval customer_newsletter "$PHASE_TIMEOUT_SECONDS" "$phase1b_prompt" \
   "$phase1b_github;$phase1b_vscode;$phase1b_visualstudio;$phase1b_jetbrains;$phase1b_xcode" \
-  "phase1b_github;phase1b_vscode;phase1b_visualstudio;phase1b_jetbrains;phase1b_xcode"
+  "phase1b_github;phase1b_vscode;phase1b_visualstudio;phase1b_jetbrains;phase1b_xcode" \
+  "$manifest"
 
 run_phase phase1c_consolidation editorial-analyst "$PHASE_TIMEOUT_SECONDS" "$phase1c_prompt" \
-  "$discoveries" "phase1c_discoveries"
+  "$discoveries" "phase1c_discoveries" \
+  "$phase1b_github;$phase1b_vscode;$phase1b_visualstudio;$phase1b_jetbrains;$phase1b_xcode"
 
 if [ "$CURATOR_REQUIRED" = "1" ]; then
   run_phase phase1_5_curator editorial-analyst "$PHASE_TIMEOUT_SECONDS" "$phase15_prompt" \
     "workspace/curator_notes_processed_${cycle_ym}.md;workspace/curator_notes_editorial_signals_${cycle_ym}.md" \
-    "phase1_5_curator_processed;phase1_5_curator_signals"
+    "phase1_5_curator_processed;phase1_5_curator_signals" \
+    "$curator_note_inputs"
 else
   echo "[orchestrator] phase=phase1_5_curator skipped (no curator notes detected)"
 fi
 
 run_phase phase2_events customer_newsletter "$PHASE_TIMEOUT_SECONDS" "$phase2_prompt" \
-  "$phase2_event_sources;$phase2_events" "phase2_event_sources;phase2_events"
+  "$phase2_event_sources;$phase2_events" "phase2_event_sources;phase2_events" \
+  "kb/EVENT_SOURCES.yaml;$curator_note_inputs"
 
 run_phase phase3_curation editorial-analyst "$PHASE_TIMEOUT_SECONDS" "$phase3_prompt" \
-  "$phase3_curated" "phase3_curated"
+  "$phase3_curated" "phase3_curated" \
+  "$discoveries;workspace/curator_notes_editorial_signals_${cycle_ym}.md"
 
 run_phase phase4_assembly customer_newsletter "$PHASE_TIMEOUT_SECONDS" "$phase4_prompt" \
-  "$output_file;$phase45_polishing_report;$scope_results;$editorial_review" "phase4_output;phase4_5_polishing;phase4_scope_results;phase4_editorial_review"
+  "$output_file;$phase45_polishing_report;$scope_results;$editorial_review" "phase4_output;phase4_5_polishing;phase4_scope_results;phase4_editorial_review" \
+  "$phase3_curated;$phase2_events;$scope_contract"
 
 run_check validate_newsletter bash .github/skills/newsletter-validation/scripts/validate_newsletter.sh "$output_file"
 run_check score_structural bash tools/score-structural.sh
@@ -482,6 +512,7 @@ cat > "$run_dir/summary.md" <<EOF
 - Date Range: $START to $END
 - Model: $MODEL
 - Benchmark Mode: ${BENCHMARK_MODE:-none}
+- Phase Cache: $PHASE_CACHE
 - Output: $output_file
 - Receipts: $receipt_file
 - Logs: $log_dir
@@ -56,7 +56,9 @@ echo "D2: Auto-Archive (6 pts)"
 if [ -x "tools/archive_workspace.sh" ]; then score 2 2 "archive_workspace.sh exists and is executable"
 else score 0 2 "archive_workspace.sh missing or not executable"; fi
 
+# Plain copies from before the content-addressed store, plus files recorded in its manifest.
 archived_feb=$( (ls workspace/archived/2026-02_* 2>/dev/null || true) | wc -l | tr -d ' ')
+archived_feb=$((archived_feb + $(python3 tools/workspace_store.py list --cycle 2026-02 2>/dev/null | grep -c '^    ' || true)))
 if [ "$archived_feb" -ge 5 ]; then score 2 2 "Feb files archived ($archived_feb files)"
 else score 0 2 "Feb files not archived ($archived_feb files)"; fi
 
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Local full-text search over the KB, reference docs and past newsletters.
+
+Builds a SQLite FTS5 index of heading-scoped passages from kb/*.md,
+reference/**/*.md, archive/**/*.md and output/**/*.md. Updates are
+incremental: a file is re-chunked only when its size/mtime and hash change.
+
+Usage:
+  python3 tools/search_index.py update
+  python3 tools/search_index.py search "coding agent governance" [--limit 10]
+  python3 tools/search_index.py context "BYOK providers" [--max-tokens 1500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any
+
+from paths import CACHE_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = CACHE_DIR / "search_index.sqlite"
+
+CORPUS_GLOBS = [
+    "kb/*.md",
+    "reference/**/*.md",
+    "archive/**/*.md",
+    "output/**/*.md",
+]
+
+# Passages are capped so a single hit never dominates a context pack.
+MAX_PASSAGE_CHARS = 1200
+CHARS_PER_TOKEN = 4
+
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+TERM_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.+-]*")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS passages USING fts5(
+    body,
+    heading,
+    path UNINDEXED,
+    start_line UNINDEXED,
+    end_line UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def chunk_markdown(text: str) -> list[dict[str, Any]]:
+    """Split markdown into heading-scoped passages of at most MAX_PASSAGE_CHARS."""
+    passages: list[dict[str, Any]] = []
+    heading = ""
+    buf: list[str] = []
+    start = 1
+
+    def flush(end: int) -> None:
+        body = "\n".join(buf).strip()
+        if body:
+            passages.append({"heading": heading, "body": body, "start_line": start, "end_line": end})
+        buf.clear()
+
+    in_fence = False
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            flush(line_no - 1)
+            heading = match.group(1)
+            start = line_no + 1
+            continue
+        if not buf:
+            start = line_no
+        buf.append(line)
+        size = sum(len(b) + 1 for b in buf)
+        if size >= MAX_PASSAGE_CHARS and (not line.strip() or size >= 2 * MAX_PASSAGE_CHARS):
+            flush(line_no)
+    flush(len(text.splitlines()))
+    return passages
+
+
+def to_match_query(query: str) -> str:
+    """Turn free text into an FTS5 OR-query of quoted terms (bm25 does the ranking)."""
+    terms = [t.lower() for t in TERM_RE.findall(query)]
+    return " OR ".join(f'"{t}"' for t in dict.fromkeys(terms))
+
+
+class SearchIndex:
+    """Python API over the FTS5 passage index."""
+
+    def __init__(self, db_path: Path = DB_PATH, root: Path = ROOT) -> None:
+        self.root = root
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        try:
+            self.conn.executescript(SCHEMA)
+        except sqlite3.OperationalError as exc:
+            raise SystemExit(f"SQLite FTS5 unavailable in this Python build: {exc}") from exc
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _corpus(self) -> list[Path]:
+        found: set[Path] = set()
+        for pattern in CORPUS_GLOBS:
+            found.update(p for p in self.root.glob(pattern) if p.is_file())
+        return sorted(found)
+
+    def update(self) -> dict[str, int]:
+        known = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self.conn.execute("SELECT path, size, mtime_ns, sha256 FROM files")
+        }
+        stats = {"scanned": 0, "indexed": 0, "unchanged": 0, "removed": 0}
+        seen: set[str] = set()
+
+        with self.conn:
+            for path in self._corpus():
+                rel = path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                stats["scanned"] += 1
+                st = path.stat()
+                previous = known.get(rel)
+                if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+                    stats["unchanged"] += 1
+                    continue
+                raw = path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                if previous and previous[2] == digest:
+                    self.conn.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (st.st_size, st.st_mtime_ns, rel),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                self.conn.execute("DELETE FROM passages WHERE path = ?", (rel,))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                    (rel, st.st_size, st.st_mtime_ns, digest),
+                )
+                self.conn.executemany(
+                    "INSERT INTO passages (body, heading, path, start_line, end_line) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (p["body"], p["heading"], rel, p["start_line"], p["end_line"])
+                        for p in chunk_markdown(raw.decode("utf-8", errors="ignore"))
+                    ],
+                )
+                stats["indexed"] += 1
+
+            for rel in set(known) - seen:
+                self.conn.execute("DELETE FROM passages WHERE path = ?", (rel,))
+                self.conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                stats["removed"] += 1
+        return stats
+
+    def search(self, query: str, limit: int = 10, raw: bool = False) -> list[dict[str, Any]]:
+        match = query if raw else to_match_query(query)
+        if not match:
+            return []
+        rows = self.conn.execute(
+            "SELECT path, start_line, end_line, heading, "
+            "snippet(passages, 0, '[', ']', ' ... ', 16), body, bm25(passages, 1.0, 2.0) AS score "
+            "FROM passages WHERE passages MATCH ? ORDER BY score LIMIT ?",
+            (match, limit),
+        ).fetchall()
+        return [
+            {
+                "path": r[0],
+                "start_line": r[1],
+                "end_line": r[2],
+                "heading": r[3],
+                "snippet": r[4],
+                "body": r[5],
+                "score": round(-r[6], 4),
+            }
+            for r in rows
+        ]
+
+    def context_pack(self, query: str, max_tokens: int = 1500, limit: int = 40) -> str:
+        """Concatenate the best passages for a topic, stopping at the token budget."""
+        budget = max_tokens * CHARS_PER_TOKEN
+        parts: list[str] = []
+        used = 0
+        for hit in self.search(query, limit=limit):
+            block = f"### {hit['path']}:{hit['start_line']}-{hit['end_line']} ({hit['heading']})\n\n{hit['body']}\n"
+            if used + len(block) > budget:
+                continue
+            parts.append(block)
+            used += len(block)
+        return "\n".join(parts)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Full-text search over kb/reference/newsletters")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="SQLite index path")
+    parser.add_argument("--no-update", action="store_true", help="Skip the incremental refresh")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("update", help="Incrementally (re)index the corpus")
+
+    search = sub.add_parser("search", help="Ranked snippets with file/line")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=10)
+    search.add_argument("--raw", action="store_true", help="Pass query through as FTS5 syntax")
+
+    context = sub.add_parser("context", help="Token-bounded context pack for a topic")
+    context.add_argument("query")
+    context.add_argument("--max-tokens", type=int, default=1500)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with SearchIndex(args.db) as index:
+        if args.command == "update" or not args.no_update:
+            stats = index.update()
+            if args.command == "update":
+                print("Index update: " + " ".join(f"{k}={v}" for k, v in stats.items()))
+                return 0
+
+        if args.command == "context":
+            pack = index.context_pack(args.query, max_tokens=args.max_tokens)
+            print(pack, end="")
+            return 0 if pack else 1
+
+        try:
+            hits = index.search(args.query, limit=args.limit, raw=args.raw)
+        except sqlite3.OperationalError as exc:
+            raise SystemExit(f"Invalid query: {exc}") from exc
+
+    for hit in hits:
+        print(f"{hit['path']}:{hit['start_line']}  [{hit['score']}]  {hit['heading']}")
+        print(f"    {' '.join(hit['snippet'].split())}")
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""Single-pass Layer 2 heuristic scoring and intelligence-sync checks.
+
+Walks .github/skills/ once, keeps every text file in memory and evaluates
+all heuristic rules (and the intelligence propagation checks) against that
+corpus, parsing Python scripts with ast in-process. Scores, report text and
+exit codes match the grep-based scripts it replaces: each rule keeps grep's
+line-oriented, case-insensitive semantics, and binary files are skipped as
+grep's stdout does.
+
+Usage:
+  python3 tools/skill_scorer.py heuristic [RUN_DIR]
+  python3 tools/skill_scorer.py sync
+
+Exit: heuristic 0 when all three tiers pass; sync 0 when every check passes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = ROOT / ".github" / "skills"
+
+SKILLS = [
+    "url-manifest",
+    "content-retrieval",
+    "content-consolidation",
+    "events-extraction",
+    "content-curation",
+    "newsletter-assembly",
+    "newsletter-validation",
+    "kb-maintenance",
+]
+FORBIDDEN_PATTERNS = ["Dylan", "Copilot Free", "Copilot Individual", "Copilot Pro+"]
+FORBIDDEN_EXCLUDE_DIRS = {"examples", "scripts"}
+DOMAIN_TERMS = ["enterprise", "GA", "IDE"]
+
+INPUT_RE = re.compile(r"input|reads|receives|source.*file", re.IGNORECASE)
+OUTPUT_RE = re.compile(r"output|produces|writes|deliverable", re.IGNORECASE)
+KEYWORD_RE = re.compile(r"keywords|keyword", re.IGNORECASE)
+SELECTION_RE = re.compile(r"(priorit|hierarchy|selection)", re.IGNORECASE)
+TAXONOMY_RE = re.compile(r"(Copilot.*GitHub Platform|category.*taxonomy|canonical.*categor)", re.IGNORECASE)
+ORDERING_SKILL_RE = re.compile(r"(section.*order|mandatory.*section|Introduction.*Copilot.*Event)", re.IGNORECASE)
+ORDERING_REF_RE = re.compile(r"(section.*order|mandatory.*section)", re.IGNORECASE)
+INTERNAL_LINK_RE = re.compile(r"\]\(((?:references|scripts|examples)/[^)\n]+)")
+WEIGHT_RE = re.compile(r"\*\*[0-9]+\.[0-9]+x\*\*")
+
+
+def read_text(path: Path) -> str | None:
+    """File text, or None when missing or binary (NUL bytes / invalid UTF-8, as grep decides)."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if b"\0" in data:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def lines_of(text: str) -> list[str]:
+    """grep's view of a file: newline-separated, a missing final newline still ends a line."""
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def sorted_glob(directory: Path, pattern: str) -> list[Path]:
+    """Shell-style glob: sorted, hidden entries skipped."""
+    return sorted(p for p in directory.glob(pattern) if not p.name.startswith("."))
+
+
+class SkillCorpus:
+    """Every file under .github/skills/, read once."""
+
+    def __init__(self, skills_dir: Path = SKILLS_DIR) -> None:
+        self.skills_dir = skills_dir
+        self.texts: dict[Path, str | None] = {}
+        for dirpath, dirnames, filenames in os.walk(skills_dir):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                self.texts[path] = read_text(path)
+
+    def text(self, path: Path) -> str | None:
+        if path in self.texts:
+            return self.texts[path]
+        return read_text(path)
+
+    def skill_md(self, skill: str) -> Path:
+        return self.skills_dir / skill / "SKILL.md"
+
+    def references(self, skill: str) -> list[Path]:
+        return [p for p in sorted_glob(self.skills_dir / skill / "references", "*.md") if p.is_file()]
+
+    def search(self, paths: list[Path], regex: re.Pattern[str]) -> bool:
+        return any(regex.search(text) for text in map(self.text, paths) if text is not None)
+
+
+class Score:
+    def __init__(self) -> None:
+        self.t1 = 0
+        self.t2 = 0
+        self.t3 = 0
+        self.details: list[str] = []
+
+    def detail(self, message: str) -> None:
+        self.details.append(message)
+
+
+def score_heuristics(corpus: SkillCorpus) -> Score:
+    score = Score()
+    rel_prefix = ".github/skills/"
+
+    # One pass over every line for the tree-wide rules (T1.3 and T3.2).
+    forbidden_counts = {pattern: 0 for pattern in FORBIDDEN_PATTERNS}
+    lowered = {pattern: pattern.lower() for pattern in FORBIDDEN_PATTERNS}
+    wikilinks = 0
+    emdashes = 0
+    for path, text in corpus.texts.items():
+        if text is None:
+            continue
+        relative = path.relative_to(corpus.skills_dir)
+        scan_forbidden = not FORBIDDEN_EXCLUDE_DIRS.intersection(relative.parts[:-1])
+        low_text = text.lower()
+        forbidden_hits = [p for p in FORBIDDEN_PATTERNS if lowered[p] in low_text] if scan_forbidden else []
+        has_wikilink = scan_forbidden and "[[" in text
+        has_emdash = "—" in text
+        if not (forbidden_hits or has_wikilink or has_emdash):
+            continue
+        # grep -r | grep -v "examples/" filters on the printed "path:line".
+        grep_prefix = f"{rel_prefix}{relative.as_posix()}:"
+        for line in lines_of(text):
+            if forbidden_hits:
+                low = line.lower()
+                for pattern in forbidden_hits:
+                    if lowered[pattern] in low:
+                        forbidden_counts[pattern] += 1
+            if has_wikilink and "[[" in line:
+                wikilinks += 1
+            if has_emdash and "—" in line and "examples/" not in grep_prefix + line:
+                emdashes += 1
+
+    # ── Tier 1 ──
+    for skill in SKILLS:
+        text = corpus.text(corpus.skill_md(skill))
+        if text is not None and text.startswith("---"):
+            score.t1 += 1
+        else:
+            score.detail(f"T1.1 FAIL: {skill} missing frontmatter")
+
+    for skill in SKILLS:
+        text = corpus.text(corpus.skill_md(skill))
+        if text is None:
+            continue
+        has_input = "true" if INPUT_RE.search(text) else "false"
+        has_output = "true" if OUTPUT_RE.search(text) else "false"
+        if has_input == has_output == "true":
+            score.t1 += 1
+        else:
+            score.detail(f"T1.2 FAIL: {skill} missing input/output spec (in={has_input} out={has_output})")
+
+    for pattern in FORBIDDEN_PATTERNS:
+        if forbidden_counts[pattern] == 0:
+            score.t1 += 1
+        else:
+            score.detail(f"T1.3 FAIL: Found '{pattern}' {forbidden_counts[pattern]}x in skills (excl. examples/scripts)")
+    if wikilinks == 0:
+        score.t1 += 1
+    else:
+        score.detail(f"T1.3 FAIL: Found '[[' wikilinks {wikilinks}x in skills")
+
+    kw_count = sum(1 for skill in SKILLS if corpus.search([corpus.skill_md(skill)], KEYWORD_RE))
+    if kw_count >= 6:
+        score.t1 += 5
+    elif kw_count >= 4:
+        score.t1 += 3
+        score.detail(f"T1.4 PARTIAL: {kw_count}/8 skills have keywords")
+    else:
+        score.detail(f"T1.4 FAIL: Only {kw_count}/8 skills have keywords in description")
+    score.detail(f"── Tier 1: {score.t1}/26 ──")
+
+    # ── Tier 2 ──
+    refs = [ref for skill in SKILLS for ref in corpus.references(skill)]
+    substantive = sum(1 for ref in refs if (corpus.text(ref) or "").count("\n") >= 30)
+    if refs:
+        ratio = substantive * 100 // len(refs)
+        if ratio >= 75:
+            score.t2 += 4
+        elif ratio >= 50:
+            score.t2 += 2
+            score.detail(f"T2.1 PARTIAL: {substantive}/{len(refs)} refs ≥30 lines")
+        else:
+            score.detail(f"T2.1 FAIL: Only {substantive}/{len(refs)} refs ≥30 lines")
+    else:
+        score.detail("T2.1 FAIL: No reference files found")
+
+    all_skill_mds = [p for p in sorted_glob(corpus.skills_dir, "*/SKILL.md") if p.is_file()]
+    for term in DOMAIN_TERMS:
+        if corpus.search(all_skill_mds, re.compile(re.escape(term), re.IGNORECASE)):
+            score.t2 += 1
+        else:
+            score.detail(f"T2.2 FAIL: Domain term '{term}' not found in any skill")
+
+    def skill_or_refs(skill: str, skill_re: re.Pattern[str], ref_re: re.Pattern[str]) -> bool:
+        return corpus.search([corpus.skill_md(skill)], skill_re) or corpus.search(corpus.references(skill), ref_re)
+
+    if skill_or_refs("content-curation", SELECTION_RE, SELECTION_RE):
+        score.t2 += 1
+    else:
+        score.detail("T2.3 FAIL: content-curation missing selection priority")
+    if skill_or_refs("events-extraction", TAXONOMY_RE, TAXONOMY_RE):
+        score.t2 += 1
+    else:
+        score.detail("T2.4 FAIL: events-extraction missing category taxonomy")
+    if skill_or_refs("newsletter-assembly", ORDERING_SKILL_RE, ORDERING_REF_RE):
+        score.t2 += 1
+    else:
+        score.detail("T2.5 FAIL: newsletter-assembly missing section ordering")
+    score.detail(f"── Tier 2: {score.t2}/10 ──")
+
+    # ── Tier 3 ──
+    bad_refs = 0
+    for skill in SKILLS:
+        text = corpus.text(corpus.skill_md(skill))
+        if text is None:
+            continue
+        for target in INTERNAL_LINK_RE.findall(text):
+            resolved = corpus.skills_dir / skill / target
+            if not resolved.is_file() and not resolved.is_dir():
+                bad_refs += 1
+    if bad_refs == 0:
+        score.t3 += 2
+    else:
+        score.detail(f"T3.1 FAIL: {bad_refs} broken internal references")
+
+    if emdashes == 0:
+        score.t3 += 1
+    else:
+        score.detail(f"T3.2 FAIL: {emdashes} em dashes found")
+
+    validator = corpus.skills_dir / "newsletter-validation" / "scripts" / "validate_newsletter.sh"
+    syntax_ok = validator.is_file() and subprocess.run(
+        ["bash", "-n", str(validator)], capture_output=True, check=False
+    ).returncode == 0
+    if syntax_ok:
+        score.t3 += 1
+    else:
+        score.detail("T3.3 FAIL: validate_newsletter.sh missing or invalid syntax")
+
+    scripts_dir = corpus.skills_dir / "kb-maintenance" / "scripts"
+    py_ok = True
+    for script in sorted_glob(scripts_dir, "*.py"):
+        if not script.is_file():
+            continue
+        try:
+            ast.parse(script.read_text(encoding="utf-8"))
+        except (SyntaxError, ValueError, UnicodeDecodeError):
+            py_ok = False
+            score.detail(f"T3.4 FAIL: .github/skills/kb-maintenance/scripts/{script.name} has syntax errors")
+    poll_exists = (scripts_dir / "poll_sources.py").is_file()
+    if py_ok and poll_exists:
+        score.t3 += 1
+    elif not poll_exists:
+        score.detail("T3.4 FAIL: poll_sources.py missing")
+    score.detail(f"── Tier 3: {score.t3}/5 ──")
+    return score
+
+
+def _status(ok: bool) -> str:
+    return "PASS" if ok else "FAIL"
+
+
+def render_heuristic_report(score: Score) -> str:
+    t1, t2, t3 = score.t1, score.t2, score.t3
+    total = t1 + t2 + t3
+    if t1 < 22:
+        weakest = "**Tier 1** — fix structural content issues first (cheapest)"
+    elif t2 < 6:
+        weakest = "**Tier 2** — deepen reference content and domain coverage"
+    elif t3 < 3:
+        weakest = "**Tier 3** — fix broken references, syntax errors, or forbidden patterns"
+    else:
+        weakest = "All tiers pass. Proceed to benchmark testing."
+    details = "".join(f"{line}\n" for line in score.details)
+    return f"""# Heuristic Quality Score: {total}/41
+
+## Tier Breakdown
+
+| Tier | Score | Max | Focus |
+|------|-------|-----|-------|
+| Tier 1 (Structural content) | {t1} | 26 | Sections, fields, format |
+| Tier 2 (Content depth) | {t2} | 10 | Specificity, domain coverage |
+| Tier 3 (Semantic) | {t3} | 5 | Path validity, no hallucination |
+| **Total** | **{total}** | **41** | |
+
+## Thresholds
+
+| Tier | Required | Actual | Status |
+|------|----------|--------|--------|
+| Tier 1 | ≥22/26 | {t1}/26 | {_status(t1 >= 22)} |
+| Tier 2 | ≥6/10 | {t2}/10 | {_status(t2 >= 6)} |
+| Tier 3 | ≥3/5 | {t3}/5 | {_status(t3 >= 3)} |
+
+## Details
+
+```
+{details}```
+
+## Weakest Dimension
+
+{weakest}
+"""
+
+
+def run_heuristic(run_dir: str) -> int:
+    score = score_heuristics(SkillCorpus())
+    report = render_heuristic_report(score)
+    print(report)
+    if run_dir:
+        # Relative run dirs resolve from the repo root, as the shell scorers cd there.
+        out = ROOT / run_dir / "scores" / "heuristic-scores.md"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(report + "\n", encoding="utf-8")
+        print(f"(Written to {run_dir}/scores/heuristic-scores.md)")
+    return 0 if score.t1 >= 22 and score.t2 >= 6 and score.t3 >= 3 else 1
+
+
+def count_matching_lines(path: Path, regex: re.Pattern[str]) -> int:
+    text = read_text(path)
+    return 0 if text is None else sum(1 for line in lines_of(text) if regex.search(line))
+
+
+def run_sync() -> int:
+    rule = "══════════════════════════════════════════════════════"
+    results: list[tuple[str, bool]] = []
+
+    selection = ROOT / ".github/skills/content-curation/references/selection-criteria.md"
+    sc_weights = count_matching_lines(selection, WEIGHT_RE)
+    if sc_weights >= 10:
+        results.append((f"Selection-criteria has all 10 weights ({sc_weights} found)", True))
+    else:
+        results.append((f"Selection-criteria has all 10 weights ({sc_weights} found, need >=10)", False))
+
+    has_35x = count_matching_lines(selection, re.compile(r"3\.5x"))
+    has_platform = count_matching_lines(selection, re.compile("Platform Openness"))
+    if has_35x >= 1 and has_platform >= 1:
+        results.append(("Competitive Positioning (3.5x) and Platform Openness present", True))
+    else:
+        results.append((
+            f"Competitive Positioning (3.5x={has_35x}) and Platform Openness ({has_platform}) present", False
+        ))
+
+    surfaces = [
+        (".github/agents/customer_newsletter.agent.md", r"LEARNINGS.md", "Agent reads LEARNINGS.md"),
+        (".github/skills/content-curation/SKILL.md", r"editorial-intelligence",
+         "content-curation refs editorial-intelligence"),
+        (".github/skills/content-consolidation/SKILL.md", r"editorial-intelligence",
+         "content-consolidation refs editorial-intelligence"),
+        (".github/skills/newsletter-assembly/SKILL.md", r"editorial-intelligence",
+         "newsletter-assembly refs editorial-intelligence"),
+        (".github/skills/content-retrieval/SKILL.md", r"source-intelligence",
+         "content-retrieval refs source-intelligence"),
+        (".github/skills/newsletter-polishing/SKILL.md", r"polishing-intelligence",
+         "newsletter-polishing refs polishing-intelligence"),
+        (".github/prompts/run_pipeline.prompt.md", r"Phase 4.5|newsletter-polishing",
+         "Pipeline prompt references Phase 4.5 polishing"),
+    ]
+    for rel, pattern, label in surfaces:
+        refs = count_matching_lines(ROOT / rel, re.compile(pattern))
+        results.append((f"{label} ({refs} refs)", refs >= 1))
+
+    print(rule)
+    print("  Intelligence Sync Check")
+    print(rule)
+    print()
+    for label, ok in results:
+        print(f"  {_status(ok)}: {label}")
+    passed = sum(1 for _, ok in results if ok)
+    failed = len(results) - passed
+    print()
+    print(rule)
+    print(f"  Results: {passed}/{len(results)} checks passed")
+    print(f"  Surfaces verified: {len(results)}")
+    print(rule)
+    print()
+    if failed == 0:
+        print("** ALL CHECKS PASS **")
+        return 0
+    print(f"** {failed} CHECK(S) FAILED **")
+    return 1
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Single-pass skill heuristic scoring and sync checks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    heuristic = sub.add_parser("heuristic", help="Layer 2 heuristic quality score (41 pts)")
+    heuristic.add_argument("run_dir", nargs="?", default="", help="Write scores/heuristic-scores.md here")
+    sub.add_parser("sync", help="Intelligence propagation checks")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "heuristic":
+        return run_heuristic(args.run_dir)
+    return run_sync()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,7 +56,7 @@ run_suite "Benchmark Regression (3 cycles)" "bash tools/test_benchmark_regressio
 # Layer 5: Intelligence checks
 run_suite "Intelligence Sync (7 surfaces)" "bash tools/check_intelligence_sync.sh > /dev/null"
 run_suite "Intelligence Effectiveness (7 gaps)" "bash tools/test_intelligence_effectiveness.sh > /dev/null"
-run_suite "Polishing Rules (6 checks)" "bash tools/test_polishing_rules.sh > /dev/null"
+run_suite "Polishing Rules (8 checks)" "bash tools/test_polishing_rules.sh > /dev/null"
 
 # Summary
 echo "══════════════════════════════════════════════════════"
@@ -3,7 +3,7 @@
 # Tests for archive_workspace.sh
 # ══════════════════════════════════════════════════════════════
 # Creates a temp workspace with representative files, runs the archive script,
-# and asserts files moved/skipped as expected.
+# and asserts files land in the content-addressed store and leave workspace/.
 #
 # Usage: bash tools/test_archive_workspace.sh
 
@@ -39,6 +39,18 @@ assert_file_missing() {
   fi
 }
 
+assert_archived() {
+  # $1 = cycle, $2 = archived basename, $3 = expected content
+  local got
+  got=$(cd "$FAKE_REPO" && python3 tools/workspace_store.py cat --cycle "$1" "$2" 2>/dev/null)
+  if [ "$got" = "$3" ]; then
+    PASS=$((PASS + 1))
+  else
+    echo "  FAIL: $2 in cycle $1: expected '$3', got '$got'"
+    FAIL=$((FAIL + 1))
+  fi
+}
+
 assert_output_contains() {
   if echo "$1" | grep -q "$2"; then
     PASS=$((PASS + 1))
@@ -73,20 +85,25 @@ echo "Test 1: Explicit prefix (2026-03)"
 # We need to run the script from inside the fake repo so its git rev-parse resolves to FAKE_REPO
 mkdir -p "$FAKE_REPO/tools"
 cp tools/archive_workspace.sh "$FAKE_REPO/tools/archive_workspace.sh"
+cp tools/workspace_store.py "$FAKE_REPO/tools/workspace_store.py"
 
 output=$(
   cd "$FAKE_REPO" && \
   bash tools/archive_workspace.sh 2026-03 2>&1
 )
 
-# Phase files should be archived with prefix
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-03_newsletter_phase1a_url_manifest_2026-03-01_to_2026-03-31.md"
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-03_newsletter_phase1a_discoveries_2026-03-01_to_2026-03-31.md"
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-03_newsletter_phase2_events_2026-03-31.md"
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-03_newsletter_phase3_curated_sections_2026-03-31.md"
+# Phase files should be archived in the store under the cycle
+assert_archived 2026-03 newsletter_phase1a_url_manifest_2026-03-01_to_2026-03-31.md "url manifest content"
+assert_archived 2026-03 newsletter_phase1a_discoveries_2026-03-01_to_2026-03-31.md "discoveries content"
+assert_archived 2026-03 newsletter_phase2_events_2026-03-31.md "events content"
+assert_archived 2026-03 newsletter_phase3_curated_sections_2026-03-31.md "curated content"
 
 # Editorial artifacts should be archived
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-03_editorial_corrections.md"
+assert_archived 2026-03 2026-03_editorial_corrections.md "corrections"
+
+# No plain copies next to the store: archive size is deduplicated content only
+assert_file_missing "$FAKE_REPO/workspace/archived/2026-03_newsletter_phase2_events_2026-03-31.md"
+assert_file_missing "$FAKE_REPO/workspace/archived/2026-03_editorial_corrections.md"
 
 # Original files should be gone
 assert_file_missing "$FAKE_REPO/workspace/newsletter_phase1a_url_manifest_2026-03-01_to_2026-03-31.md"
@@ -96,19 +113,44 @@ assert_file_missing "$FAKE_REPO/workspace/2026-03_editorial_corrections.md"
 assert_file_exists "$FAKE_REPO/workspace/newsletter_phase1a_url_manifest_2026-02-01_to_2026-02-28.md"
 assert_file_exists "$FAKE_REPO/workspace/2026-02_editorial_review.md"
 
-# Output should report moved count
-assert_output_contains "$output" "moved"
+# Output should report the archived count
+assert_output_contains "$output" "5 archived"
+
+# Content-addressed snapshot: manifest plus one object per unique file
+assert_file_exists "$FAKE_REPO/workspace/archived/manifests/2026-03.json"
+assert_output_contains "$output" "new_objects=5"
 
 echo "  Assertions: $((PASS)) passed so far"
 echo ""
 
-# ── Test 2: Idempotency (running again should SKIP) ──
-echo "Test 2: Idempotency (re-run skips already archived)"
-# Re-create one file to test the skip path
+# ── Test 2: Re-runs archive new content and deduplicate identical content ──
+echo "Test 2: Re-run archives recreated files as a new run"
 echo "recreated" > "$FAKE_REPO/workspace/newsletter_phase2_events_2026-03-31.md"
 output2=$(cd "$FAKE_REPO" && bash tools/archive_workspace.sh 2026-03 2>&1)
 
-assert_output_contains "$output2" "SKIP"
+assert_output_contains "$output2" "new_objects=1"
+assert_file_missing "$FAKE_REPO/workspace/newsletter_phase2_events_2026-03-31.md"
+
+# The re-run's new content is still captured in the object store
+objects_before=$(find "$FAKE_REPO/workspace/archived/objects" -name '*.gz' | wc -l | tr -d ' ')
+echo "recreated" > "$FAKE_REPO/workspace/newsletter_phase3_curated_sections_2026-03-31.md"
+output2b=$(cd "$FAKE_REPO" && bash tools/archive_workspace.sh 2026-03 2>&1)
+objects_after=$(find "$FAKE_REPO/workspace/archived/objects" -name '*.gz' | wc -l | tr -d ' ')
+assert_output_contains "$output2b" "new_objects=0"
+if [ "$objects_after" -eq "$objects_before" ]; then
+  PASS=$((PASS + 1))
+else
+  echo "  FAIL: identical re-run content added objects ($objects_before -> $objects_after)"
+  FAIL=$((FAIL + 1))
+fi
+
+restored=$(cd "$FAKE_REPO" && python3 tools/workspace_store.py cat --cycle 2026-03 newsletter_phase2_events_2026-03-31.md)
+if [ "$restored" = "recreated" ]; then
+  PASS=$((PASS + 1))
+else
+  echo "  FAIL: cat from object store returned: $restored"
+  FAIL=$((FAIL + 1))
+fi
 
 echo "  Assertions: $((PASS)) passed so far"
 echo ""
@@ -121,7 +163,7 @@ echo "auto content" > "$FAKE_REPO/workspace/newsletter_phase1a_url_manifest_2026
 
 output3=$(cd "$FAKE_REPO" && bash tools/archive_workspace.sh 2>&1)
 
-assert_file_exists "$FAKE_REPO/workspace/archived/2026-04_newsletter_phase1a_url_manifest_2026-04-01_to_2026-04-30.md"
+assert_archived 2026-04 newsletter_phase1a_url_manifest_2026-04-01_to_2026-04-30.md "auto content"
 assert_file_missing "$FAKE_REPO/workspace/newsletter_phase1a_url_manifest_2026-04-01_to_2026-04-30.md"
 
 echo "  Assertions: $((PASS)) passed so far"
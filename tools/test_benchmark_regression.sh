@@ -7,7 +7,9 @@
 #
 # Tests the SCORING TOOLS and BENCHMARK DATA, not the LLM skills.
 # This validates that our comparison infrastructure produces
-# meaningful scores across different cycle shapes.
+# meaningful scores across different cycle shapes. Also runs every
+# benchmark mode against every archived cycle and compares the
+# failing-entry counts with tests/fixtures/benchmark/contract_matrix.json.
 #
 # Usage: bash tools/test_benchmark_regression.sh [CYCLE...]
 #   No args: runs Dec, Aug, Jun (all cycles with rich data)
@@ -125,6 +127,23 @@ for cycle_def in "${CYCLES[@]}"; do
   echo ""
 done
 
+# Benchmark-mode contracts: every mode against every archived cycle, compared
+# with the recorded failing-entry counts (refresh after an intended contract
+# change with: python3 tools/benchmark_contracts.py matrix archive
+#   --baseline tests/fixtures/benchmark/contract_matrix.json --update-baseline)
+echo "--- Benchmark-mode contract matrix ---"
+if python3 tools/benchmark_contracts.py matrix archive \
+    --baseline tests/fixtures/benchmark/contract_matrix.json > "$TMPDIR/contract_matrix.md" 2>&1; then
+  echo "  No drift from tests/fixtures/benchmark/contract_matrix.json"
+  RESULTS="$RESULTS  PASS (no drift): contract-matrix\n"
+  TOTAL_PASS=$((TOTAL_PASS + 1))
+else
+  sed -n '/^## Drift/,$p' "$TMPDIR/contract_matrix.md" | sed 's/^/  /'
+  RESULTS="$RESULTS  FAIL (drift or error): contract-matrix\n"
+  TOTAL_FAIL=$((TOTAL_FAIL + 1))
+fi
+echo ""
+
 # Summary
 TOTAL=$((TOTAL_PASS + TOTAL_FAIL))
 echo "==================================="
@@ -9,9 +9,11 @@
 #   1. Polishing intelligence file exists with >=10 patterns
 #   2. Product names dictionary exists
 #   3. Polishing skill exists and validates
-#   4. Benchmark polishing data exists (manifest.json)
+#   4. Benchmark polishing data exists and reads back through tools/edit_corpus.py
 #   5. Published newsletters pass Tier 1 structural rules
 #   6. Product name dictionary has >=15 entries
+#   7. Delta-chain corpus round trip (synthetic corpus: convert, verify, read)
+#   8. Edit analytics over the synthetic corpus
 #
 # Usage: bash tools/test_polishing_rules.sh
 # Exit: 0 if all checks pass, 1 if any fail
@@ -83,10 +85,9 @@ fi
 # when run locally with benchmark data present, and gracefully skips in CI.
 manifest="benchmark/polishing/manifest.json"
 if [ -f "$manifest" ]; then
-  disc_count=$(python3 -c "import json; print(len(json.load(open('$manifest'))['discussions']))" 2>/dev/null || true)
-  diff_count=$(python3 -c "import json; print(json.load(open('$manifest'))['total_diffs'])" 2>/dev/null || true)
-  disc_count=$(printf '%s' "$disc_count" | tr -d '[:space:]')
-  diff_count=$(printf '%s' "$diff_count" | tr -d '[:space:]')
+  stats=$(python3 tools/edit_corpus.py --root benchmark/polishing stats 2>/dev/null || true)
+  disc_count=$(printf '%s' "$stats" | sed -n 's/.*discussions=\([0-9]*\).*/\1/p')
+  diff_count=$(printf '%s' "$stats" | sed -n 's/.*diffs=\([0-9]*\).*/\1/p')
   disc_count=${disc_count:-0}
   diff_count=${diff_count:-0}
   if [ "$disc_count" -ge 10 ] && [ "$diff_count" -ge 100 ]; then
@@ -94,6 +95,11 @@ if [ -f "$manifest" ]; then
   else
     check "Polishing benchmark data ($disc_count discussions, $diff_count diffs, need >=10/100)" 1
   fi
+  if python3 tools/edit_corpus.py --root benchmark/polishing verify >/dev/null 2>&1; then
+    check "Polishing benchmark revisions and diffs rebuild from the corpus" 0
+  else
+    check "Polishing benchmark revisions and diffs rebuild from the corpus" 1
+  fi
 else
   # benchmark/ is gitignored — skip gracefully in CI
   echo "  SKIP: Polishing benchmark manifest not present (benchmark/ is gitignored)"
@@ -146,6 +152,52 @@ else
   check "Polishing intelligence has >=15 tier rules ($tier1_rules found)" 1
 fi
 
+# --- Check 7: Delta-chain corpus round trip ---
+corpus_tmp=$(mktemp -d)
+python3 - "$corpus_tmp" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+root = Path(sys.argv[1])
+disc = root / "discussion_01"
+disc.mkdir()
+lines = [f"- item {i}: original text\n" for i in range(40)]
+(disc / "initial.md").write_text("".join(lines))
+snapshots, revisions = [], []
+for i in range(12):
+    lines[i] = f"- item {i}: polished text\n"
+    if i % 3 == 0:
+        lines.insert(i, f"- inserted {i}\n")
+    revisions.append("".join(lines))
+    (disc / f"revision_{i:02d}.md").write_text(revisions[-1])
+    snapshots.append({"index": i, "timestamp": f"t{i}", "file": f"revision_{i:02d}.md"})
+manifest = {
+    "discussions": [{"number": 1, "title": "t", "snapshots": snapshots, "diffs": [], "diff_count": 0}],
+    "total_snapshots": len(revisions),
+    "total_diffs": 0,
+}
+(root / "manifest.json").write_text(json.dumps(manifest))
+(root / "expected_09.md").write_text(revisions[9])
+PY
+if python3 tools/edit_corpus.py --root "$corpus_tmp" convert >/dev/null \
+  && python3 tools/edit_corpus.py --root "$corpus_tmp" verify >/dev/null \
+  && [ ! -d "$corpus_tmp/discussion_01" ] \
+  && python3 tools/edit_corpus.py --root "$corpus_tmp" show 1 9 | cmp -s - "$corpus_tmp/expected_09.md" \
+  && python3 tools/edit_corpus.py --root "$corpus_tmp" diff 1 8 | grep -q '^+- item 9: polished text'; then
+  check "Delta-chain corpus round trip (convert, verify, rebuild revision and diff)" 0
+else
+  check "Delta-chain corpus round trip (convert, verify, rebuild revision and diff)" 1
+fi
+analytics_diffs=$(python3 tools/edit_analytics.py --root "$corpus_tmp" --output "$corpus_tmp/analytics.json" 2>/dev/null \
+  && python3 -c "import json, sys; print(json.load(open(sys.argv[1]))['diffs'])" "$corpus_tmp/analytics.json" 2>/dev/null || true)
+if [ "${analytics_diffs:-0}" = "11" ]; then
+  check "Edit analytics reads the corpus (11 diffs)" 0
+else
+  check "Edit analytics reads the corpus (got ${analytics_diffs:-none}, expected 11 diffs)" 1
+fi
+rm -rf "$corpus_tmp"
+
 # --- Summary ---
 echo ""
 echo "══════════════════════════════════════════════════════"
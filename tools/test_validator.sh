@@ -4,40 +4,33 @@
 # ══════════════════════════════════════════════════════════════
 # Tests that validate_newsletter.sh correctly catches known-bad
 # patterns and passes known-good newsletters from the archive.
+# Every case is validated in one batch run of validate_newsletter.py.
 #
 # Usage: bash tools/test_validator.sh
 
 set -uo pipefail
 cd "$(git rev-parse --show-toplevel)"
 
-VALIDATOR=".github/skills/newsletter-validation/scripts/validate_newsletter.sh"
+VALIDATOR=".github/skills/newsletter-validation/scripts/validate_newsletter.py"
 PASS=0
 FAIL=0
 TMPDIR=""
+CASE_FILES=()
+CASE_EXPECT=()
+CASE_LABELS=()
 
 cleanup() { [ -n "$TMPDIR" ] && [ -d "$TMPDIR" ] && rm -rf "$TMPDIR"; }
 trap cleanup EXIT
 TMPDIR=$(mktemp -d)
 
-assert_passes() {
-  local file="$1" label="$2"
-  if bash "$VALIDATOR" "$file" > /dev/null 2>&1; then
-    PASS=$((PASS + 1))
-  else
-    echo "  FAIL: expected PASS on $label"
-    FAIL=$((FAIL + 1))
-  fi
+add_case() {
+  CASE_EXPECT+=("$1")
+  CASE_FILES+=("$2")
+  CASE_LABELS+=("$3")
 }
 
-assert_fails() {
-  local file="$1" label="$2"
-  if bash "$VALIDATOR" "$file" > /dev/null 2>&1; then
-    echo "  FAIL: expected FAIL on $label (validator passed when it should fail)"
-    FAIL=$((FAIL + 1))
-  else
-    PASS=$((PASS + 1))
-  fi
-}
+assert_passes() { add_case PASSED "$1" "$2"; }
+assert_fails() { add_case FAILED "$1" "$2"; }
 
 echo "=== Validator Self-Test ==="
 echo ""
@@ -49,8 +42,7 @@ assert_passes "archive/2025/December.md" "December 2025"
 # Note: Aug 2025 and earlier use em dashes and wikilinks (pre-agentic era).
 # They legitimately fail validation. Only test agentic-era newsletters.
 assert_passes "output/2026-02_february_newsletter.md" "February 2026 V2"
-
-echo "  $PASS passed so far"
+echo "  ${#CASE_FILES[@]} cases"
 echo ""
 
 # ── Known-bad: missing introduction ──
@@ -249,6 +241,25 @@ If you have any questions, feel free to reach out.
 EOF
 assert_fails "$TMPDIR/bad_wikilink.md" "wikilinks"
 
+echo "  $(( ${#CASE_FILES[@]} - 2 )) cases"
+echo ""
+
+# ── Run every case in one batch ──
+echo "Batch Run (${#CASE_FILES[@]} files):"
+mapfile -t STATUSES < <(python3 "$VALIDATOR" --summary "${CASE_FILES[@]}" 2>/dev/null | cut -d' ' -f1)
+for i in "${!CASE_FILES[@]}"; do
+  expected="${CASE_EXPECT[$i]}"
+  actual="${STATUSES[$i]:-MISSING}"
+  if [ "$actual" = "$expected" ]; then
+    PASS=$((PASS + 1))
+  elif [ "$expected" = "PASSED" ]; then
+    echo "  FAIL: expected PASS on ${CASE_LABELS[$i]}"
+    FAIL=$((FAIL + 1))
+  else
+    echo "  FAIL: expected FAIL on ${CASE_LABELS[$i]} (validator passed when it should fail)"
+    FAIL=$((FAIL + 1))
+  fi
+done
 echo "  $PASS passed total (of $((PASS + FAIL)))"
 echo ""
 
@@ -0,0 +1,92 @@
+"""Multi-needle substring matching shared by the deterministic tools.
+
+SubstringMatcher compiles any number of needles into one Aho-Corasick
+automaton, so a text is scanned once however many needles there are.
+benchmark_contracts.py uses it for required URL substrings and
+prefilter_briefings.py for use-case signal terms.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+def is_word_char(ch: str) -> bool:
+    """Characters that continue a word (same class as the [\\w-] tag boundaries)."""
+    return ch.isalnum() or ch in "_-"
+
+
+class SubstringMatcher:
+    """Aho-Corasick automaton: which of many needles occur in a text, in one scan."""
+
+    def __init__(self, needles: Iterable[str]) -> None:
+        self.needles = sorted(set(needles))
+        self.goto: list[dict[str, int]] = [{}]
+        self.out: list[frozenset[int]] = [frozenset()]
+        for index, needle in enumerate(self.needles):
+            state = 0
+            for ch in needle:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.out.append(frozenset())
+                state = nxt
+            self.out[state] = self.out[state] | {index}
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                back = self.fail[state]
+                while back and ch not in self.goto[back]:
+                    back = self.fail[back]
+                self.fail[nxt] = self.goto[back].get(ch, 0)
+                self.out[nxt] = self.out[nxt] | self.out[self.fail[nxt]]
+
+    def find(self, text: str) -> set[str]:
+        goto, fail, out = self.goto, self.fail, self.out
+        found: set[int] = set()
+        remaining = len(self.needles)
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] and not out[state] <= found:
+                found |= out[state]
+                if len(found) == remaining:
+                    break
+        return {self.needles[i] for i in found}
+
+    def find_words(self, text: str, whole: Iterable[str] = ()) -> set[str]:
+        """Needles that start at a word boundary. Needles in whole must also end
+        at one (a plural "s" allowed); the rest may run on into a longer word,
+        so stems such as "moderniz" still match "modernization"."""
+        goto, fail, out, needles = self.goto, self.fail, self.out, self.needles
+        whole = set(whole)
+        found: set[int] = set()
+        state = 0
+        end = len(text)
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state] or out[state] <= found:
+                continue
+            for k in out[state] - found:
+                needle = needles[k]
+                start = i + 1 - len(needle)
+                if start > 0 and is_word_char(text[start - 1]):
+                    continue
+                if needle in whole:
+                    after = i + 1
+                    if after < end and text[after] == "s":
+                        after += 1
+                    if after < end and is_word_char(text[after]):
+                        continue
+                found.add(k)
+        return {needles[i] for i in found}
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Collect per-run profiling traces into one cycle report.
+
+Reads the JSON traces written by tools/profiling.py (.cache/traces/, or
+NEWSLETTER_TRACE_DIR) that finished after the cycle's run marker was prepared
+(workspace/newsletter_run_marker_<START>_to_<END>.json), falling back to the
+last 24 hours when no marker exists.
+
+Usage:
+  python3 tools/trace_report.py START_DATE END_DATE [--since-epoch N] [--stdout]
+
+Output:
+  workspace/newsletter_trace_report_<START>_to_<END>.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from profiling import TRACE_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKSPACE = ROOT / "workspace"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Aggregate profiling traces for a pipeline cycle")
+    parser.add_argument("start", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--since-epoch", type=float, help="Only include traces finished after this time")
+    parser.add_argument("--trace-dir", type=Path, default=TRACE_DIR, help="Trace directory")
+    parser.add_argument("--stdout", action="store_true", help="Print the report instead of writing it")
+    return parser.parse_args()
+
+
+def cycle_start_epoch(start: str, end: str) -> float:
+    marker = WORKSPACE / f"newsletter_run_marker_{start}_to_{end}.json"
+    try:
+        return float(json.loads(marker.read_text(encoding="utf-8"))["prepared_at_epoch"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return time.time() - 24 * 3600
+
+
+def load_traces(trace_dir: Path, since: float) -> list[dict[str, Any]]:
+    traces = []
+    for path in sorted(trace_dir.glob("*.json")):
+        try:
+            trace = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if trace.get("finished_at_epoch", 0) >= since:
+            trace["_path"] = path
+            traces.append(trace)
+    traces.sort(key=lambda t: t["finished_at_epoch"])
+    return traces
+
+
+def render(start: str, end: str, traces: list[dict[str, Any]]) -> str:
+    lines = [f"# Pipeline Trace Report: {start} to {end}", ""]
+    if not traces:
+        return "\n".join(lines + ["No profiling traces recorded for this cycle.", ""])
+
+    total_wall = sum(t["wall_s"] for t in traces)
+    lines += [
+        f"Runs: {len(traces)}  Total wall time: {total_wall:.2f}s",
+        "",
+        "## Runs",
+        "",
+        "| Tool | Started (UTC) | Wall s | CPU s | Peak RSS MiB | Heap peak MiB |",
+        "|---|---|---:|---:|---:|---:|",
+    ]
+    for t in traces:
+        rss = f"{t['peak_rss_kb'] / 1024:.1f}" if t.get("peak_rss_kb") else "-"
+        heap = f"{t['tracemalloc_peak_kb'] / 1024:.1f}" if "tracemalloc_peak_kb" in t else "-"
+        lines.append(
+            f"| {t['tool']} | {t['started_at_utc']} | {t['wall_s']:.3f} | {t['cpu_s']:.3f} | {rss} | {heap} |"
+        )
+
+    stages: dict[tuple[str, str], dict[str, float]] = {}
+    for t in traces:
+        for name, entry in t.get("stages", {}).items():
+            agg = stages.setdefault((t["tool"], name), {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+            agg["calls"] += entry["calls"]
+            agg["total_s"] += entry["total_s"]
+            agg["max_s"] = max(agg["max_s"], entry["max_s"])
+    lines += [
+        "",
+        "## Stages",
+        "",
+        "| Tool | Stage | Calls | Total s | Max s | Share of tool wall |",
+        "|---|---|---:|---:|---:|---:|",
+    ]
+    tool_wall: dict[str, float] = {}
+    for t in traces:
+        tool_wall[t["tool"]] = tool_wall.get(t["tool"], 0.0) + t["wall_s"]
+    for (tool, name), agg in sorted(stages.items(), key=lambda kv: -kv[1]["total_s"]):
+        share = agg["total_s"] / tool_wall[tool] * 100 if tool_wall[tool] else 0.0
+        lines.append(
+            f"| {tool} | {name} | {agg['calls']:.0f} | {agg['total_s']:.3f} | {agg['max_s']:.3f} | {share:.0f}% |"
+        )
+
+    profiled = [t for t in traces if t.get("cprofile_top")]
+    if profiled:
+        lines += ["", "## Hot Functions (cProfile, cumulative)", ""]
+        for t in profiled:
+            lines.append(f"### {t['tool']} ({t['started_at_utc']})")
+            lines.append("")
+            for row in t["cprofile_top"][:10]:
+                lines.append(f"- {row['cumtime_s']:.3f}s cum, {row['calls']} calls: `{row['function']}`")
+            lines.append(f"- Full profile: `{t['cprofile_path']}`")
+            lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def main() -> int:
+    args = parse_args()
+    since = args.since_epoch if args.since_epoch is not None else cycle_start_epoch(args.start, args.end)
+    report = render(args.start, args.end, load_traces(args.trace_dir, since))
+    if args.stdout:
+        print(report, end="")
+        return 0
+    WORKSPACE.mkdir(parents=True, exist_ok=True)
+    out_path = WORKSPACE / f"newsletter_trace_report_{args.start}_to_{args.end}.md"
+    out_path.write_text(report, encoding="utf-8")
+    print(f"Wrote {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Incremental SQLite index of every link featured in past newsletters.
+
+Answers "have we already featured this URL?" without re-reading history.
+Scans archive/<year>/*.md, output/*.md and workspace/archived/*.md, records
+each link with its normalized form (normalize_url() from
+extract_event_sources.py), newsletter path, section heading, cycle and line.
+Only files whose size/mtime/hash changed since the last run are re-scanned.
+
+Usage:
+  python3 tools/url_index.py update
+  python3 tools/url_index.py lookup URL [URL ...]
+  python3 tools/url_index.py lookup --file candidates.txt [--json]
+  python3 tools/url_index.py stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+from extract_event_sources import normalize_url
+from paths import CACHE_DIR
+
+ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = CACHE_DIR / "url_index.sqlite"
+
+SCAN_GLOBS = [
+    "archive/*/*.md",
+    "output/*.md",
+    "workspace/archived/*.md",
+]
+
+MONTHS = {
+    name: f"{number:02d}"
+    for number, name in enumerate(
+        ["january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"],
+        start=1,
+    )
+}
+
+LINK_RE = re.compile(r"\[([^\]]*)\]\((https?://[^)\s]+)\)|(https?://[^\s)>\]\"'<]+)")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+CYCLE_RE = re.compile(r"(\d{4})-(\d{2})")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    cycle TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    label TEXT NOT NULL,
+    section TEXT NOT NULL,
+    cycle TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_normalized ON links(normalized);
+"""
+
+
+def cycle_for(rel_path: str) -> str:
+    """Best-effort YYYY-MM for a newsletter path ('' when unknown)."""
+    name = Path(rel_path).name
+    match = CYCLE_RE.search(name)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}"
+    # archive/2025/December.md
+    parts = Path(rel_path).parts
+    month = MONTHS.get(Path(rel_path).stem.lower())
+    if month and len(parts) >= 2 and re.fullmatch(r"\d{4}", parts[-2]):
+        return f"{parts[-2]}-{month}"
+    return ""
+
+
+def extract_links(text: str) -> list[dict[str, Any]]:
+    """Return one row per link with its line number and enclosing heading."""
+    rows: list[dict[str, Any]] = []
+    section = ""
+    in_fence = False
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        heading = None if in_fence else HEADING_RE.match(line)
+        if heading:
+            section = heading.group(2)
+        for match in LINK_RE.finditer(line):
+            label, url = (match.group(1), match.group(2)) if match.group(2) else ("", match.group(3))
+            rows.append({
+                "line": line_no,
+                "url": url,
+                "normalized": normalize_url(url),
+                "label": label.strip(),
+                "section": section,
+            })
+    return rows
+
+
+class UrlIndex:
+    """Python API over the SQLite link index."""
+
+    def __init__(self, db_path: Path = DB_PATH, root: Path = ROOT) -> None:
+        self.root = root
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "UrlIndex":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _scan_paths(self) -> list[Path]:
+        found: set[Path] = set()
+        for pattern in SCAN_GLOBS:
+            found.update(p for p in self.root.glob(pattern) if p.is_file())
+        return sorted(found)
+
+    def update(self) -> dict[str, int]:
+        """Re-index new/changed files and drop deleted ones."""
+        known = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self.conn.execute("SELECT path, size, mtime_ns, sha256 FROM files")
+        }
+        stats = {"scanned": 0, "indexed": 0, "unchanged": 0, "removed": 0}
+        seen: set[str] = set()
+
+        with self.conn:
+            for path in self._scan_paths():
+                rel = path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                stats["scanned"] += 1
+                st = path.stat()
+                previous = known.get(rel)
+                if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+                    stats["unchanged"] += 1
+                    continue
+                raw = path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                if previous and previous[2] == digest:
+                    # Touched but not edited: refresh the stat fingerprint only.
+                    self.conn.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                        (st.st_size, st.st_mtime_ns, rel),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                cycle = cycle_for(rel)
+                self.conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                self.conn.execute(
+                    "INSERT INTO files (path, size, mtime_ns, sha256, cycle) VALUES (?, ?, ?, ?, ?)",
+                    (rel, st.st_size, st.st_mtime_ns, digest, cycle),
+                )
+                self.conn.executemany(
+                    "INSERT INTO links (path, line, url, normalized, label, section, cycle) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (rel, r["line"], r["url"], r["normalized"], r["label"], r["section"], cycle)
+                        for r in extract_links(raw.decode("utf-8", errors="ignore"))
+                    ],
+                )
+                stats["indexed"] += 1
+
+            for rel in set(known) - seen:
+                self.conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                stats["removed"] += 1
+        return stats
+
+    def lookup(self, urls: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+        """Map each input URL to its prior appearances (empty list when new)."""
+        wanted = {url: normalize_url(url) for url in urls}
+        keys = sorted(set(wanted.values()))
+        hits: dict[str, list[dict[str, Any]]] = {key: [] for key in keys}
+        # Stay under SQLite's default bound-parameter limit.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                "SELECT normalized, path, line, section, cycle, label FROM links "
+                f"WHERE normalized IN ({placeholders}) ORDER BY cycle, path, line",
+                chunk,
+            ):
+                hits[row[0]].append({
+                    "path": row[1],
+                    "line": row[2],
+                    "section": row[3],
+                    "cycle": row[4],
+                    "label": row[5],
+                })
+        return {url: hits[key] for url, key in wanted.items()}
+
+    def seen(self, urls: Iterable[str]) -> set[str]:
+        """Return the subset of URLs already featured somewhere."""
+        return {url for url, rows in self.lookup(urls).items() if rows}
+
+    def stats(self) -> dict[str, int]:
+        files = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        links = self.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+        unique = self.conn.execute("SELECT COUNT(DISTINCT normalized) FROM links").fetchone()[0]
+        return {"files": files, "links": links, "unique_urls": unique}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Historical newsletter URL index")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="SQLite index path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("update", help="Incrementally (re)index past newsletters")
+
+    lookup = sub.add_parser("lookup", help="Report prior appearances of URLs")
+    lookup.add_argument("urls", nargs="*")
+    lookup.add_argument("--file", type=Path, help="Read URLs (one per line, '-' for stdin)")
+    lookup.add_argument("--json", action="store_true", help="Emit JSON instead of text")
+    lookup.add_argument("--no-update", action="store_true", help="Skip the incremental refresh")
+
+    sub.add_parser("stats", help="Show index size")
+    return parser.parse_args(argv)
+
+
+def _read_url_list(path: Path) -> list[str]:
+    text = sys.stdin.read() if str(path) == "-" else path.read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.startswith("#")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with UrlIndex(args.db) as index:
+        if args.command == "update":
+            stats = index.update()
+            print("Index update: " + " ".join(f"{k}={v}" for k, v in stats.items()))
+            return 0
+
+        if args.command == "stats":
+            print(json.dumps(index.stats(), indent=2))
+            return 0
+
+        urls = list(args.urls)
+        if args.file:
+            urls.extend(_read_url_list(args.file))
+        if not urls:
+            raise SystemExit("lookup requires URLs or --file")
+        if not args.no_update:
+            index.update()
+        results = index.lookup(urls)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    repeats = 0
+    for url, rows in results.items():
+        if not rows:
+            print(f"NEW   {url}")
+            continue
+        repeats += 1
+        first = rows[0]
+        print(f"SEEN  {url}  ({len(rows)}x, first {first['cycle'] or '?'} {first['path']}:{first['line']})")
+    print(f"Summary: total={len(results)} seen={repeats} new={len(results) - repeats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
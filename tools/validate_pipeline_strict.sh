@@ -5,7 +5,7 @@ cd "$(git rev-parse --show-toplevel)"
 
 usage() {
   cat <<'USAGE'
-Usage: bash tools/validate_pipeline_strict.sh <START_DATE> <END_DATE> [--require-fresh] [--benchmark-mode <mode-or-json-path>]
+Usage: bash tools/validate_pipeline_strict.sh <START_DATE> <END_DATE> [--require-fresh] [--benchmark-mode <mode-or-json-path>] [--changed <file>]...
 
 Validates strict pipeline contract adherence for a newsletter cycle:
 - all canonical phase artifacts exist
@@ -16,10 +16,16 @@ Validates strict pipeline contract adherence for a newsletter cycle:
 - optional provenance receipts checks (required for fresh/benchmark mode)
 - final newsletter passes validator
 
+With --changed (repeatable), only the checks that read one of the given files
+run, checks whose primary artifact does not exist yet are skipped, and the
+results are printed without writing the contract report. tools/watch_pipeline.py
+uses this to re-validate artifacts as phases write them.
+
 Examples:
   bash tools/validate_pipeline_strict.sh 2025-12-05 2026-02-13
   bash tools/validate_pipeline_strict.sh 2025-12-05 2026-02-13 --require-fresh
   bash tools/validate_pipeline_strict.sh 2025-12-05 2026-02-13 --benchmark-mode feb2026_consistency
+  bash tools/validate_pipeline_strict.sh 2025-12-05 2026-02-13 --changed workspace/newsletter_phase2_events_2026-02-13.md
 USAGE
 }
 
@@ -32,6 +38,7 @@ START="$1"
 END="$2"
 REQUIRE_FRESH=0
 BENCHMARK_MODE=""
+CHANGED=()
 
 shift 2
 while [ "$#" -gt 0 ]; do
@@ -48,6 +55,14 @@ while [ "$#" -gt 0 ]; do
       BENCHMARK_MODE="$2"
       shift 2
       ;;
+    --changed)
+      if [ "$#" -lt 2 ]; then
+        echo "Error: --changed requires a file path"
+        exit 1
+      fi
+      CHANGED+=("${2#./}")
+      shift 2
+      ;;
     *)
       echo "Error: Unknown argument: $1"
       usage
@@ -102,6 +117,26 @@ pass() { DETAILS="${DETAILS}PASS: $1"$'\n'; }
 warn() { DETAILS="${DETAILS}WARN: $1"$'\n'; WARNS=$((WARNS + 1)); }
 fail() { DETAILS="${DETAILS}FAIL: $1"$'\n'; FAILS=$((FAILS + 1)); }
 
+is_changed() {
+  local f
+  for f in ${CHANGED[@]+"${CHANGED[@]}"}; do
+    [ "$f" = "$1" ] && return 0
+  done
+  return 1
+}
+
+# Full runs check everything. With --changed, a check runs only when one of its
+# files changed and its primary file (the first argument) exists.
+affected() {
+  [ "${#CHANGED[@]}" -eq 0 ] && return 0
+  [ -f "$1" ] || return 1
+  local f
+  for f in "$@"; do
+    is_changed "$f" && return 0
+  done
+  return 1
+}
+
 year="$(echo "$END" | cut -d- -f1)"
 month="$(echo "$END" | cut -d- -f2)"
 month_name="$(month_name_from_end)"
@@ -141,6 +176,7 @@ check_exists_and_min_size() {
   local file="$1"
   local min_bytes="$2"
   local label="$3"
+  affected "$file" || return 0
   if [ ! -f "$file" ]; then
     fail "$label missing: $file"
     return
@@ -190,9 +226,11 @@ if [ -n "$BENCHMARK_MODE" ]; then
   benchmark_config="$(resolve_benchmark_config "$BENCHMARK_MODE")"
 fi
 
-echo "Running strict pipeline validation for ${START} -> ${END}"
-if [ -n "$benchmark_config" ]; then
-  echo "Benchmark mode config: ${benchmark_config}"
+if [ "${#CHANGED[@]}" -eq 0 ]; then
+  echo "Running strict pipeline validation for ${START} -> ${END}"
+  if [ -n "$benchmark_config" ]; then
+    echo "Benchmark mode config: ${benchmark_config}"
+  fi
 fi
 
 check_exists_and_min_size "$manifest" 100 "Phase 1A manifest"
@@ -212,12 +250,13 @@ if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
 else
   if [ -f "$event_sources" ]; then
     check_exists_and_min_size "$event_sources" 120 "Phase 2 event sources"
-  else
+  elif [ "${#CHANGED[@]}" -eq 0 ]; then
     warn "Phase 2 event sources artifact missing (non-blocking outside fresh/benchmark): $event_sources"
   fi
 fi
 
 for f in "${shortcut_files[@]}"; do
+  affected "$f" || continue
   if [ -f "$f" ]; then
     fail "Non-canonical shortcut artifact present (remove for strict runs): $f"
   else
@@ -225,32 +264,34 @@ for f in "${shortcut_files[@]}"; do
   fi
 done
 
-raw_phase1b_count=$(grep -hE '^### ' "${phase1b_files[@]}" 2>/dev/null | wc -l | tr -d ' ')
-discoveries_count="$(grep -cE '^### ' "$discoveries" 2>/dev/null || true)"
-discoveries_count="$(printf '%s\n' "$discoveries_count" | tail -n1 | tr -d ' ')"
-[ -z "$discoveries_count" ] && discoveries_count=0
-if [ "${raw_phase1b_count:-0}" -gt 0 ] && [ "${discoveries_count:-0}" -gt 0 ]; then
-  set +e
-  continuity_ratio="$(python3 - "$raw_phase1b_count" "$discoveries_count" <<'PY'
+if affected "$discoveries" "${phase1b_files[@]}"; then
+  raw_phase1b_count=$(grep -hE '^### ' "${phase1b_files[@]}" 2>/dev/null | wc -l | tr -d ' ')
+  discoveries_count="$(grep -cE '^### ' "$discoveries" 2>/dev/null || true)"
+  discoveries_count="$(printf '%s\n' "$discoveries_count" | tail -n1 | tr -d ' ')"
+  [ -z "$discoveries_count" ] && discoveries_count=0
+  if [ "${raw_phase1b_count:-0}" -gt 0 ] && [ "${discoveries_count:-0}" -gt 0 ]; then
+    set +e
+    continuity_ratio="$(python3 - "$raw_phase1b_count" "$discoveries_count" <<'PY'
 import sys
 raw = int(sys.argv[1])
 disc = int(sys.argv[2])
 print(f"{disc/raw:.4f}")
 PY
-)"
-  set -e
-  ratio_basis_points="$(printf "%.0f" "$(python3 - "$continuity_ratio" <<'PY'
+  )"
+    set -e
+    ratio_basis_points="$(printf "%.0f" "$(python3 - "$continuity_ratio" <<'PY'
 import sys
 print(float(sys.argv[1]) * 10000)
 PY
-)")"
-  if [ "$ratio_basis_points" -lt 800 ]; then
-    fail "Phase continuity too compressed: discoveries=${discoveries_count}, phase1b_items=${raw_phase1b_count}, ratio=${continuity_ratio}"
+  )")"
+    if [ "$ratio_basis_points" -lt 800 ]; then
+      fail "Phase continuity too compressed: discoveries=${discoveries_count}, phase1b_items=${raw_phase1b_count}, ratio=${continuity_ratio}"
+    else
+      pass "Phase continuity ratio acceptable: discoveries=${discoveries_count}, phase1b_items=${raw_phase1b_count}, ratio=${continuity_ratio}"
+    fi
   else
-    pass "Phase continuity ratio acceptable: discoveries=${discoveries_count}, phase1b_items=${raw_phase1b_count}, ratio=${continuity_ratio}"
+    warn "Phase continuity ratio skipped (could not count Phase 1B or discoveries headings)"
   fi
-else
-  warn "Phase continuity ratio skipped (could not count Phase 1B or discoveries headings)"
 fi
 
 set +e
@@ -287,7 +328,8 @@ while IFS= read -r line; do
   curator_note_files+=("$line")
 done <<< "$curator_note_scan"
 
-if [ "${#curator_note_files[@]}" -gt 0 ]; then
+if [ "${#curator_note_files[@]}" -gt 0 ] \
+  && affected "$curator_processed" "$curator_signals" "$discoveries" "$curated" "$output_file" "${curator_note_files[@]}"; then
   pass "Curator notes detected (${#curator_note_files[@]}): ${curator_note_files[*]}"
   check_exists_and_min_size "$curator_processed" 80 "Phase 1.5 processed notes"
   check_exists_and_min_size "$curator_signals" 80 "Phase 1.5 editorial signals"
@@ -356,11 +398,13 @@ PY
       fail "Phase 1.5 propagation check failed"
     fi
   fi
-else
+elif [ "${#curator_note_files[@]}" -eq 0 ] && [ "${#CHANGED[@]}" -eq 0 ]; then
   pass "No curator notes detected; Phase 1.5 not required for this cycle"
 fi
 
-if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
+if { [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; } \
+  && affected "$phase_receipts" "$marker" "$manifest" "${phase1b_files[@]}" "$discoveries" "$event_sources" \
+    "$events" "$curated" "$scope_contract" "$scope_results" "$output_file" "$curator_processed" "$curator_signals"; then
   if [ ! -f "$marker" ]; then
     fail "Provenance marker missing: $marker"
   fi
@@ -393,7 +437,8 @@ if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
         "$output_file" \
         "$curator_processed" \
         "$curator_signals" \
-        "$curator_required" <<'PY'
+        "$curator_required" \
+        ${CHANGED[@]+"${CHANGED[@]}"} <<'PY'
 import hashlib
 import json
 import sys
@@ -419,6 +464,7 @@ output_file = Path(sys.argv[17])
 curator_processed = Path(sys.argv[18])
 curator_signals = Path(sys.argv[19])
 curator_required = sys.argv[20] == "1"
+changed = set(sys.argv[21:])
 
 def sha256(path: Path) -> str:
     h = hashlib.sha256()
@@ -478,6 +524,19 @@ for receipt in receipts.get("receipts", []):
         continue
     by_phase[phase] = receipt
 
+if changed:
+    # --changed: phases without a receipt are still pending, and only receipts
+    # for changed artifacts (or all, when the marker/receipts changed) are re-checked.
+    bookkeeping_changed = bool({str(marker_path), str(receipts_path)} & changed)
+    for phase_id, expected_path in expected:
+        if phase_id not in by_phase and str(expected_path) in changed:
+            warnings.append(f"{phase_id} artifact changed but no receipt recorded yet")
+    expected = [
+        (phase_id, expected_path)
+        for phase_id, expected_path in expected
+        if phase_id in by_phase and (bookkeeping_changed or str(expected_path) in changed)
+    ]
+
 phase_epochs = {}
 
 for phase_id, expected_path in expected:
@@ -574,7 +633,8 @@ PY
   fi
 fi
 
-if [ -f "$scope_contract" ]; then
+if [ -f "$scope_contract" ] \
+  && affected "$scope_contract" "$manifest" "$phase1b_vscode" "$discoveries" "$output_file"; then
   set +e
   scope_check_output="$(
     python3 - "$scope_contract" "$START" "$END" <<'PY'
@@ -663,25 +723,33 @@ PY
     warn "Scope contract has no expected VS Code versions for continuity checks"
   else
     for version in "${expected_vscode_versions[@]}"; do
-      if contains_version_ref "$manifest" "$version"; then
-        pass "Phase 1A includes expected VS Code version ${version}"
-      else
-        fail "Phase 1A manifest missing expected VS Code version ${version}"
+      if affected "$manifest" "$scope_contract"; then
+        if contains_version_ref "$manifest" "$version"; then
+          pass "Phase 1A includes expected VS Code version ${version}"
+        else
+          fail "Phase 1A manifest missing expected VS Code version ${version}"
+        fi
       fi
-      if contains_version_ref "$phase1b_vscode" "$version"; then
-        pass "Phase 1B VS Code interim includes expected version ${version}"
-      else
-        fail "Phase 1B VS Code interim missing expected version ${version}"
+      if affected "$phase1b_vscode" "$scope_contract"; then
+        if contains_version_ref "$phase1b_vscode" "$version"; then
+          pass "Phase 1B VS Code interim includes expected version ${version}"
+        else
+          fail "Phase 1B VS Code interim missing expected version ${version}"
+        fi
       fi
-      if contains_version_ref "$discoveries" "$version"; then
-        pass "Phase 1C discoveries retain expected VS Code version signal ${version}"
-      else
-        warn "Phase 1C discoveries do not explicitly retain VS Code version signal ${version}"
+      if affected "$discoveries" "$scope_contract"; then
+        if contains_version_ref "$discoveries" "$version"; then
+          pass "Phase 1C discoveries retain expected VS Code version signal ${version}"
+        else
+          warn "Phase 1C discoveries do not explicitly retain VS Code version signal ${version}"
+        fi
       fi
-      if contains_version_ref "$output_file" "$version"; then
-        pass "Final output references expected VS Code version signal ${version}"
-      else
-        warn "Final output does not explicitly reference VS Code version signal ${version}"
+      if affected "$output_file" "$scope_contract"; then
+        if contains_version_ref "$output_file" "$version"; then
+          pass "Final output references expected VS Code version signal ${version}"
+        else
+          warn "Final output does not explicitly reference VS Code version signal ${version}"
+        fi
       fi
     done
   fi
@@ -692,22 +760,29 @@ if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
   strict_event_quality=1
 fi
 strict_cli_quality="$strict_event_quality"
+# An empty path skips that half of the check (--changed runs).
+cli_interim="$phase1b_github"
+affected "$phase1b_github" || cli_interim=""
+cli_output="$output_file"
+affected "$output_file" || cli_output=""
 
 set +e
 cli_quality_output="$(
-  python3 - "$phase1b_github" "$output_file" "$strict_cli_quality" <<'PY'
+  python3 - "$cli_interim" "$cli_output" "$strict_cli_quality" <<'PY'
 import re
 import sys
 from pathlib import Path
 
-interim_path = Path(sys.argv[1])
-output_path = Path(sys.argv[2])
+interim_path = Path(sys.argv[1]) if sys.argv[1] else None
+output_path = Path(sys.argv[2]) if sys.argv[2] else None
 strict_mode = sys.argv[3] == "1"
 
 release_index = "https://github.com/github/copilot-cli/releases"
 tag_pattern = re.compile(r"https://github\.com/github/copilot-cli/releases/tag/[^\)\s]+", re.IGNORECASE)
 
-def assess(path: Path, label: str, min_tags: int):
+def assess(path: "Path | None", label: str, min_tags: int):
+    if path is None:
+        return
     if not path.exists():
         print(f"FAIL: {label} file missing for Copilot CLI release-link checks: {path}")
         return
@@ -745,9 +820,10 @@ if [ "$cli_quality_rc" -gt 1 ]; then
   fail "Copilot CLI link quality checks failed unexpectedly"
 fi
 
-set +e
-events_quality_output="$(
-  python3 - "$events" "$START" "$END" "$strict_event_quality" "$event_sources" ${curator_note_files[@]+"${curator_note_files[@]}"} <<'PY'
+if affected "$events" "$event_sources" ${curator_note_files[@]+"${curator_note_files[@]}"}; then
+  set +e
+  events_quality_output="$(
+    python3 - "$events" "$START" "$END" "$strict_event_quality" "$event_sources" ${curator_note_files[@]+"${curator_note_files[@]}"} <<'PY'
 import datetime as dt
 import json
 import re
@@ -926,19 +1002,20 @@ if notes_text:
     if ("reactor" in notes_lower or "developer.microsoft.com/en-us/reactor" in notes_lower) and not has_reactor:
         print("WARN: Curator notes mention Reactor but Phase 2 output has no Reactor-linked event")
 PY
-)"
-events_quality_rc=$?
-set -e
-while IFS= read -r line; do
-  [ -z "$line" ] && continue
-  case "$line" in
-    PASS:*) pass "${line#PASS: }" ;;
-    WARN:*) warn "${line#WARN: }" ;;
-    FAIL:*) fail "${line#FAIL: }" ;;
-  esac
-done <<< "$events_quality_output"
-if [ "$events_quality_rc" -ne 0 ]; then
-  fail "Phase 2 event coverage quality check failed"
+  )"
+  events_quality_rc=$?
+  set -e
+  while IFS= read -r line; do
+    [ -z "$line" ] && continue
+    case "$line" in
+      PASS:*) pass "${line#PASS: }" ;;
+      WARN:*) warn "${line#WARN: }" ;;
+      FAIL:*) fail "${line#FAIL: }" ;;
+    esac
+  done <<< "$events_quality_output"
+  if [ "$events_quality_rc" -ne 0 ]; then
+    fail "Phase 2 event coverage quality check failed"
+  fi
 fi
 
 all_for_order=("$manifest" "$discoveries" "$event_sources" "$events" "$curated" "$output_file" "$scope_results")
@@ -946,37 +1023,44 @@ for f in "${all_for_order[@]}"; do
   [ -f "$f" ] || continue
 done
 
-if [ -f "$manifest" ] && [ -f "$discoveries" ] && [ "$(mtime_epoch "$discoveries")" -lt "$(mtime_epoch "$manifest")" ]; then
+if [ -f "$manifest" ] && [ -f "$discoveries" ] && affected "$discoveries" "$manifest" \
+  && [ "$(mtime_epoch "$discoveries")" -lt "$(mtime_epoch "$manifest")" ]; then
   fail "Phase chronology invalid: discoveries older than manifest"
 fi
-if [ -f "$manifest" ] && [ -f "$event_sources" ] && [ "$(mtime_epoch "$event_sources")" -lt "$(mtime_epoch "$manifest")" ]; then
+if [ -f "$manifest" ] && [ -f "$event_sources" ] && affected "$event_sources" "$manifest" \
+  && [ "$(mtime_epoch "$event_sources")" -lt "$(mtime_epoch "$manifest")" ]; then
   if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
     fail "Phase chronology invalid: event sources older than manifest"
   else
     warn "Event sources artifact is older than manifest (non-fresh run)"
   fi
 fi
-if [ -f "$event_sources" ] && [ -f "$events" ] && [ "$(mtime_epoch "$events")" -lt "$(mtime_epoch "$event_sources")" ]; then
+if [ -f "$event_sources" ] && [ -f "$events" ] && affected "$events" "$event_sources" \
+  && [ "$(mtime_epoch "$events")" -lt "$(mtime_epoch "$event_sources")" ]; then
   if [ "$REQUIRE_FRESH" -eq 1 ] || [ -n "$benchmark_config" ]; then
     fail "Phase chronology invalid: events older than event sources artifact"
   else
     warn "Events artifact is older than event sources artifact (non-fresh run)"
   fi
 fi
-if [ -f "$discoveries" ] && [ -f "$curated" ] && [ "$(mtime_epoch "$curated")" -lt "$(mtime_epoch "$discoveries")" ]; then
+if [ -f "$discoveries" ] && [ -f "$curated" ] && affected "$curated" "$discoveries" \
+  && [ "$(mtime_epoch "$curated")" -lt "$(mtime_epoch "$discoveries")" ]; then
   fail "Phase chronology invalid: curated older than discoveries"
 fi
-if [ -f "$curated" ] && [ -f "$output_file" ] && [ "$(mtime_epoch "$output_file")" -lt "$(mtime_epoch "$curated")" ]; then
+if [ -f "$curated" ] && [ -f "$output_file" ] && affected "$output_file" "$curated" \
+  && [ "$(mtime_epoch "$output_file")" -lt "$(mtime_epoch "$curated")" ]; then
   fail "Phase chronology invalid: output older than curated"
 fi
-if [ -f "$scope_contract" ] && [ -f "$output_file" ] && [ "$(mtime_epoch "$scope_contract")" -gt "$(mtime_epoch "$output_file")" ]; then
+if [ -f "$scope_contract" ] && [ -f "$output_file" ] && affected "$scope_contract" "$output_file" \
+  && [ "$(mtime_epoch "$scope_contract")" -gt "$(mtime_epoch "$output_file")" ]; then
   if [ "$REQUIRE_FRESH" -eq 1 ]; then
     fail "Scope contract timestamp is newer than output in fresh mode (scope must be produced before assembly)"
   else
     warn "Scope contract timestamp is newer than output (possible re-run of scope step)"
   fi
 fi
-if [ -f "$scope_results" ] && [ -f "$output_file" ] && [ "$(mtime_epoch "$scope_results")" -lt "$(mtime_epoch "$output_file")" ]; then
+if [ -f "$scope_results" ] && [ -f "$output_file" ] && affected "$scope_results" "$output_file" \
+  && [ "$(mtime_epoch "$scope_results")" -lt "$(mtime_epoch "$output_file")" ]; then
   fail "Scope results must be generated after final output"
 fi
 
@@ -987,6 +1071,7 @@ if [ "$REQUIRE_FRESH" -eq 1 ]; then
     marker_epoch="$(mtime_epoch "$marker")"
     required_for_fresh=("$manifest" "${phase1b_files[@]}" "$discoveries" "$event_sources" "$events" "$curated" "$scope_contract" "$scope_results" "$output_file")
     for f in "${required_for_fresh[@]}"; do
+      affected "$f" || continue
       if [ -f "$f" ] && [ "$(mtime_epoch "$f")" -lt "$marker_epoch" ]; then
         fail "Fresh mode violation: artifact older than run marker: $f"
       fi
@@ -995,7 +1080,7 @@ if [ "$REQUIRE_FRESH" -eq 1 ]; then
   fi
 fi
 
-if [ -f "$output_file" ]; then
+if [ -f "$output_file" ] && affected "$output_file"; then
   if bash .github/skills/newsletter-validation/scripts/validate_newsletter.sh "$output_file" >/tmp/newsletter_validate_strict.log 2>&1; then
     pass "validate_newsletter.sh passed for final output"
   else
@@ -1003,180 +1088,10 @@ if [ -f "$output_file" ]; then
   fi
 fi
 
-if [ -n "$benchmark_config" ] && [ -f "$output_file" ]; then
+if [ -n "$benchmark_config" ] && [ -f "$output_file" ] && affected "$output_file"; then
   set +e
   benchmark_output="$(
-    python3 - "$output_file" "$benchmark_config" "$START" "$END" <<'PY'
-import json
-import re
-import sys
-from pathlib import Path
-from urllib.parse import urlparse
-
-output_file = Path(sys.argv[1])
-config_file = Path(sys.argv[2])
-start = sys.argv[3]
-end = sys.argv[4]
-
-text = output_file.read_text(encoding="utf-8", errors="ignore")
-config = json.loads(config_file.read_text(encoding="utf-8"))
-contract = config.get("section_contract", {})
-
-h1 = []
-h2 = []
-for line in text.splitlines():
-    m = re.match(r"^(#{1,6})\s+(.*)$", line)
-    if not m:
-        continue
-    level = len(m.group(1))
-    heading = m.group(2).strip()
-    if level == 1:
-        h1.append(heading)
-    elif level == 2:
-        h2.append(heading)
-
-h1_set = set(h1)
-h2_set = set(h2)
-links_total = len(re.findall(r"\[[^\]]+\]\([^)\s]+\)", text))
-words_total = len(re.findall(r"\b\w[\w'-]*\b", text))
-
-def normalize_domain(url: str) -> str:
-    parsed = urlparse(url)
-    host = (parsed.netloc or "").lower()
-    if host.startswith("www."):
-        host = host[4:]
-    return host
-
-all_urls = re.findall(r"\[[^\]]+\]\((https?://[^)\s]+)\)", text)
-unique_domains = sorted({normalize_domain(u) for u in all_urls if normalize_domain(u)})
-
-fails = []
-warns = []
-passes = []
-
-cfg_range = config.get("date_range")
-if isinstance(cfg_range, dict):
-    if cfg_range.get("start") != start or cfg_range.get("end") != end:
-        fails.append(
-            f"benchmark config date_range mismatch ({cfg_range.get('start')}..{cfg_range.get('end')}) "
-            f"!= ({start}..{end})"
-        )
-
-for heading in contract.get("required_h1", []):
-    if heading in h1_set:
-        passes.append(f"Benchmark section H1 present: {heading}")
-    else:
-        fails.append(f"Benchmark section H1 missing: {heading}")
-
-for heading in contract.get("required_h2", []):
-    if heading in h2_set:
-        passes.append(f"Benchmark section H2 present: {heading}")
-    else:
-        fails.append(f"Benchmark section H2 missing: {heading}")
-
-for pattern in contract.get("required_h1_regex", []):
-    regex = re.compile(pattern)
-    if any(regex.search(item) for item in h1):
-        passes.append(f"Benchmark H1 regex satisfied: {pattern}")
-    else:
-        fails.append(f"Benchmark H1 regex unsatisfied: {pattern}")
-
-for heading in contract.get("forbidden_h1", []):
-    if heading in h1_set:
-        fails.append(f"Benchmark forbidden H1 present: {heading}")
-    else:
-        passes.append(f"Benchmark forbidden H1 absent: {heading}")
-
-for group in contract.get("require_any", []):
-    group_id = group.get("id", "unnamed")
-    options = group.get("options", [])
-    satisfied = False
-    for option in options:
-        h1_req = option.get("h1")
-        h2_req = option.get("h2")
-        ok = True
-        if h1_req is not None:
-            ok = ok and (h1_req in h1_set)
-        if h2_req is not None:
-            ok = ok and (h2_req in h2_set)
-        if ok:
-            satisfied = True
-            break
-    if satisfied:
-        passes.append(f"Benchmark any-of contract satisfied: {group_id}")
-    else:
-        fails.append(f"Benchmark any-of contract failed: {group_id}")
-
-min_links = int(contract.get("min_links", 0) or 0)
-if min_links > 0:
-    if links_total >= min_links:
-        passes.append(f"Benchmark min_links satisfied ({links_total} >= {min_links})")
-    else:
-        fails.append(f"Benchmark min_links failed ({links_total} < {min_links})")
-
-min_words = int(contract.get("min_words", 0) or 0)
-if min_words > 0:
-    if words_total >= min_words:
-        passes.append(f"Benchmark min_words satisfied ({words_total} >= {min_words})")
-    else:
-        fails.append(f"Benchmark min_words failed ({words_total} < {min_words})")
-
-min_h1_count = int(contract.get("min_h1_count", 0) or 0)
-if min_h1_count > 0:
-    if len(h1) >= min_h1_count:
-        passes.append(f"Benchmark min_h1_count satisfied ({len(h1)} >= {min_h1_count})")
-    else:
-        fails.append(f"Benchmark min_h1_count failed ({len(h1)} < {min_h1_count})")
-
-domain_contract = contract.get("domain_contract", {})
-if isinstance(domain_contract, dict):
-    min_unique_domains = int(domain_contract.get("min_unique_domains", 0) or 0)
-    if min_unique_domains > 0:
-        if len(unique_domains) >= min_unique_domains:
-            passes.append(
-                f"Benchmark domain diversity satisfied ({len(unique_domains)} >= {min_unique_domains})"
-            )
-        else:
-            fails.append(
-                f"Benchmark domain diversity failed ({len(unique_domains)} < {min_unique_domains})"
-            )
-
-    required_domains = domain_contract.get("required_domains", [])
-    if isinstance(required_domains, list):
-        domain_set = set(unique_domains)
-        for domain in required_domains:
-            if not isinstance(domain, str) or not domain.strip():
-                continue
-            d = domain.strip().lower()
-            if d.startswith("www."):
-                d = d[4:]
-            if d in domain_set:
-                passes.append(f"Benchmark required domain present: {d}")
-            else:
-                fails.append(f"Benchmark required domain missing: {d}")
-
-required_url_substrings = contract.get("required_url_substrings", [])
-if isinstance(required_url_substrings, list):
-    for token in required_url_substrings:
-        if not isinstance(token, str) or not token.strip():
-            continue
-        needle = token.strip()
-        if needle in text:
-            passes.append(f"Benchmark required URL substring present: {needle}")
-        else:
-            fails.append(f"Benchmark required URL substring missing: {needle}")
-
-if fails:
-    for item in fails:
-        print(f"FAIL: {item}")
-for item in warns:
-    print(f"WARN: {item}")
-for item in passes:
-    print(f"PASS: {item}")
-
-if fails:
-    sys.exit(2)
-PY
+    python3 tools/benchmark_contracts.py check "$output_file" "$benchmark_config" "$START" "$END"
   )"
   benchmark_rc=$?
   set -e
@@ -1198,6 +1113,17 @@ if [ "$FAILS" -gt 0 ]; then
   status="FAIL"
 fi
 
+if [ "${#CHANGED[@]}" -gt 0 ]; then
+  if [ -z "$DETAILS" ]; then
+    echo "No strict checks depend on: ${CHANGED[*]}"
+    exit 0
+  fi
+  printf "%s" "$DETAILS"
+  echo "Strict checks for changed files: ${status} (fails=${FAILS}, warnings=${WARNS})"
+  [ "$FAILS" -gt 0 ] && exit 1
+  exit 0
+fi
+
 {
   echo "# Strict Pipeline Contract Validation (${status})"
   echo ""
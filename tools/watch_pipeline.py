@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Re-validate phase artifacts as a newsletter cycle writes them.
+
+Watches workspace/ and output/ (inotify on Linux, mtime polling elsewhere or
+with --poll). When an artifact of the watched cycle changes (newsletter_phase*, scope
+contract/results, run marker, curator notes, or the output newsletter; files
+named for other cycles are ignored), runs
+only the strict-validation rules and receipt checks that depend on it:
+
+  bash tools/validate_pipeline_strict.sh START END --changed <file>...
+
+and prints the results immediately, so a broken Phase 1C or Phase 3 artifact
+shows up mid-cycle instead of at the final strict gate.
+
+Usage:
+  python3 tools/watch_pipeline.py START_DATE END_DATE [--require-fresh]
+      [--benchmark-mode MODE] [--poll] [--interval S] [--debounce S] [--once]
+
+Output:
+  One block per batch of changes on stdout. Runs until interrupted; with
+  --once, exits after the first batch with the strict checks' exit code.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+WATCH_DIRS = ("workspace", "output")
+WORKSPACE_PREFIXES = (
+    "newsletter_phase",
+    "newsletter_scope_",
+    "newsletter_run_marker_",
+    "curator_notes_",
+)
+
+# Curator notes exactly as validate_pipeline_strict.sh scans them:
+# workspace/curator_notes_*.md and free-form workspace/<Letters>.md notes,
+# minus the Phase 1.5 outputs (which are named for their cycle's YYYY-MM).
+CURATOR_NOTE_OUTPUTS = ("curator_notes_processed_", "curator_notes_editorial_signals_")
+FREEFORM_NOTE_RE = re.compile(r"[A-Za-z]+\.md")
+CYCLE_YM_SUFFIX_RE = re.compile(r"_\d{4}-\d{2}$")
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-run dependent strict checks as phase artifacts change")
+    parser.add_argument("start", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--require-fresh", action="store_true", help="Pass --require-fresh to the strict checks")
+    parser.add_argument("--benchmark-mode", default="", help="Pass --benchmark-mode to the strict checks")
+    parser.add_argument("--poll", action="store_true", help="Poll mtimes instead of using inotify")
+    parser.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds")
+    parser.add_argument("--debounce", type=float, default=0.5,
+                        help="Wait this long for a burst of writes to settle before validating")
+    parser.add_argument("--once", action="store_true", help="Exit after validating the first batch of changes")
+    return parser.parse_args()
+
+
+def is_curator_note(name: str) -> bool:
+    """Whether a workspace file name is a curator note the strict checks scan."""
+    if name.startswith(CURATOR_NOTE_OUTPUTS):
+        return False
+    if name.startswith("curator_notes_") and name.endswith(".md"):
+        return True
+    return not name.startswith("newsletter_") and FREEFORM_NOTE_RE.fullmatch(name) is not None
+
+
+def is_cycle_artifact(rel_path: str, start: str, end: str) -> bool:
+    """Whether a changed file belongs to the watched cycle. Workspace artifacts
+    are named with END (or START_to_END) or, for curator notes, the cycle's
+    YYYY-MM (undated curator notes such as Jan.md always count); the output
+    newsletter is output/YYYY-MM_<month>_newsletter.md."""
+    folder, _, name = rel_path.partition("/")
+    cycle_ym = end[:7]
+    if folder == "output":
+        return name.startswith(f"{cycle_ym}_") and name.endswith("_newsletter.md")
+    if folder != "workspace":
+        return False
+    stem = name.rsplit(".", 1)[0]
+    if is_curator_note(name):
+        return stem.endswith(f"_{cycle_ym}") or not CYCLE_YM_SUFFIX_RE.search(stem)
+    if not name.startswith(WORKSPACE_PREFIXES):
+        return False
+    if name.startswith("curator_notes_"):
+        return stem.endswith(f"_{cycle_ym}")
+    if "_to_" in stem:
+        return stem.endswith(f"_{start}_to_{end}")
+    return stem.endswith(f"_{end}")
+
+
+class InotifyWatcher:
+    """Close-after-write and rename-into events for the watched directories."""
+
+    def __init__(self, dirs: list[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, str] = {}
+        for directory in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+            self.dirs[wd] = directory.name
+
+    def wait(self, timeout: float | None) -> set[str]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self.dirs and name:
+                changed.add(f"{self.dirs[wd]}/{os.fsdecode(name)}")
+        return changed
+
+
+class PollingWatcher:
+    """Portable fallback: compare (mtime, size) snapshots every interval."""
+
+    def __init__(self, dirs: list[Path], interval: float) -> None:
+        self.dirs = dirs
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[str, tuple[int, int]]:
+        state = {}
+        for directory in self.dirs:
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    state[f"{directory.name}/{entry.name}"] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout: float | None) -> set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self.scan()
+            changed = {path for path, sig in current.items() if self.snapshot.get(path) != sig}
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            pause = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(pause)
+
+
+def make_watcher(dirs: list[Path], poll: bool, interval: float) -> InotifyWatcher | PollingWatcher:
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError) as exc:
+            print(f"[watch] inotify unavailable ({exc}); polling every {interval}s", file=sys.stderr)
+    return PollingWatcher(dirs, interval)
+
+
+def next_batch(watcher: InotifyWatcher | PollingWatcher, args: argparse.Namespace) -> list[str]:
+    """Block until the watched cycle's artifacts change; keep collecting until writes settle."""
+    batch: set[str] = set()
+    while not batch:
+        batch = {path for path in watcher.wait(None) if is_cycle_artifact(path, args.start, args.end)}
+    while True:
+        more = watcher.wait(args.debounce)
+        if not more:
+            return sorted(batch)
+        batch |= {path for path in more if is_cycle_artifact(path, args.start, args.end)}
+
+
+def run_strict(args: argparse.Namespace, changed: list[str]) -> int:
+    cmd = ["bash", "tools/validate_pipeline_strict.sh", args.start, args.end]
+    if args.require_fresh:
+        cmd.append("--require-fresh")
+    if args.benchmark_mode:
+        cmd += ["--benchmark-mode", args.benchmark_mode]
+    for path in changed:
+        cmd += ["--changed", path]
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=False)
+    stamp = time.strftime("%H:%M:%S")
+    print(f"[{stamp}] changed: {', '.join(changed)}")
+    for line in (proc.stdout + proc.stderr).splitlines():
+        print(f"  {line}")
+    print("", flush=True)
+    return proc.returncode
+
+
+def main() -> int:
+    args = parse_args()
+    dirs = [ROOT / name for name in WATCH_DIRS]
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+    watcher = make_watcher(dirs, args.poll, args.interval)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    watched = ", ".join(f"{name}/" for name in WATCH_DIRS)
+    print(f"Watching {watched} for {args.start} -> {args.end} ({mode}); Ctrl-C to stop", flush=True)
+    try:
+        while True:
+            code = run_strict(args, next_batch(watcher, args))
+            if args.once:
+                return code
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
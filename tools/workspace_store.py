@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Content-addressed, compressed archive for workspace artifacts.
+
+Each archived file is stored once as workspace/archived/objects/<aa>/<sha256>.gz
+(gzip; zstd is not in the standard library) and recorded in a per-cycle
+manifest, workspace/archived/manifests/<cycle>.json, mapping the original
+path to its object for every archive run. Re-archiving identical content
+only adds a manifest entry, so archive size grows with unique content
+rather than with run count.
+
+Usage:
+  python3 tools/workspace_store.py put --cycle CYCLE [--run RUN] [--remove] FILE [FILE ...]
+  python3 tools/workspace_store.py restore --cycle CYCLE [--run RUN] [--dest DIR] [--force] [NAME ...]
+  python3 tools/workspace_store.py list [--cycle CYCLE]
+  python3 tools/workspace_store.py cat --cycle CYCLE NAME [--run RUN]
+  python3 tools/workspace_store.py stats
+  python3 tools/workspace_store.py gc
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+ARCHIVE_DIR = ROOT / "workspace" / "archived"
+OBJECTS_DIR = ARCHIVE_DIR / "objects"
+MANIFESTS_DIR = ARCHIVE_DIR / "manifests"
+RESTORE_DIR = ARCHIVE_DIR / "restored"
+
+
+def _utc_now() -> str:
+    return dt.datetime.now(tz=dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _run_key(entry: dict[str, Any]) -> tuple[str, int]:
+    """Archive order of a run: timestamp, then the per-manifest sequence number
+    (timestamps have one-second resolution; runs recorded before seq existed sort first)."""
+    return entry["archived_at_utc"], entry.get("seq", -1)
+
+
+def _rel(path: Path) -> str:
+    resolved = path.resolve()
+    try:
+        return resolved.relative_to(ROOT).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+class WorkspaceStore:
+    """Object store plus per-cycle manifests under workspace/archived/."""
+
+    def __init__(self, archive_dir: Path = ARCHIVE_DIR) -> None:
+        self.objects = archive_dir / "objects"
+        self.manifests = archive_dir / "manifests"
+
+    def object_path(self, sha: str) -> Path:
+        return self.objects / sha[:2] / f"{sha}.gz"
+
+    def manifest_path(self, cycle: str) -> Path:
+        return self.manifests / f"{cycle}.json"
+
+    def load_manifest(self, cycle: str) -> dict[str, Any]:
+        path = self.manifest_path(cycle)
+        if not path.exists():
+            return {"cycle": cycle, "runs": {}}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def save_manifest(self, manifest: dict[str, Any]) -> None:
+        _atomic_write(
+            self.manifest_path(manifest["cycle"]),
+            (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8"),
+        )
+
+    def put_bytes(self, data: bytes) -> tuple[str, bool]:
+        """Store content once; return (sha256, newly_stored)."""
+        sha = hashlib.sha256(data).hexdigest()
+        path = self.object_path(sha)
+        if path.exists():
+            return sha, False
+        # mtime=0 keeps objects byte-identical across runs.
+        _atomic_write(path, gzip.compress(data, compresslevel=6, mtime=0))
+        return sha, True
+
+    def get_bytes(self, sha: str) -> bytes:
+        path = self.object_path(sha)
+        if not path.exists():
+            raise SystemExit(f"Object not found: {sha}")
+        return gzip.decompress(path.read_bytes())
+
+    def put(self, files: list[Path], cycle: str, run: str, remove: bool = False) -> dict[str, int]:
+        manifest = self.load_manifest(cycle)
+        entry = manifest["runs"].get(run)
+        if entry is None:
+            seq = max((r.get("seq", -1) for r in manifest["runs"].values()), default=-1) + 1
+            entry = manifest["runs"][run] = {"archived_at_utc": _utc_now(), "seq": seq, "files": {}}
+        stats = {"files": 0, "new_objects": 0, "deduplicated": 0, "bytes": 0}
+        for path in files:
+            data = path.read_bytes()
+            sha, new = self.put_bytes(data)
+            entry["files"][_rel(path)] = {"sha256": sha, "size": len(data)}
+            stats["files"] += 1
+            stats["bytes"] += len(data)
+            stats["new_objects" if new else "deduplicated"] += 1
+        self.save_manifest(manifest)
+        if remove:
+            for path in files:
+                path.unlink()
+        return stats
+
+    def resolve(self, cycle: str, run: str | None) -> tuple[str, dict[str, Any]]:
+        manifest = self.load_manifest(cycle)
+        if not manifest["runs"]:
+            raise SystemExit(f"No archive manifest for cycle: {cycle}")
+        if run is None:
+            run = max(manifest["runs"], key=lambda r: _run_key(manifest["runs"][r]))
+        if run not in manifest["runs"]:
+            raise SystemExit(f"Run '{run}' not found in cycle {cycle} (have: {', '.join(sorted(manifest['runs']))})")
+        return run, manifest["runs"][run]["files"]
+
+    def restore(
+        self,
+        cycle: str,
+        run: str | None,
+        dest: Path | None,
+        names: list[str],
+        force: bool = False,
+    ) -> list[Path]:
+        run, files = self.resolve(cycle, run)
+        wanted = {n: files[n] for n in files if not names or n in names or Path(n).name in names}
+        if names and not wanted:
+            raise SystemExit(f"None of {names} archived in {cycle}/{run}")
+        target_root = dest or RESTORE_DIR / cycle / run
+        written = []
+        for name, info in sorted(wanted.items()):
+            target = target_root / name
+            if target.exists() and not force:
+                raise SystemExit(f"Refusing to overwrite {target} (use --force)")
+            _atomic_write(target, self.get_bytes(info["sha256"]))
+            written.append(target)
+        return written
+
+    def referenced(self) -> set[str]:
+        shas: set[str] = set()
+        for path in self.manifests.glob("*.json"):
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+            for run in manifest["runs"].values():
+                shas.update(info["sha256"] for info in run["files"].values())
+        return shas
+
+    def stats(self) -> dict[str, int]:
+        objects = list(self.objects.glob("*/*.gz"))
+        logical = 0
+        entries = 0
+        for path in self.manifests.glob("*.json"):
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+            for run in manifest["runs"].values():
+                entries += len(run["files"])
+                logical += sum(info["size"] for info in run["files"].values())
+        return {
+            "cycles": len(list(self.manifests.glob("*.json"))),
+            "entries": entries,
+            "objects": len(objects),
+            "logical_bytes": logical,
+            "stored_bytes": sum(p.stat().st_size for p in objects),
+        }
+
+    def gc(self) -> int:
+        keep = self.referenced()
+        removed = 0
+        for path in self.objects.glob("*/*.gz"):
+            if path.name[:-3] not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Content-addressed workspace archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    put = sub.add_parser("put", help="Archive files into a cycle manifest")
+    put.add_argument("--cycle", required=True)
+    put.add_argument("--run", default="", help="Run label (default: UTC timestamp)")
+    put.add_argument("--remove", action="store_true", help="Delete the originals after archiving")
+    put.add_argument("files", nargs="+", type=Path)
+
+    restore = sub.add_parser("restore", help="Restore a cycle run's files")
+    restore.add_argument("--cycle", required=True)
+    restore.add_argument("--run", help="Run label (default: latest)")
+    restore.add_argument("--dest", type=Path, help="Destination root (default: workspace/archived/restored/<cycle>/<run>)")
+    restore.add_argument("--force", action="store_true", help="Overwrite existing files")
+    restore.add_argument("names", nargs="*", help="Archived paths or basenames (default: all)")
+
+    listing = sub.add_parser("list", help="List cycles, runs and files")
+    listing.add_argument("--cycle")
+
+    cat = sub.add_parser("cat", help="Print one archived file to stdout")
+    cat.add_argument("--cycle", required=True)
+    cat.add_argument("--run")
+    cat.add_argument("name")
+
+    sub.add_parser("stats", help="Show logical vs stored size")
+    sub.add_parser("gc", help="Delete objects no manifest references")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    store = WorkspaceStore()
+
+    if args.command == "put":
+        missing = [str(p) for p in args.files if not p.is_file()]
+        if missing:
+            raise SystemExit(f"Not a file: {', '.join(missing)}")
+        stats = store.put(args.files, args.cycle, args.run or _utc_now(), args.remove)
+        print("Stored: " + " ".join(f"{k}={v}" for k, v in stats.items()))
+        print(f"Manifest: {_rel(store.manifest_path(args.cycle))}")
+        return 0
+
+    if args.command == "restore":
+        for path in store.restore(args.cycle, args.run, args.dest, args.names, args.force):
+            print(f"RESTORED: {_rel(path)}")
+        return 0
+
+    if args.command == "cat":
+        _run, files = store.resolve(args.cycle, args.run)
+        matches = [n for n in files if n == args.name or Path(n).name == args.name]
+        if not matches:
+            raise SystemExit(f"'{args.name}' not archived in cycle {args.cycle}")
+        sys.stdout.buffer.write(store.get_bytes(files[matches[0]]["sha256"]))
+        return 0
+
+    if args.command == "list":
+        cycles = [args.cycle] if args.cycle else sorted(p.stem for p in store.manifests.glob("*.json"))
+        for cycle in cycles:
+            manifest = store.load_manifest(cycle)
+            print(f"{cycle}")
+            for run, entry in sorted(manifest["runs"].items(), key=lambda kv: _run_key(kv[1])):
+                print(f"  {run} ({entry['archived_at_utc']}, {len(entry['files'])} files)")
+                if args.cycle:
+                    for name, info in sorted(entry["files"].items()):
+                        print(f"    {info['sha256'][:12]} {info['size']:>9} {name}")
+        return 0
+
+    if args.command == "stats":
+        print(json.dumps(store.stats(), indent=2))
+        return 0
+
+    print(f"Removed {store.gc()} unreferenced object(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())